@@ -0,0 +1,100 @@
+"""实时改色：QTableWidget 逐个 setBackground vs LiveUpdateCoalescer 每帧合并
+
+用法：python bench_live_updates.py [行数，默认 5000] [每批更新数，默认 2000] [时长秒，默认 3]
+模拟数据源每 1 ms 推送一批随机单元格的新颜色，统计收到的更新、dataChanged 次数和视口实际重绘次数。
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+from color_model import COLOR_COLUMN, ColorColumns, ColorTableModel, make_rows
+from live_updates import LiveUpdateCoalescer
+from main import create_table_view
+
+
+class PaintCounter(QObject):
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.count = 0
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.count += 1
+        return False
+
+
+def run(app, view, push, duration):
+    """每 1 ms 调一次 push()，持续 duration 秒；返回 (push 次数, 视口重绘次数, 耗时)"""
+    view.resize(400, 600)
+    view.show()
+    app.processEvents()
+    painter = PaintCounter(view.viewport())
+    ticks = 0
+    timer = QTimer()
+    timer.setInterval(1)
+
+    def tick():
+        nonlocal ticks
+        push()
+        ticks += 1
+
+    timer.timeout.connect(tick)
+    start = time.perf_counter()
+    timer.start()
+    while time.perf_counter() - start < duration:
+        app.processEvents()
+    timer.stop()
+    app.processEvents()
+    return ticks, painter.count, time.perf_counter() - start
+
+
+def main(row_count, batch, duration):
+    app = QApplication(sys.argv[:1])
+    rng = np.random.default_rng(0)
+    rows = make_rows(row_count)
+
+    # 1. QTableWidget：与 3.QTableWidget.py 相同的 item 写法，每个更新一次 setBackground
+    table = QTableWidget(row_count, 3)
+    for i, (name, code) in enumerate(rows):
+        table.setItem(i, 0, QTableWidgetItem(name))
+        table.setItem(i, 1, QTableWidgetItem(code))
+        table.setItem(i, 2, QTableWidgetItem())
+
+    def push_widget():
+        for row, rgb in zip(rng.integers(0, row_count, batch).tolist(),
+                            rng.integers(0, 0xFFFFFF, batch).tolist()):
+            table.item(row, COLOR_COLUMN).setBackground(QColor(rgb))
+
+    ticks, paints, elapsed = run(app, table, push_widget, duration)
+    print(f"QTableWidget : {ticks * batch:>10,} updates  {ticks * batch:>10,} item changes  "
+          f"{paints:>5} paints  ({ticks / elapsed:.0f} batches/s)")
+    table.close()
+
+    # 2. ColorTableModel + LiveUpdateCoalescer
+    model = ColorTableModel(ColorColumns.from_pairs(rows))
+    view = create_table_view(model)
+    live = LiveUpdateCoalescer(model)
+
+    def push_model():
+        live.set_colors(rng.integers(0, row_count, batch), rng.integers(0, 0xFFFFFF, batch))
+
+    ticks, paints, elapsed = run(app, view, push_model, duration)
+    live.flush()
+    stats = live.stats
+    print(f"Coalescer    : {stats.updates:>10,} updates  {stats.signals:>10,} dataChanged   "
+          f"{paints:>5} paints  ({ticks / elapsed:.0f} batches/s)")
+    print(f"               {stats}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+         float(sys.argv[3]) if len(sys.argv) > 3 else 3)
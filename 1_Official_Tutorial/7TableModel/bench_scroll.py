@@ -0,0 +1,55 @@
+"""滚动帧时间：Color 列走 BackgroundRole（QBrush + 样式背景）vs SwatchDelegate（打包 RGB + QPixmapCache）
+
+用法：python bench_scroll.py [行数，默认 1000000] [滚动帧数，默认 300]
+每帧跳到新位置并同步重绘视口，统计每帧耗时（平均 / p95 / 最大）与 16.7 ms 帧预算对比；
+“color only” 行隐藏文字列，只看 Color 列本身的绘制开销。
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from color_model import COLOR_COLUMN, ColorColumns, ColorTableModel, make_rows
+from main import create_table_view
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def scroll_frames(app, view, frames):
+    view.resize(400, 600)
+    view.show()
+    app.processEvents()
+    bar = view.verticalScrollBar()
+    step = max(bar.pageStep(), 1)
+    times = []
+    for i in range(frames):
+        start = time.perf_counter()
+        bar.setValue((i * step * 997) % max(bar.maximum(), 1))  # 跳到不同位置，颜色组合各不相同
+        view.viewport().repaint()
+        times.append((time.perf_counter() - start) * 1000)
+    view.hide()
+    return sorted(times)
+
+
+def main(row_count, frames):
+    app = QApplication(sys.argv[:1])
+    model = ColorTableModel(ColorColumns.from_pairs(make_rows(row_count)))
+    for color_only in (False, True):
+        for label, swatches in (("BackgroundRole", False), ("SwatchDelegate", True)):
+            view = create_table_view(model, swatches=swatches)
+            for column in range(model.columnCount()):
+                view.setColumnHidden(column, color_only and column != COLOR_COLUMN)
+            times = scroll_frames(app, view, frames)
+            mean = sum(times) / len(times)
+            p95 = times[int(len(times) * 0.95) - 1]
+            label += " (color only)" if color_only else ""
+            print(f"{label:<28}: mean {mean:6.2f} ms  p95 {p95:6.2f} ms  max {times[-1]:6.2f} ms  "
+                  f"(budget {FRAME_BUDGET_MS:.1f} ms, over: {sum(t > FRAME_BUDGET_MS for t in times)})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 300)
@@ -0,0 +1,93 @@
+"""QTableWidget（每格一个 QTableWidgetItem）与 ColorTableModel（列式数组）的构建时间 / 内存对比
+
+用法：python benchmark.py [最大行数，默认 1000000]
+每个用例在独立子进程中运行，保证 RSS 互不影响。
+"""
+import os
+import subprocess
+import sys
+import time
+
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+from color_model import ColorColumns, ColorTableModel, make_rows
+from main import create_table_view
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from bench_memory import current_rss  # noqa: E402
+
+
+def get_rgb_from_hex(code):
+    # 与 3.QTableWidget.py 相同
+    code_hex = code.replace("#", "")
+    rgb = tuple(int(code_hex[i:i + 2], 16) for i in (0, 2, 4))
+    return QColor.fromRgb(rgb[0], rgb[1], rgb[2])
+
+
+def build_widget(rows):
+    """原 3.QTableWidget.py 的写法"""
+    table = QTableWidget()
+    table.setRowCount(len(rows))
+    table.setColumnCount(3)
+    table.setHorizontalHeaderLabels(["Name", "Hex Code", "Color"])
+    for i, (name, code) in enumerate(rows):
+        item_name = QTableWidgetItem(name)
+        item_code = QTableWidgetItem(code)
+        item_color = QTableWidgetItem()
+        item_color.setBackground(get_rgb_from_hex(code))
+        table.setItem(i, 0, item_name)
+        table.setItem(i, 1, item_code)
+        table.setItem(i, 2, item_color)
+    return table
+
+
+def build_model(rows):
+    model = ColorTableModel(ColorColumns.from_pairs(rows))
+    view = create_table_view(model)
+    view.model_ref = model  # 保持引用
+    return view
+
+
+BUILDERS = {"widget": build_widget, "model": build_model}
+
+
+def run_case(mode, count):
+    """子进程内执行：只统计“构建”部分（测试数据的生成不计入）"""
+    app = QApplication.instance() or QApplication([])
+    rows = make_rows(count)
+    rss_before = current_rss()
+    start = time.perf_counter()
+    view = BUILDERS[mode](rows)
+    view.resize(330, 300)
+    view.show()
+    app.processEvents()  # 包含首帧布局/绘制
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.6f} {current_rss() - rss_before}")
+
+
+def main(max_rows):
+    print(f"{'rows':>10} {'mode':>8} {'build(s)':>10} {'RSS(MB)':>10} {'B/row':>8}")
+    count = 1000
+    while count <= max_rows:
+        for mode in BUILDERS:
+            env = dict(os.environ)
+            env.setdefault("QT_QPA_PLATFORM", "offscreen")
+            out = subprocess.run([sys.executable, __file__, "--case", mode, str(count)],
+                                 capture_output=True, text=True, env=env,
+                                 cwd=os.path.dirname(os.path.abspath(__file__)))
+            if out.returncode != 0:
+                print(f"{count:>10} {mode:>8} failed: {out.stderr.strip()[-200:]}")
+                continue
+            elapsed, rss = out.stdout.split()[-2:]
+            rss = int(rss)
+            print(f"{count:>10} {mode:>8} {float(elapsed):>10.3f} "
+                  f"{rss / 2 ** 20:>10.1f} {rss // count:>8}")
+        count *= 10
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--case":
+        run_case(sys.argv[2], int(sys.argv[3]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
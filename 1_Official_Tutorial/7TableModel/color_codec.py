@@ -0,0 +1,86 @@
+"""颜色解码：整列 hex 一次性向量化解码为打包 RGB，并缓存 QColor/QBrush
+
+替代 3.QTableWidget.py 中的 get_rgb_from_hex（每格一次 replace + 3 次 int(...,16) + 新建 QColor）。
+"""
+from functools import lru_cache
+
+import numpy as np
+from PySide6.QtGui import QBrush, QColor
+
+# ASCII -> 半字节 的查找表，非法字符为 0xFF
+_HEX_LUT = np.full(256, 0xFF, dtype=np.uint8)
+for _value, _char in enumerate(b"0123456789abcdef"):
+    _HEX_LUT[_char] = _value
+    _HEX_LUT[ord(chr(_char).upper())] = _value
+# 6 个半字节的位权：RRGGBB -> 20, 16, 12, 8, 4, 0
+_NIBBLE_SHIFTS = np.arange(20, -1, -4, dtype=np.uint32)
+
+
+def _hex_digits(codes):
+    """把整列 code 拼成一块 (n, 6) 的 ASCII 数组；统一为 '#RRGGBB' 时走零拷贝快速路径"""
+    count = len(codes)
+    try:
+        raw = "".join(codes).encode("ascii")
+    except UnicodeEncodeError as e:
+        raise ValueError(f"非法颜色代码：{e.object[e.start:e.end]!r}") from None
+    table = np.frombuffer(raw, dtype=np.uint8)
+    # 只看总长度不够：['#123456#123456', ''] 拼起来也是 14 字节，必须每个 code 都恰好 7 个字符
+    lengths = np.fromiter(map(len, codes), dtype=np.int64, count=count)
+    if table.size == 7 * count and (lengths == 7).all():
+        table = table.reshape(count, 7)
+        if (table[:, 0] == ord("#")).all():
+            return table[:, 1:]
+    # 慢路径：格式不统一（有的不带 '#'），逐个规整
+    digits = []
+    for code in codes:
+        code_hex = code.replace("#", "")
+        if len(code_hex) != 6:
+            raise ValueError(f"非法颜色代码：{code!r}")
+        digits.append(code_hex)
+    return np.frombuffer("".join(digits).encode("ascii"), dtype=np.uint8).reshape(count, 6)
+
+
+def decode_hex_column(codes):
+    """['#RRGGBB', ...] -> uint32 数组（0xRRGGBB），一次向量化完成"""
+    if not len(codes):
+        return np.zeros(0, dtype=np.uint32)
+    nibbles = _HEX_LUT[_hex_digits(codes)]
+    bad = (nibbles == 0xFF).any(axis=1)
+    if bad.any():
+        raise ValueError(f"非法颜色代码：{codes[int(bad.argmax())]!r}")
+    return np.bitwise_or.reduce(nibbles.astype(np.uint32) << _NIBBLE_SHIFTS, axis=1)
+
+
+def decode_hex(code):
+    """单个颜色代码 -> 0xRRGGBB"""
+    return int(decode_hex_column([code])[0])
+
+
+# -------------------------- 有界缓存：相同颜色共享同一个 QColor/QBrush --------------------------
+class ColorCache:
+    """packed RGB -> QColor / QBrush 的 LRU 缓存（调色板通常很小，命中率接近 100%）"""
+
+    def __init__(self, maxsize=4096):
+        self.color = lru_cache(maxsize=maxsize)(self._make_color)
+        self.brush = lru_cache(maxsize=maxsize)(self._make_brush)
+
+    @staticmethod
+    def _make_color(rgb):
+        return QColor(rgb)
+
+    def _make_brush(self, rgb):
+        return QBrush(self.color(rgb))
+
+    def clear(self):
+        self.color.cache_clear()
+        self.brush.cache_clear()
+
+    def info(self):
+        """(hits, misses, currsize) —— 用于观察命中率"""
+        color, brush = self.color.cache_info(), self.brush.cache_info()
+        return (color.hits + brush.hits, color.misses + brush.misses,
+                color.currsize + brush.currsize)
+
+
+# 模块级共享缓存，多个模型/委托可复用
+shared_color_cache = ColorCache()
@@ -0,0 +1,132 @@
+"""颜色表的列式存储 + QAbstractTableModel（替代 3.QTableWidget.py 中逐格创建 QTableWidgetItem 的写法）"""
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from color_codec import decode_hex_column, shared_color_cache
+
+# 与 3.QTableWidget.py 相同的示例数据
+COLORS = [("Red", "#FF0000"),
+          ("Green", "#00FF00"),
+          ("Blue", "#0000FF"),
+          ("Black", "#000000"),
+          ("White", "#FFFFFF"),
+          ("Electric Green", "#41CD52"),
+          ("Dark Blue", "#222840"),
+          ("Yellow", "#F9E56d")]
+
+NAME_COLUMN, HEX_COLUMN, COLOR_COLUMN = range(3)
+HEADERS = ("Name", "Hex Code", "Color")
+RGB_ROLE = Qt.UserRole + 1  # 打包 RGB（int），供委托直接绘制，不经过 QBrush
+# data() 是热路径：PySide6 中 Qt.DisplayRole 这种简写每次查找约 10 µs，先取成模块常量
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+
+
+def make_rows(count, palette=COLORS):
+    """循环示例调色板，生成 count 行 (name, hex) 测试数据"""
+    size = len(palette)
+    return [(f"{palette[i % size][0]} {i}", palette[i % size][1])
+            for i in range(count)]
+
+
+# -------------------------- 1. 列式存储（名称列表 + 打包 RGB 数组）--------------------------
+class ColorColumns:
+    """每一列一块连续存储：name 为 str 列表，颜色为 uint32 数组（0xRRGGBB）。
+    Hex Code 列不单独存字符串，显示时由 RGB 现算。"""
+
+    def __init__(self, capacity=1024):
+        self.names = []
+        self._rgb = np.zeros(max(capacity, 1), dtype=np.uint32)
+        self._size = 0
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """由 [(name, '#RRGGBB'), ...] 构建（颜色列整列一次解码）"""
+        columns = cls(capacity=len(pairs))
+        columns.append([name for name, _ in pairs],
+                       decode_hex_column([code for _, code in pairs]))
+        return columns
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def rgb(self):
+        """有效部分的只读视图（不拷贝）"""
+        view = self._rgb[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def rgb_at(self, row):
+        """单行颜色（data() 热路径，避免每次创建视图）"""
+        return int(self._rgb[row])
+
+    def append(self, names, rgb):
+        """追加一批行；容量不足时按 2 倍扩容，均摊 O(1)"""
+        count = len(names)
+        if count != len(rgb):
+            raise ValueError("names 与 rgb 长度不一致")
+        end = self._size + count
+        if end > len(self._rgb):
+            grown = np.zeros(max(end, len(self._rgb) * 2), dtype=np.uint32)
+            grown[:self._size] = self._rgb[:self._size]
+            self._rgb = grown
+        self._rgb[self._size:end] = rgb
+        self.names.extend(names)
+        self._size = end
+
+    def set_rgb(self, rows, rgb):
+        """按行号批量改颜色（rows 为整数数组，可重复，后写覆盖先写）"""
+        self._rgb[:self._size][rows] = rgb
+
+    def nbytes(self):
+        """列数据占用的大致字节数（不含 str 对象本身）"""
+        return self._rgb.nbytes + self.names.__sizeof__()
+
+
+# -------------------------- 2. 表格模型（data() 直接从数组取值，不创建任何 item）--------------------------
+class ColorTableModel(QAbstractTableModel):
+    def __init__(self, columns=None, parent=None, color_cache=None):
+        super().__init__(parent)
+        self._columns = columns if columns is not None else ColorColumns()
+        self._color_cache = color_cache or shared_color_cache
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == _DISPLAY_ROLE:
+            if column == NAME_COLUMN:
+                return self._columns.names[row]
+            if column == HEX_COLUMN:
+                return f"#{self._columns.rgb_at(row):06X}"
+        elif role == _BACKGROUND_ROLE and column == COLOR_COLUMN:
+            return self._color_cache.brush(self._columns.rgb_at(row))
+        elif role == RGB_ROLE and column != NAME_COLUMN:
+            return self._columns.rgb_at(row)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == _DISPLAY_ROLE and orientation == _HORIZONTAL:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_rows(self, names, rgb):
+        """批量追加：一次 beginInsertRows/endInsertRows，视图只刷新一次"""
+        if not len(names):
+            return
+        first = len(self._columns)
+        self.beginInsertRows(QModelIndex(), first, first + len(names) - 1)
+        self._columns.append(names, rgb)
+        self.endInsertRows()
@@ -0,0 +1,124 @@
+"""实时刷新：高频改色只记录脏单元格，每个显示帧合并成少量矩形 dataChanged
+
+对比 3.QTableWidget.py 的写法（每次 item.setBackground → 一次重绘请求）：
+- set_color / set_colors 只把 (行, 新颜色) 记下来，同一帧内同一单元格的中间值直接丢弃
+- 每帧（默认按屏幕刷新率，约 16 ms）统一写入列式存储，
+  脏行合并成连续区间（间隔很小的区间也合并），每个区间一个 dataChanged
+- 区间过多时退化为一个包围矩形，信号数有上限
+"""
+import numpy as np
+from PySide6.QtCore import QModelIndex, QObject, QTimer, Qt, Signal
+from PySide6.QtGui import QGuiApplication
+
+from color_model import COLOR_COLUMN, HEX_COLUMN, NAME_COLUMN
+
+_COLOR_ROLES = [Qt.DisplayRole, Qt.BackgroundRole]
+
+
+def merge_runs(rows, max_gap=0):
+    """已排序的行号 -> [(first, last), ...]；相邻区间间隔不超过 max_gap 行时合并"""
+    if not len(rows):
+        return []
+    breaks = np.flatnonzero(np.diff(rows) > max_gap + 1)
+    firsts = np.concatenate(([rows[0]], rows[breaks + 1]))
+    lasts = np.concatenate((rows[breaks], [rows[-1]]))
+    return list(zip(firsts.tolist(), lasts.tolist()))
+
+
+def frame_interval_ms():
+    """主屏幕一帧的毫秒数（取不到时按 60 Hz）"""
+    screen = QGuiApplication.primaryScreen()
+    rate = screen.refreshRate() if screen is not None else 0
+    return max(int(1000 / rate), 1) if rate > 0 else 16
+
+
+class LiveUpdateStats:
+    """累计统计：收到的更新数 vs 实际发出的刷新"""
+
+    def __init__(self):
+        self.updates = 0        # set_color / set_name 收到的单元格更新
+        self.dropped = 0        # 同一帧内被后续值覆盖、从未显示的中间值
+        self.frames = 0         # 发生过刷新的帧数
+        self.signals = 0        # 发出的 dataChanged 次数（= 视图的重绘请求数）
+
+    def __repr__(self):
+        return (f"LiveUpdateStats(updates={self.updates}, dropped={self.dropped}, "
+                f"frames={self.frames}, signals={self.signals})")
+
+
+class LiveUpdateCoalescer(QObject):
+    flushed = Signal(int)  # 本帧写入的单元格数
+
+    def __init__(self, model, interval_ms=None, max_gap=4, max_ranges=64, parent=None):
+        super().__init__(parent)
+        self._model = model
+        self._max_gap = max_gap
+        self._max_ranges = max_ranges
+        self._rows = []   # 待写入的颜色更新（标量与数组混合，flush 时一次拼接）
+        self._rgb = []
+        self._names = {}  # 行 -> 新名称（dict 天然只保留最后一次）
+        self.stats = LiveUpdateStats()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms if interval_ms is not None else frame_interval_ms())
+        self._timer.timeout.connect(self.flush)
+
+    def set_color(self, row, rgb):
+        self._rows.append(row)
+        self._rgb.append(rgb)
+        self.stats.updates += 1
+        self._schedule()
+
+    def set_colors(self, rows, rgb):
+        """批量更新（rows / rgb 为等长数组）"""
+        rows = np.asarray(rows, dtype=np.int64)
+        self._rows.append(rows)
+        self._rgb.append(np.asarray(rgb, dtype=np.uint32))
+        self.stats.updates += len(rows)
+        self._schedule()
+
+    def set_name(self, row, name):
+        self._names[row] = name
+        self.stats.updates += 1
+        self._schedule()
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """写入本帧累积的更新并发出合并后的 dataChanged（也可手动调用）"""
+        self._timer.stop()
+        columns = self._model.columns
+        applied = 0
+        if self._rows:
+            rows = np.concatenate([np.atleast_1d(r) for r in self._rows]).astype(np.int64)
+            rgb = np.concatenate([np.atleast_1d(c) for c in self._rgb]).astype(np.uint32)
+            self._rows, self._rgb = [], []
+            # 每行只保留最后一次写入：倒序后取首次出现
+            unique, last = np.unique(rows[::-1], return_index=True)
+            columns.set_rgb(unique, rgb[::-1][last])
+            self.stats.dropped += len(rows) - len(unique)
+            self._emit_ranges(unique, HEX_COLUMN, COLOR_COLUMN, _COLOR_ROLES)
+            applied += len(unique)
+        if self._names:
+            rows = np.fromiter(self._names, dtype=np.int64, count=len(self._names))
+            for row, name in self._names.items():
+                columns.names[row] = name
+            self._names = {}
+            rows.sort()
+            self._emit_ranges(rows, NAME_COLUMN, NAME_COLUMN, [Qt.DisplayRole])
+            applied += len(rows)
+        if applied:
+            self.stats.frames += 1
+            self.flushed.emit(applied)
+
+    def _emit_ranges(self, rows, first_column, last_column, roles):
+        ranges = merge_runs(rows, self._max_gap)
+        if len(ranges) > self._max_ranges:
+            ranges = [(ranges[0][0], ranges[-1][1])]  # 包围矩形：一次信号
+        model = self._model
+        for first, last in ranges:
+            model.dataChanged.emit(model.index(first, first_column, QModelIndex()),
+                                   model.index(last, last_column, QModelIndex()), roles)
+        self.stats.signals += len(ranges)
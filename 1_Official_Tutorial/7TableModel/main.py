@@ -0,0 +1,79 @@
+import sys
+
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QHeaderView, QLabel, QProgressBar,
+                               QPushButton, QTableView, QVBoxLayout, QWidget)
+
+from color_model import COLOR_COLUMN, COLORS, ColorColumns, ColorTableModel, make_rows
+from sort_proxy import PresortedProxyModel
+from stream_loader import StreamingLoader
+from swatch_delegate import SwatchDelegate
+
+
+def create_table_view(model, sortable=False, swatches=True):
+    """QTableView + 固定行高（行数很大时避免逐行计算高度）；
+    sortable=True 时套一层 PresortedProxyModel，点击表头排序；
+    swatches=True 时 Color 列用 SwatchDelegate 绘制，否则走 BackgroundRole"""
+    view = QTableView()
+    if swatches:
+        view.setItemDelegateForColumn(COLOR_COLUMN, SwatchDelegate(view))
+    if sortable:
+        proxy = PresortedProxyModel(view)
+        proxy.setSourceModel(model)
+        view.setModel(proxy)
+        view.setSortingEnabled(True)
+    else:
+        view.setModel(model)
+    header = view.verticalHeader()
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    header.setDefaultSectionSize(view.fontMetrics().height() + 6)
+    return view
+
+
+def create_loader_window(path):
+    """表格 + 进度条 + 取消按钮：后台流式导入 CSV / NDJSON 文件"""
+    window = QWidget()
+    window.setWindowTitle(path)
+    model = ColorTableModel(parent=window)
+    table = create_table_view(model)
+    progress_bar = QProgressBar()
+    status_label = QLabel("导入中...")
+    cancel_btn = QPushButton("取消")
+
+    bottom = QHBoxLayout()
+    bottom.addWidget(progress_bar)
+    bottom.addWidget(cancel_btn)
+    layout = QVBoxLayout(window)
+    layout.addWidget(table)
+    layout.addWidget(status_label)
+    layout.addLayout(bottom)
+
+    loader = StreamingLoader(path, model, parent=window)
+    loader.progress_updated.connect(progress_bar.setValue)
+    loader.task_finished.connect(
+        lambda result: status_label.setText(f"{result}：{loader.rows_loaded:,} 行"))
+    loader.task_finished.connect(lambda: cancel_btn.setEnabled(False))
+    cancel_btn.clicked.connect(loader.requestInterruption)
+    window.loader = loader
+    loader.start()
+    return window
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    # python main.py 1000000  → 用 100 万行测试；不传参数时与 3.QTableWidget.py 数据相同
+    # python main.py colors.csv / colors.ndjson  → 后台流式导入文件
+    if len(sys.argv) > 1 and not sys.argv[1].isdigit():
+        window = create_loader_window(sys.argv[1])
+        window.resize(400, 500)
+        window.show()
+        code = app.exec()
+        window.loader.requestInterruption()
+        window.loader.wait()
+        sys.exit(code)
+
+    rows = make_rows(int(sys.argv[1])) if len(sys.argv) > 1 else COLORS
+    model = ColorTableModel(ColorColumns.from_pairs(rows))
+    table = create_table_view(model, sortable=True)
+    table.resize(330, 300)
+    table.show()
+    sys.exit(app.exec())
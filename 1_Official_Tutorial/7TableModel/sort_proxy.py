@@ -0,0 +1,271 @@
+"""预计算排序键的排序/过滤代理（替代 QSortFilterProxyModel 逐次回调 Python lessThan 的排序）
+
+- 每列的排序键只计算一次：Hex Code → 打包 RGB，Color → 色相（numpy 数组）；
+  Name → casefold 字符串，交给 C 层 sorted 排序，不回调 Python 比较函数
+- 排序 = 一次 argsort 得到置换数组 order（代理行 → 源行）和逆置换 inverse（源行 → 代理行）；
+  降序 = 对取反的键做稳定排序，与 QSortFilterProxyModel 一样，键相同的行保持源顺序
+- 源模型在末尾追加行时，只对新行排序，再用二分查找并入已有顺序，不从头重排
+- 源模型删除 / 移动 / 中间插入行、布局变化时：在 *AboutToBe* 信号里为每个持久索引记下对应的源持久索引
+  （源模型在变化中负责更新它），变化后全量重排，持久索引按源索引重新定位，外面包一对 layoutChanged
+"""
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+from PySide6.QtCore import QAbstractProxyModel, QModelIndex, QPersistentModelIndex, Qt
+
+from color_model import COLOR_COLUMN, HEX_COLUMN, NAME_COLUMN
+
+
+def hue_keys(rgb):
+    """打包 RGB -> 色相（0-360，灰色为 -1，与 QColor.hsvHue 一致），向量化计算"""
+    rgb = np.asarray(rgb, dtype=np.uint32)
+    r = ((rgb >> 16) & 0xFF).astype(np.float32)
+    g = ((rgb >> 8) & 0xFF).astype(np.float32)
+    b = (rgb & 0xFF).astype(np.float32)
+    high = np.maximum(np.maximum(r, g), b)
+    delta = high - np.minimum(np.minimum(r, g), b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hue = np.where(high == r, (g - b) / delta,
+                       np.where(high == g, 2 + (b - r) / delta, 4 + (r - g) / delta))
+    hue = (hue * 60) % 360
+    return np.where(delta == 0, -1, hue).astype(np.float32)
+
+
+def numeric_keys(columns, column, start=0, stop=None):
+    """数值列 [start, stop) 行的排序键；Name 列返回 None（按字符串单独处理）"""
+    if column == HEX_COLUMN:
+        return columns.rgb[start:stop].astype(np.int64)
+    if column == COLOR_COLUMN:
+        return hue_keys(columns.rgb[start:stop])
+    return None
+
+
+class PresortedProxyModel(QAbstractProxyModel):
+    def __init__(self, parent=None, max_insert_signals=16):
+        super().__init__(parent)
+        self._max_insert_signals = max_insert_signals
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._filter = None              # filter(columns, start, stop) -> bool 数组
+        self._keys = None                # 当前排序列的键（按源行）
+        self._order = np.zeros(0, dtype=np.int64)
+        self._inverse = np.zeros(0, dtype=np.int64)
+        self._saved = None               # 源模型结构变化期间：[(代理持久索引, 源持久索引), ...]
+
+    # -------------------------- 源模型 --------------------------
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            for signal, slot in self._source_connections(old):
+                signal.disconnect(slot)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        for signal, slot in self._source_connections(model):
+            signal.connect(slot)
+        self._recompute()
+        self.endResetModel()
+
+    def _source_connections(self, model):
+        return ((model.rowsAboutToBeInserted, self._on_rows_about_to_be_inserted),
+                (model.rowsInserted, self._on_rows_inserted),
+                (model.dataChanged, self._on_data_changed),
+                (model.modelAboutToBeReset, self.beginResetModel),
+                (model.modelReset, self._on_model_reset),
+                (model.layoutAboutToBeChanged, self._on_source_about_to_change),
+                (model.layoutChanged, self._on_source_changed),
+                (model.rowsAboutToBeRemoved, self._on_source_about_to_change),
+                (model.rowsRemoved, self._on_source_changed),
+                (model.rowsAboutToBeMoved, self._on_source_about_to_change),
+                (model.rowsMoved, self._on_source_changed))
+
+    def _columns(self):
+        return self.sourceModel().columns
+
+    # -------------------------- 结构 --------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._order)
+                                    and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(int(self._order[proxy_index.row()]), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = int(self._inverse[source_index.row()])
+        return self.index(row, source_index.column()) if row >= 0 else QModelIndex()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        return super().headerData(section, orientation, role)
+
+    # -------------------------- 排序 / 过滤 --------------------------
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column, self._sort_order = column, order
+        self._rebuild()
+
+    def set_filter(self, predicate=None):
+        """predicate(columns, start, stop) -> bool 数组（向量化过滤）；None 取消过滤"""
+        self._filter = predicate
+        self._rebuild()
+
+    def _rebuild(self, *args):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        source_rows = [int(self._order[index.row()]) for index in persistent]
+        self._recompute()
+        self.changePersistentIndexList(
+            persistent, [self.index(int(self._inverse[row]), index.column())
+                         if row < len(self._inverse) and self._inverse[row] >= 0 else QModelIndex()
+                         for row, index in zip(source_rows, persistent)])
+        self.layoutChanged.emit()
+
+    # -------------------------- 源模型结构变化：按源持久索引重新定位 --------------------------
+    def _on_source_about_to_change(self, *args):
+        self.layoutAboutToBeChanged.emit()
+        self._saved = [(index, QPersistentModelIndex(self.mapToSource(index)))
+                       for index in self.persistentIndexList()]
+
+    def _on_source_changed(self, *args):
+        saved, self._saved = self._saved or [], None
+        self._recompute()
+        model = self.sourceModel()
+        self.changePersistentIndexList(
+            [proxy for proxy, _ in saved],
+            [self.mapFromSource(model.index(source.row(), source.column()))
+             if source.isValid() else QModelIndex() for _, source in saved])
+        self.layoutChanged.emit()
+
+    def _on_model_reset(self):
+        self._recompute()
+        self.endResetModel()
+
+    def _recompute(self):
+        """全量：计算排序键并稳定排序"""
+        columns = self._columns()
+        total = len(columns)
+        rows = self._visible_rows(0, total)
+        self._keys = numeric_keys(columns, self._sort_column)
+        if self._sort_column == NAME_COLUMN:
+            names = columns.names
+            order = sorted(rows.tolist(), key=lambda row: names[row].casefold(), reverse=self._descending)
+            order = np.array(order, dtype=np.int64)
+        elif self._keys is not None:
+            order = rows[np.argsort(self._sort_keys()[rows], kind="stable")]
+        else:
+            order = rows
+        self._order = order
+        self._update_inverse(total)
+
+    @property
+    def _descending(self):
+        return self._sort_column >= 0 and self._sort_order == Qt.DescendingOrder
+
+    def _sort_keys(self):
+        """数值列按它升序排就是目标顺序的键：降序时取反（稳定排序下并列行仍按源顺序）"""
+        return -self._keys if self._descending else self._keys
+
+    def _visible_rows(self, start, stop):
+        rows = np.arange(start, stop, dtype=np.int64)
+        if self._filter is not None:
+            rows = rows[np.asarray(self._filter(self._columns(), start, stop), dtype=bool)]
+        return rows
+
+    def _update_inverse(self, total):
+        self._inverse = np.full(total, -1, dtype=np.int64)
+        self._inverse[self._order] = np.arange(len(self._order), dtype=np.int64)
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        """源数据变化只转发刷新，不重新排序（相当于 dynamicSortFilter=False，需要时再调用 sort）"""
+        if self._keys is not None and top_left.column() <= self._sort_column <= bottom_right.column():
+            first, last = top_left.row(), bottom_right.row()
+            self._keys[first:last + 1] = numeric_keys(self._columns(), self._sort_column,
+                                                      first, last + 1)
+        rows = self._inverse[top_left.row():bottom_right.row() + 1]
+        rows = rows[rows >= 0]
+        if len(rows):
+            self.dataChanged.emit(self.index(int(rows.min()), top_left.column()),
+                                  self.index(int(rows.max()), bottom_right.column()), roles)
+
+    # -------------------------- 增量：源模型末尾追加 --------------------------
+    def _on_rows_about_to_be_inserted(self, parent, first, last):
+        if first < len(self._inverse):
+            self._on_source_about_to_change()  # 非末尾插入：源行号整体偏移，之后全量重排
+
+    def _on_rows_inserted(self, parent, first, last):
+        columns = self._columns()
+        if self._saved is not None:
+            self._on_source_changed()
+            return
+        new_rows = self._visible_rows(first, last + 1)
+        positions, new_rows = self._insert_positions(new_rows, first)
+        if len(new_rows) == 0:
+            self._inverse = np.concatenate((self._inverse, np.full(last - first + 1, -1)))
+            return
+        # 插入位置（相对于插入前的顺序）→ 插入后的代理行号
+        final_rows = positions + np.arange(len(positions))
+        groups = np.split(final_rows, np.flatnonzero(np.diff(final_rows) != 1) + 1)
+        if len(groups) > self._max_insert_signals:
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            source_rows = [int(self._order[index.row()]) for index in persistent]
+            self._merge(positions, new_rows, len(columns))
+            self.changePersistentIndexList(
+                persistent, [self.index(int(self._inverse[row]), index.column())
+                             for row, index in zip(source_rows, persistent)])
+            self.layoutChanged.emit()
+            return
+        # 少量连续块：逐块 beginInsertRows（从前往后，每块插入后再处理下一块）
+        done = 0
+        for group in groups:
+            count = len(group)
+            self.beginInsertRows(QModelIndex(), int(group[0]), int(group[-1]))
+            self._merge(positions[done:done + count], new_rows[done:done + count],
+                        len(columns), offset=done)
+            self.endInsertRows()
+            done += count
+
+    def _insert_positions(self, new_rows, first):
+        """新行排序后在现有 order 中的插入位置（二分查找，不重排已有行）"""
+        # 新行的源行号都比已有行大：键相同时排在已有的并列行之后（与全量稳定排序一致）
+        if self._sort_column == NAME_COLUMN:
+            names = self._columns().names
+            key = lambda row: names[row].casefold()
+            new_rows = np.array(sorted(new_rows.tolist(), key=key, reverse=self._descending),
+                                dtype=np.int64)
+            if self._descending:
+                # 降序数组倒过来是升序（并列行倒序）：插到并列行之前，对应降序中的并列行之后
+                ascending = self._order[::-1]
+                positions = [len(ascending) - bisect_left(ascending, key(row), key=key)
+                             for row in new_rows.tolist()]
+            else:
+                positions = [bisect_right(self._order, key(row), key=key) for row in new_rows.tolist()]
+            positions = np.array(positions, dtype=np.int64)
+        elif self._sort_column >= 0:
+            new_keys = numeric_keys(self._columns(), self._sort_column, first)
+            self._keys = np.concatenate((self._keys, new_keys))
+            keys = self._sort_keys()
+            new_rows = new_rows[np.argsort(keys[new_rows], kind="stable")]
+            positions = np.searchsorted(keys[self._order], keys[new_rows], side="right")
+        else:
+            positions = np.full(len(new_rows), len(self._order), dtype=np.int64)
+        return positions, new_rows
+
+    def _merge(self, positions, new_rows, total, offset=0):
+        """把 new_rows 插到 order 的 positions 处（positions 相对未插入任何新行时的 order）"""
+        self._order = np.insert(self._order, positions + offset, new_rows)
+        self._update_inverse(total)
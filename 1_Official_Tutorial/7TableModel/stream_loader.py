@@ -0,0 +1,136 @@
+"""大文件流式导入：后台线程分块解析 CSV / NDJSON，主线程按块批量追加到 ColorTableModel
+
+- 文件逐块读取，每块解析成 (names, rgb数组) 后发给主线程，一块只触发一次 beginInsertRows
+- 第一块很小（默认 1000 行），首屏几乎立即出现；之后块大小翻倍直到 chunk_rows
+- 同时在途的块数有上限（信号量），主线程来不及追加时后台线程暂停读取，
+  内存只由列式存储决定，不会因为整份文本堆积在队列里而暴涨
+- requestInterruption() 取消；已导入的行保留在模型中
+
+CSV：第一行若不是颜色数据则视为表头，按 name / hex 列名取列，否则取前两列。
+NDJSON：每行一个 {"name": ..., "hex": ...} 对象或 [name, hex] 数组。
+"""
+import csv
+import io
+import json
+import os
+import threading
+
+from PySide6.QtCore import QThread, Signal, Slot
+
+from color_codec import decode_hex, decode_hex_column
+
+NAME_FIELD, HEX_FIELD = "name", "hex"
+
+
+# -------------------------- 1. 解析（纯 Python，不依赖 Qt，可单独使用）--------------------------
+def _csv_rows(text):
+    reader = csv.reader(text)
+    first = next(reader, None)
+    if first is None:
+        return
+    try:
+        decode_hex(first[1])
+        name_col, hex_col = 0, 1
+        yield first[0], first[1]
+    except (IndexError, ValueError):  # 表头
+        header = [field.strip().lower() for field in first]
+        name_col = header.index(NAME_FIELD) if NAME_FIELD in header else 0
+        hex_col = header.index(HEX_FIELD) if HEX_FIELD in header else 1
+    for record in reader:
+        if record:
+            yield record[name_col], record[hex_col]
+
+
+def _ndjson_rows(text):
+    for line in text:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if isinstance(record, dict):
+            yield record[NAME_FIELD], record[HEX_FIELD]
+        else:
+            yield record[0], record[1]
+
+
+def iter_chunks(path, chunk_rows=100_000, first_chunk_rows=1000):
+    """逐块产出 (names, rgb, 已读字节数)；格式按扩展名判断（.ndjson / .jsonl / .json 为 NDJSON）"""
+    is_json = os.path.splitext(path)[1].lower() in (".ndjson", ".jsonl", ".json")
+    with open(path, "rb") as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        rows = _ndjson_rows(text) if is_json else _csv_rows(text)
+        size = first_chunk_rows
+        names, codes = [], []
+        for name, code in rows:
+            names.append(name)
+            codes.append(code)
+            if len(names) >= size:
+                yield names, decode_hex_column(codes), raw.tell()
+                names, codes = [], []
+                size = min(size * 2, chunk_rows)
+        if names:
+            yield names, decode_hex_column(codes), raw.tell()
+
+
+def write_sample(path, count):
+    """生成测试文件（格式同样按扩展名），数据与 make_rows 相同"""
+    from color_model import make_rows
+    is_json = os.path.splitext(path)[1].lower() in (".ndjson", ".jsonl", ".json")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if is_json:
+            f.writelines(json.dumps({NAME_FIELD: name, HEX_FIELD: code}) + "\n"
+                         for name, code in make_rows(count))
+        else:
+            writer = csv.writer(f)
+            writer.writerow((NAME_FIELD, HEX_FIELD))
+            writer.writerows(make_rows(count))
+
+
+# -------------------------- 2. 后台导入线程 --------------------------
+class StreamingLoader(QThread):
+    progress_updated = Signal(int)     # 进度（0-100，按已读字节）
+    task_finished = Signal(str)        # 完成 / 取消 / 出错的说明
+    chunk_ready = Signal(object, object)  # (names, rgb) —— 内部使用，排队到主线程
+
+    def __init__(self, path, model, chunk_rows=100_000, first_chunk_rows=1000,
+                 max_pending_chunks=4, parent=None):
+        super().__init__(parent)
+        self._path = path
+        self._model = model
+        self._chunk_rows = chunk_rows
+        self._first_chunk_rows = first_chunk_rows
+        self._slots = threading.Semaphore(max_pending_chunks)
+        self.rows_loaded = 0
+        # QThread 对象本身属于主线程：从 run() 发出的信号以排队方式在主线程执行 _append_chunk
+        self.chunk_ready.connect(self._append_chunk)
+
+    def run(self):
+        try:
+            total = max(os.path.getsize(self._path), 1)
+            for names, rgb, position in iter_chunks(self._path, self._chunk_rows,
+                                                    self._first_chunk_rows):
+                if not self._acquire_slot():
+                    break
+                self.chunk_ready.emit(names, rgb)
+                self.progress_updated.emit(position * 100 // total)
+        except Exception as e:  # 任何异常都要通过 task_finished 报告，否则界面一直停在“导入中”
+            self.task_finished.emit(f"导入失败：{e!r}")
+            return
+        if self.isInterruptionRequested():
+            self.task_finished.emit("导入已取消")
+        else:
+            self.progress_updated.emit(100)
+            self.task_finished.emit("导入完成")
+
+    def _acquire_slot(self):
+        """等待在途块数低于上限；期间被取消则返回 False"""
+        while not self._slots.acquire(timeout=0.05):
+            if self.isInterruptionRequested():
+                return False
+        return not self.isInterruptionRequested()
+
+    @Slot(object, object)
+    def _append_chunk(self, names, rgb):
+        """主线程：整块一次追加"""
+        self._model.append_rows(names, rgb)
+        self.rows_loaded += len(names)
+        self._slots.release()
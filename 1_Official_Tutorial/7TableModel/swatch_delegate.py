@@ -0,0 +1,51 @@
+"""色块委托：直接按模型里的打包 RGB 绘制色块（替代 3.QTableWidget.py 的 item.setBackground）
+
+- 不取 BackgroundRole / QBrush，也不走 QStyle 的完整背景绘制流程，只读 RGB_ROLE 一个 int
+- 色块（带圆角和描边）画成一张 QPixmap，放进 QPixmapCache，键 = 颜色 + 尺寸 + 设备像素比；
+  滚动时同一颜色同一行高只画一次，之后每格只是一次 drawPixmap
+"""
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap, QPixmapCache
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+from color_model import RGB_ROLE
+
+_SELECTED = QStyle.StateFlag.State_Selected
+
+
+def swatch_pixmap(rgb, width, height, dpr=1.0, radius=3):
+    """width x height（逻辑像素）的色块，按 dpr 生成物理像素并缓存"""
+    key = f"swatch:{rgb:06x}:{width}x{height}@{dpr:g}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(round(width * dpr), round(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        color = QColor(rgb)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(color.darker(140), 1))
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(0.5, 0.5, width - 1, height - 1), radius, radius)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class SwatchDelegate(QStyledItemDelegate):
+    def __init__(self, parent=None, margin=2):
+        super().__init__(parent)
+        self._margin = margin
+
+    def paint(self, painter, option, index):
+        rgb = index.data(RGB_ROLE)
+        if rgb is None:
+            super().paint(painter, option, index)
+            return
+        if option.state & _SELECTED:
+            painter.fillRect(option.rect, option.palette.highlight())
+        rect = option.rect.adjusted(self._margin, self._margin, -self._margin, -self._margin)
+        if rect.width() > 0 and rect.height() > 0:
+            pixmap = swatch_pixmap(rgb, rect.width(), rect.height(),
+                                   painter.device().devicePixelRatioF())
+            painter.drawPixmap(rect.topLeft(), pixmap)
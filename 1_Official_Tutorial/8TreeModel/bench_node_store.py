@@ -0,0 +1,65 @@
+"""NodeStore 内存测试：构建 N 个文件节点，报告每节点字节数
+
+用法：python bench_node_store.py [文件数，默认 10000000] [每个项目文件数，默认 10]
+"""
+import os
+import sys
+import time
+
+from lazy_tree_model import _EXTENSIONS
+from name_index import NameIndex
+from node_store import NodeStore
+from type_index import TypeIndex
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from bench_memory import current_rss  # noqa: E402
+
+
+def project_chunks(file_count, files_per_project, chunk_projects=10_000):
+    """按块生成项目数据，避免先在内存里造一个巨大的 dict"""
+    project_count = file_count // files_per_project
+    for start in range(0, project_count, chunk_projects):
+        yield [(f"Project {i}",
+                [f"file_{i}_{j}.{_EXTENSIONS[j % len(_EXTENSIONS)]}"
+                 for j in range(files_per_project)])
+               for i in range(start, min(start + chunk_projects, project_count))]
+
+
+def main(file_count, files_per_project):
+    rss_before = current_rss()
+    start = time.perf_counter()
+    project_count = file_count // files_per_project
+    store = NodeStore(capacity=1 + project_count * (files_per_project + 1))
+    for chunk in project_chunks(file_count, files_per_project):
+        store.extend_projects(chunk)
+    elapsed = time.perf_counter() - start
+    rss = current_rss() - rss_before
+    print(f"nodes          : {len(store):,}")
+    print(f"build time     : {elapsed:.1f} s")
+    print(f"store size     : {store.nbytes() / 2 ** 20:.1f} MB")
+    print(f"bytes per node : {store.bytes_per_node():.1f}")
+    print(f"RSS delta      : {rss / 2 ** 20:.1f} MB ({rss / max(len(store), 1):.1f} B/node)")
+
+    start = time.perf_counter()
+    index = TypeIndex(store)
+    print(f"type index     : {time.perf_counter() - start:.2f} s (一次性)")
+    for type_name, count in index.summary():
+        start = time.perf_counter()
+        index.filter(index.find(type_name))
+        print(f"  filter {type_name:<4}: {count:>10,} files {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    start = time.perf_counter()
+    names = NameIndex(store)
+    print(f"name index     : {time.perf_counter() - start:.2f} s (一次性), "
+          f"{names.nbytes() / 2 ** 20:.1f} MB")
+    query = "file_12345_3.xls"
+    for length in range(1, len(query) + 1):  # 模拟逐键输入
+        start = time.perf_counter()
+        result = names.search(query[:length])
+        print(f"  search {query[:length]!r:<20}: {len(result):>10,} hits "
+              f"{(time.perf_counter() - start) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10)
@@ -0,0 +1,110 @@
+"""差量更新 vs 整树重建：1% 变动时的更新耗时
+
+同一批变动分别用逐区间行信号、一次 layoutChanged 应用（NodeTreeModel 里 _ROW_SIGNAL_* 常数的来源），
+最后测 compact() 回收删除的节点和旧名称。
+
+用法：python bench_tree_diff.py [项目数，默认 100000] [变动比例，默认 0.01]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from lazy_tree_model import make_projects
+from main import create_tree_view
+from node_store import NodeStore
+from node_tree_model import NodeTreeModel
+
+
+def churn(data, ratio, seed=0):
+    """按比例删除 / 新增项目、增删改文件，各占 1/3"""
+    rng = random.Random(seed)
+    keys = list(data)
+    count = max(int(len(keys) * ratio / 3), 1)
+    removed = set(rng.sample(keys, count))
+    modified = set(rng.sample([k for k in keys if k not in removed], count))
+    result = {}
+    for key, files in data.items():
+        if key in removed:
+            continue
+        if key in modified:
+            files = list(files)
+            files.pop(rng.randrange(len(files)))
+            files.insert(rng.randrange(len(files) + 1), f"new_{key}.md")
+            files[0] = f"renamed_{files[0]}"
+        result[key] = files
+    for i in range(count):
+        result[f"New project {i}"] = [f"added_{i}_{j}.py" for j in range(3)]
+    return result
+
+
+def open_view(app, data):
+    model = NodeTreeModel(NodeStore.from_projects(data))
+    view = create_tree_view(model)
+    view.resize(400, 600)
+    view.show()
+    for row in range(0, model.rowCount(), max(model.rowCount() // 1000, 1)):
+        view.expand(model.index(row, 0))  # 展开约 1000 个项目
+    view.setCurrentIndex(model.index(0, 0, model.index(0, 0)))
+    app.processEvents()
+    return model, view
+
+
+def timed_update(app, model, data, **kwargs):
+    start = time.perf_counter()
+    stats = model.update_projects(data, **kwargs)
+    model_time = time.perf_counter() - start
+    app.processEvents()
+    view_time = time.perf_counter() - start - model_time
+    return stats, model_time, view_time
+
+
+def main(project_count, ratio):
+    app = QApplication(sys.argv[:1])
+    data = make_projects(project_count)
+    new_data = churn(data, ratio)
+    for label, limit in (("row signals", 1 << 30), ("layoutChanged", 0)):
+        model, view = open_view(app, data)
+        start = time.perf_counter()
+        model.update_projects(data)  # 首次调用：建立文件列表 hash 快照
+        if limit:
+            print(f"nodes             : {len(model.store):,}")
+            print(f"hash snapshot     : {(time.perf_counter() - start) * 1000:.1f} ms (一次性)")
+            print(f"persistent indexes: {len(model.persistentIndexList())}"
+                  f" → row_signal_limit() = {model.row_signal_limit()}")
+        stats, model_time, view_time = timed_update(app, model, new_data, max_row_signals=limit)
+        expanded = sum(view.isExpanded(model.index(row, 0)) for row in range(model.rowCount()))
+        print(f"{label:<18}: model {model_time * 1000:.1f} ms + view {view_time * 1000:.1f} ms  {stats}")
+        print(f"expanded kept     : {expanded}, current = {view.currentIndex().data()}")
+
+    # 反复变动后垃圾越积越多：compact() 一次回收
+    for seed in range(1, 4):
+        model.update_projects(churn(new_data, ratio * 10, seed), compact_ratio=None)
+    store = model.store
+    before, garbage = store.nbytes(), store.garbage()
+    start = time.perf_counter()
+    model.compact()
+    model_time = time.perf_counter() - start
+    app.processEvents()
+    view_time = time.perf_counter() - start - model_time
+    print(f"compact           : model {model_time * 1000:.1f} ms + view {view_time * 1000:.1f} ms, "
+          f"garbage {garbage:.0%}, {before / 1e6:.1f} MB → {store.nbytes() / 1e6:.1f} MB, "
+          f"current = {view.currentIndex().data()}")
+
+    start = time.perf_counter()
+    rebuilt = NodeTreeModel(NodeStore.from_projects(new_data))
+    view.setModel(rebuilt)
+    model_time = time.perf_counter() - start
+    app.processEvents()
+    view_time = time.perf_counter() - start - model_time
+    print(f"full rebuild      : model {model_time * 1000:.1f} ms + view {view_time * 1000:.1f} ms  "
+          f"(expanded after: {sum(view.isExpanded(rebuilt.index(r, 0)) for r in range(50))} of first 50)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 0.01)
@@ -0,0 +1,66 @@
+"""首屏时间对比：QTreeWidget（全部 item 预先创建）vs LazyProjectTreeModel（按需加载）
+
+用法：python benchmark.py [最大项目数，默认 100000]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QTreeWidget, QTreeWidgetItem
+
+from lazy_tree_model import LazyProjectTreeModel, file_type, make_projects
+from main import create_tree_view
+
+
+def build_widget(data):
+    """原 4.QTreeWidget.py 的写法"""
+    tree = QTreeWidget()
+    tree.setColumnCount(2)
+    tree.setHeaderLabels(["Name", "Type"])
+    items = []
+    for key, values in data.items():
+        item = QTreeWidgetItem([key])
+        for value in values:
+            item.addChild(QTreeWidgetItem([value, file_type(value)]))
+        items.append(item)
+    tree.insertTopLevelItems(0, items)
+    return tree
+
+
+def build_lazy(data):
+    view = create_tree_view(LazyProjectTreeModel(data))
+    return view
+
+
+BUILDERS = {"widget": build_widget, "lazy": build_lazy}
+
+
+def first_paint(app, builder, data):
+    start = time.perf_counter()
+    view = builder(data)
+    view.resize(400, 600)
+    view.show()
+    app.processEvents()
+    view.viewport().repaint()  # 强制完成首帧绘制
+    elapsed = time.perf_counter() - start
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return elapsed
+
+
+def main(max_projects):
+    app = QApplication(sys.argv[:1])
+    print(f"{'projects':>10} " + " ".join(f"{mode + '(ms)':>12}" for mode in BUILDERS))
+    count = 1000
+    while count <= max_projects:
+        data = make_projects(count)
+        times = [first_paint(app, builder, data) * 1000 for builder in BUILDERS.values()]
+        print(f"{count:>10} " + " ".join(f"{t:>12.1f}" for t in times))
+        count *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,56 @@
+"""过滤后的两层视图（项目 → 文件），供类型过滤 / 名称搜索共用"""
+import numpy as np
+
+from node_store import ROOT
+
+
+class FilteredTree:
+    """projects[i] 的可见文件为 files[offsets[i]:offsets[i + 1]]"""
+
+    def __init__(self, projects, offsets, files):
+        self.projects = projects
+        self.offsets = offsets
+        self.files = files
+        self._sorted = np.argsort(projects, kind="stable")
+
+    @classmethod
+    def empty(cls):
+        nothing = np.zeros(0, dtype=np.int32)
+        return cls(nothing, np.zeros(1, dtype=np.int64), nothing)
+
+    @classmethod
+    def from_nodes(cls, store, nodes):
+        """由任意命中节点（升序 id）构建：命中的文件连同所在项目显示，命中的项目单独显示。
+        只在末尾追加过的树中，同一父节点下 id 顺序即行号顺序，只需按项目行号稳定排序。"""
+        parents = store.parent[nodes]
+        is_file = parents != ROOT
+        files, file_parents = nodes[is_file], parents[is_file]
+        if store.append_ordered:
+            order = np.argsort(store.row[file_parents], kind="stable")
+        else:
+            order = np.lexsort((store.row[files], store.row[file_parents]))
+        files, file_parents = files[order], file_parents[order]
+        if len(files):
+            starts = np.flatnonzero(np.concatenate(([True], file_parents[1:] != file_parents[:-1])))
+        else:
+            starts = np.zeros(0, dtype=np.int64)
+        group_projects = file_parents[starts]
+        group_counts = np.diff(np.append(starts, len(files)))
+
+        projects = np.union1d(group_projects, nodes[~is_file]).astype(np.int32)
+        counts = np.zeros(len(projects), dtype=np.int64)
+        counts[np.searchsorted(projects, group_projects)] = group_counts
+        display = np.argsort(store.row[projects], kind="stable")
+        offsets = np.concatenate(([0], np.cumsum(counts[display])))
+        return cls(projects[display], offsets, files)
+
+    def project_row(self, project):
+        """项目节点 id -> 过滤后的行号"""
+        position = np.searchsorted(self.projects, project, sorter=self._sorted)
+        return int(self._sorted[position])
+
+    def file_count(self, project_row):
+        return int(self.offsets[project_row + 1] - self.offsets[project_row])
+
+    def file(self, project_row, row):
+        return int(self.files[self.offsets[project_row] + row])
@@ -0,0 +1,118 @@
+"""按需加载的树模型（替代 4.QTreeWidget.py 中一次性创建全部 QTreeWidgetItem 的写法）
+
+- 顶层项目行：通过 canFetchMore/fetchMore 分批插入，首屏只创建一批
+- 文件子行：项目第一次展开时才插入
+"""
+from itertools import islice
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+# 与 4.QTreeWidget.py 相同的示例数据
+DATA = {"Project A": ["file_a.py", "file_a.txt", "something.xls"],
+        "Project B": ["file_b.csv", "photo.jpg"],
+        "Project C": []}
+
+HEADERS = ("Name", "Type")
+_EXTENSIONS = ("py", "txt", "xls", "csv", "jpg")
+
+
+def make_projects(count, files_per_project=5):
+    """生成 count 个项目的测试数据"""
+    return {f"Project {i}": [f"file_{i}_{j}.{_EXTENSIONS[j % len(_EXTENSIONS)]}"
+                             for j in range(files_per_project)]
+            for i in range(count)}
+
+
+def file_type(name):
+    return name.split(".")[-1].upper()
+
+
+class LazyProjectTreeModel(QAbstractItemModel):
+    """internalId 约定：顶层项目为 0，文件行为 “所属项目行号 + 1”"""
+
+    def __init__(self, data, batch_size=1000, parent=None):
+        super().__init__(parent)
+        self._data = data                  # 直接引用，不拷贝
+        self._batch_size = batch_size
+        self._key_iter = iter(data)        # 顶层 key 按批次从迭代器中取出
+        self._projects = []                # 已插入的顶层项目名
+        self._child_counts = {}            # 项目行号 -> 已插入的文件数
+
+    # -------------------------- 索引结构 --------------------------
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._projects)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self._child_counts.get(parent.row(), 0)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        # 未加载的项目也要显示展开箭头
+        if not parent.isValid():
+            return bool(self._data)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return bool(self._files(parent.row()))
+        return False
+
+    # -------------------------- 按需加载 --------------------------
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return len(self._projects) < len(self._data)
+        if parent.internalId() == 0:
+            row = parent.row()
+            return self._child_counts.get(row, 0) < len(self._files(row))
+        return False
+
+    def fetchMore(self, parent):
+        if not parent.isValid():
+            batch = list(islice(self._key_iter, self._batch_size))
+            if batch:
+                first = len(self._projects)
+                self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+                self._projects.extend(batch)
+                self.endInsertRows()
+            return
+        if parent.internalId() != 0:
+            return
+        row = parent.row()
+        loaded = self._child_counts.get(row, 0)
+        total = len(self._files(row))
+        if loaded >= total:
+            return
+        # 一个项目的文件一次性插入（文件数通常不大），父索引固定取第 0 列
+        self.beginInsertRows(self.index(row, 0), loaded, total - 1)
+        self._child_counts[row] = total
+        self.endInsertRows()
+
+    def _files(self, project_row):
+        return self._data[self._projects[project_row]]
+
+    # -------------------------- 数据 --------------------------
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        project_id = index.internalId()
+        if project_id == 0:
+            return self._projects[index.row()] if index.column() == 0 else None
+        name = self._files(project_id - 1)[index.row()]
+        return name if index.column() == 0 else file_type(name)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
@@ -0,0 +1,57 @@
+import sys
+
+from PySide6.QtWidgets import (QApplication, QComboBox, QLabel, QLineEdit,
+                               QTreeView, QVBoxLayout, QWidget)
+
+from lazy_tree_model import DATA, LazyProjectTreeModel, make_projects
+from node_store import NodeStore
+from node_tree_model import NodeTreeModel
+
+
+def create_tree_view(model):
+    view = QTreeView()
+    view.setUniformRowHeights(True)  # 行高一致，滚动时不逐行测量
+    view.setModel(model)
+    return view
+
+
+def create_type_filter_window(model):
+    """紧凑模式：顶部显示类型汇总，下拉框按类型过滤（基于 TypeIndex，切换不扫描整棵树），
+    搜索框按名称即时过滤（基于 NameIndex）"""
+    window = QWidget()
+    summary = model.type_index().summary()
+    summary_label = QLabel("  ".join(f"{name}: {count}" for name, count in summary))
+    type_combobox = QComboBox()
+    type_combobox.addItem("全部类型", "")
+    for name, count in summary:
+        type_combobox.addItem(f"{name} ({count})", name)
+    type_combobox.currentIndexChanged.connect(
+        lambda i: model.set_type_filter(type_combobox.itemData(i)))
+    search_edit = QLineEdit()
+    search_edit.setPlaceholderText("搜索文件名")
+    search_edit.setClearButtonEnabled(True)
+    search_edit.textChanged.connect(model.set_name_filter)
+
+    layout = QVBoxLayout(window)
+    layout.addWidget(summary_label)
+    layout.addWidget(type_combobox)
+    layout.addWidget(search_edit)
+    layout.addWidget(create_tree_view(model))
+    window.resize(400, 600)
+    return window
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    # python main.py 100000  → 10 万个项目；不传参数时与 4.QTreeWidget.py 数据相同
+    # python main.py 100000 compact  → 使用紧凑节点存储（NodeStore + NodeTreeModel）
+    data = make_projects(int(sys.argv[1])) if len(sys.argv) > 1 else DATA
+
+    if "compact" in sys.argv[2:]:
+        model = NodeTreeModel(NodeStore.from_projects(data))
+        tree = create_type_filter_window(model)
+    else:
+        model = LazyProjectTreeModel(data)
+        tree = create_tree_view(model)
+    tree.show()
+    sys.exit(app.exec())
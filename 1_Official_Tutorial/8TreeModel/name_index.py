@@ -0,0 +1,308 @@
+"""文件名搜索索引（子串 / 前缀，大小写不敏感），随节点增加增量维护
+
+结构：
+- 所有名称小写后用 '\\0' 分隔拼成一块缓冲区
+- 主索引：缓冲区中每个位置（后缀）按前 8 字节排序的后缀数组 → 查询 = 二分查找一段区间
+- 副索引：主索引之后新加入的名称，每攒够 tail_threshold 个就单独建一个后缀数组（只排序新名称）；
+  副索引合计超过 max(merge_threshold, 主索引 / 4) 时重建主索引把它们并进去
+- 尾部：还没进副索引的名称，查询时在 blob 尾段上用 NumPy 向量化扫描
+- 除了构造时的第一次，建后缀数组都在一个后台线程里做（NumPy 排序会释放 GIL），
+  完成后下一次 sync() 再换上；search() 本身从不排序，按键时的耗时只有二分查找和尾部扫描
+- 删除 / 改名：通过 store.read_log() 得知，旧条目只标记失效（改名的节点以新名称重新加入尾部）；
+  store.compact() 之后（generation 变化）整个索引按新的节点 id 重建，失效条目随之清除
+
+子串查询：二分得到“以 pattern 开头的后缀”区间 → 位置映射回节点 id。
+"""
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from functools import cached_property
+
+import numpy as np
+
+from node_store import NO_NODE, ROOT
+
+_KEY_BYTES = 8
+_SEPARATOR = b"\0"
+_CHUNK = 1 << 16  # 建索引时每块处理的后缀数
+
+
+class SearchResult:
+    """nodes：命中的节点 id（升序）；ancestors：显示它们所需的祖先节点 id（不含根）"""
+
+    def __init__(self, store, nodes):
+        self._store = store
+        self.nodes = nodes
+
+    @cached_property
+    def ancestors(self):
+        """首次访问时计算：逐层向上标记祖先（位图去重，避免对大结果集排序）"""
+        store = self._store
+        marked = np.zeros(len(store) + 1, dtype=bool)
+        current = self.nodes
+        while len(current):
+            current = store.parent[current]
+            current = current[current > ROOT]
+            current = current[~marked[current]]
+            marked[current] = True
+        return np.flatnonzero(marked).astype(np.int32)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def path(self, node):
+        """根 → node 的名称路径"""
+        names = []
+        while node > ROOT:
+            names.append(self._store.name(node))
+            node = int(self._store.parent[node])
+        return names[::-1]
+
+
+class _SuffixArray:
+    """blob 中条目 [first, end) 的后缀数组；search() 返回命中的条目序号（升序）"""
+
+    def __init__(self, blob, starts, first, end):
+        self.first, self.end = first, end
+        base = int(starts[first]) if first < end else 0
+        stop = int(starts[end]) if end < len(starts) else len(blob)
+        self.blob = bytes(blob[base:stop]) + bytes(_KEY_BYTES)  # 快照（末尾补 0）
+        data = np.frombuffer(self.blob, dtype=np.uint8)
+        positions = np.flatnonzero(data[:stop - base] != 0).astype(np.int32)  # 跳过分隔符
+        self.starts = starts[first:end] - base          # 条目在快照中的起点
+        # 按前 8 字节（大端 uint64）排序：每个位置取 8 字节窗口，直接看作大端整数。
+        # 分块处理：在后台线程里运行时，每块之间主线程都能拿到 GIL（argsort 本身会释放 GIL）
+        windows = np.lib.stride_tricks.sliding_window_view(data, _KEY_BYTES)
+        keys = np.empty(len(positions), dtype=">u8")
+        for i in range(0, len(positions), _CHUNK):
+            keys[i:i + _CHUNK] = windows[positions[i:i + _CHUNK]].view(">u8").ravel()
+            time.sleep(0)  # 主动让出 GIL，主线程不用等满切换间隔（5 ms）
+        order = np.argsort(keys)  # 前 8 字节相同的后缀顺序任意（查询结果按条目去重）
+        del keys
+        self.suffixes = np.empty_like(positions)
+        self.owners = np.empty_like(positions)      # 每个后缀所属条目（相对 first）
+        for i in range(0, len(positions), _CHUNK):
+            chunk = positions[order[i:i + _CHUNK]]
+            self.suffixes[i:i + _CHUNK] = chunk
+            self.owners[i:i + _CHUNK] = np.searchsorted(self.starts, chunk, side="right") - 1
+            time.sleep(0)
+
+    def __len__(self):
+        return self.end - self.first
+
+    def search(self, pattern, prefix):
+        if not len(self):
+            return np.zeros(0, dtype=np.int64)
+        blob = self.blob
+        head = pattern[:_KEY_BYTES]
+        width = len(head)
+
+        def key(position):
+            return blob[position:position + width]
+
+        lo = bisect_left(self.suffixes, head, key=key)
+        hi = bisect_right(self.suffixes, head, key=key)
+        positions = self.suffixes[lo:hi]
+        names = self.owners[lo:hi]
+        if len(pattern) > _KEY_BYTES and len(positions):
+            # 超过 8 字节的部分逐字节向量化校验
+            data = np.frombuffer(blob, dtype=np.uint8)
+            mask = np.ones(len(positions), dtype=bool)
+            for k in range(_KEY_BYTES, len(pattern)):
+                # 越过末尾的位置按不匹配处理
+                ends = positions + k
+                inside = ends < len(data)
+                mask &= inside & (data[np.minimum(ends, len(data) - 1)] == pattern[k])
+            positions, names = positions[mask], names[mask]
+        if prefix:
+            names = names[self.starts[names] == positions]
+        # 同一名称可能多处命中：用位图去重，结果按条目序号升序
+        hit = np.zeros(len(self), dtype=bool)
+        hit[names] = True
+        return np.flatnonzero(hit) + self.first
+
+    def nbytes(self):
+        return len(self.blob) + self.suffixes.nbytes + self.owners.nbytes + self.starts.nbytes
+
+
+class NameIndex:
+    def __init__(self, store, merge_threshold=50_000, tail_threshold=8_192):
+        self._store = store
+        self._merge_threshold = merge_threshold
+        self._tail_threshold = tail_threshold
+        self._reset()
+        self.sync()
+        self.wait()  # 首次构建等它完成
+
+    def _reset(self):
+        """清空全部条目，从 store 当前的 generation 重新开始"""
+        self._generation = self._store.generation
+        self._log = self._store.open_log()
+        self._blob = bytearray()
+        self._starts = np.zeros(0, dtype=np.int64)   # 每个名称条目在 blob 中的起点
+        self._nodes = np.zeros(0, dtype=np.int32)    # 与 _starts 对应的节点 id
+        self._dead = np.zeros(0, dtype=bool)         # 条目是否已失效（节点删除 / 改名）
+        self._dead_count = 0
+        self._entry_of = np.zeros(1, dtype=np.int32)  # 节点 id -> 当前有效条目
+        self._reordered = False                      # 条目顺序不再等于节点 id 顺序
+        self._main = _SuffixArray(self._blob, self._starts, 0, 0)  # 主索引
+        self._runs = []                              # 副索引（依次接在主索引之后）
+        self._jobs = {}                              # 后台建索引："main" / "run" -> (线程, 结果, 起止条目)
+        self._indexed_size = 1                       # 已处理到的节点 id（0 为根）
+
+    # -------------------------- 增量维护 --------------------------
+    def sync(self):
+        """同步 store 的变化：新增节点（id 只增不减，只需处理尾部）、删除、改名"""
+        store = self._store
+        if self._generation != store.generation:
+            self._reset()  # 压缩后 id 全变了；还在运行的后台任务结果直接丢弃
+        end = len(store) + 1
+        if end > self._indexed_size:
+            nodes = np.arange(self._indexed_size, end, dtype=np.int32)
+            self._add_entries(nodes)
+            self._kill(self._entry_of[nodes[store.parent[nodes] == NO_NODE]])  # 登记日志之前就删除的
+            self._indexed_size = end
+        removed, renamed = store.read_log(self._log)
+        if len(removed):
+            self._kill(self._entry_of[removed])
+        if len(renamed):
+            renamed = renamed[store.parent[renamed] != NO_NODE]
+            self._kill(self._entry_of[renamed])
+            self._add_entries(renamed)
+            self._reordered = True
+        self._collect()
+        count = len(self._nodes)
+        indexed = self._runs[-1].end if self._runs else self._main.end
+        if "main" not in self._jobs and indexed - self._main.end > max(self._merge_threshold,
+                                                                       len(self._main) // 4):
+            self._build(0, indexed, "main")
+        if "run" not in self._jobs and count - indexed > self._tail_threshold:
+            if not indexed:
+                self._build(0, count, "main")  # 还没有主索引时，第一批直接作为主索引
+                return
+            # 末尾不比新段大的副索引一起重建（类似 LSM 合并），副索引个数保持在对数级
+            first, absorbed = indexed, self._jobs["main"][3] if "main" in self._jobs else 0
+            for run in reversed(self._runs):
+                if len(run) > count - first or run.first < absorbed:
+                    break
+                first = run.first
+            self._build(first, count, "run")
+
+    def _build(self, first, end, kind):
+        """后台线程建 [first, end) 的后缀数组；blob 在当前线程复制一份，之后追加互不影响。
+        主索引重建和副索引各占一个线程：重建主索引（可能要好几秒）期间新名称照样进副索引"""
+        base = int(self._starts[first])
+        stop = int(self._starts[end]) if end < len(self._starts) else len(self._blob)
+        blob = bytes(self._blob[base:stop])
+        starts = self._starts[first:end + 1] - base
+        result = []
+
+        def work():
+            try:
+                # Linux 上线程是独立的调度实体：调低优先级，单核时也不和界面线程抢 CPU
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+            except (AttributeError, OSError):
+                pass
+            result.append(_SuffixArray(blob, starts, 0, end - first))
+        thread = threading.Thread(target=work, name=f"NameIndex-{kind}", daemon=True)
+        self._jobs[kind] = (thread, result, first, end)
+        thread.start()
+
+    def _collect(self, wait=False):
+        """后台索引建好后换上"""
+        for kind, (thread, result, first, end) in list(self._jobs.items()):
+            if wait:
+                thread.join()
+            if thread.is_alive():
+                continue
+            del self._jobs[kind]
+            run = result[0]
+            run.first += first
+            run.end += first
+            if kind == "main":
+                self._main = run
+                self._runs = [r for r in self._runs if r.first >= run.end]
+            elif run.first >= self._main.end:  # 期间主索引已经把这段并进去了就丢掉
+                self._runs = [r for r in self._runs if r.end <= run.first] + [run]
+
+    def wait(self):
+        """等后台建完索引并换上（基准测试 / 测试用，保证计时时没有后台任务）"""
+        while self._jobs:
+            self._collect(wait=True)
+            self.sync()
+
+    def _add_entries(self, nodes):
+        name_ids = self._store.name_id[nodes]
+        data, lengths = self._store.names.encoded(name_ids)
+        if not len(data) or data.max() < 0x80:
+            # 全是 ASCII：直接按字节转小写，插入分隔符（不逐个名称调用 Python）
+            data[(data >= ord("A")) & (data <= ord("Z"))] += ord("a") - ord("A")
+            lengths = lengths + 1
+            chunk = np.zeros(len(data) + len(nodes), dtype=np.uint8)
+            filled = np.ones(len(chunk), dtype=bool)
+            filled[np.cumsum(lengths) - 1] = False  # 每个名称之后是分隔符
+            chunk[filled] = data
+            chunk = chunk.tobytes()
+        else:
+            # 含非 ASCII：str.lower() 可能改变字节数，逐个处理
+            encoded = [name.lower().encode() + _SEPARATOR for name in self._store.names.strings(name_ids)]
+            chunk = b"".join(encoded)
+            lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        starts = len(self._blob) + np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        first = len(self._nodes)
+        self._blob += chunk
+        self._starts = np.concatenate((self._starts, starts))
+        self._nodes = np.concatenate((self._nodes, nodes))
+        self._dead = np.concatenate((self._dead, np.zeros(len(nodes), dtype=bool)))
+        if len(self._entry_of) < len(self._store) + 1:
+            grown = np.zeros(max(len(self._store) + 1, len(self._entry_of) * 2), dtype=np.int32)
+            grown[:len(self._entry_of)] = self._entry_of
+            self._entry_of = grown
+        self._entry_of[nodes] = np.arange(first, first + len(nodes), dtype=np.int32)
+
+    def _kill(self, entries):
+        entries = entries[~self._dead[entries]]
+        self._dead[entries] = True
+        self._dead_count += len(entries)
+
+    # -------------------------- 查询 --------------------------
+    def search(self, text, prefix=False):
+        """返回 SearchResult。prefix=True 时只匹配名称开头"""
+        self.sync()
+        pattern = text.lower().encode()
+        if not pattern or _SEPARATOR in pattern:
+            return SearchResult(self._store, np.zeros(0, dtype=np.int32))
+        entries = np.concatenate([self._main.search(pattern, prefix)]
+                                 + [run.search(pattern, prefix) for run in self._runs]
+                                 + [self._search_tail(pattern, prefix)])
+        if self._dead_count:
+            entries = entries[~self._dead[entries]]
+        nodes = self._nodes[entries]
+        if self._reordered:
+            nodes = np.sort(nodes)
+        return SearchResult(self._store, nodes)
+
+    def _search_tail(self, pattern, prefix):
+        """还没进副索引的名称：在那段 blob 上向量化匹配（不逐个节点调用 Python）"""
+        first = self._runs[-1].end if self._runs else self._main.end
+        if first >= len(self._nodes):
+            return np.zeros(0, dtype=np.int64)
+        base = int(self._starts[first])
+        # 切片得到副本：不导出 self._blob 的缓冲区，之后仍可追加
+        data = np.frombuffer(self._blob[base:], dtype=np.uint8)
+        candidates = np.flatnonzero(data[:len(data) - len(pattern) + 1] == pattern[0])
+        for k in range(1, len(pattern)):
+            candidates = candidates[data[candidates + k] == pattern[k]]
+        # 模式里没有分隔符，命中不会跨越两个名称
+        starts = self._starts[first:] - base
+        owners = np.searchsorted(starts, candidates, side="right") - 1
+        if prefix:
+            owners = owners[starts[owners] == candidates]
+        hit = np.zeros(len(starts), dtype=bool)
+        hit[owners] = True
+        return np.flatnonzero(hit) + first
+
+    def nbytes(self):
+        return (len(self._blob) + self._starts.nbytes + self._nodes.nbytes + self._dead.nbytes
+                + self._entry_of.nbytes + self._main.nbytes() + sum(run.nbytes() for run in self._runs))
@@ -0,0 +1,426 @@
+"""紧凑的树节点存储：每个字段一列 numpy 数组，节点就是一个整数 id
+
+对比 4.QTreeWidget.py：每个文件一个 QTreeWidgetItem（数百字节），这里每个节点约 50 字节，
+1000 万节点 < 1 GB。
+
+列：parent / first_child / last_child / next_sibling / row / child_count / name_id / type_id
+节点 0 是不可见的根节点，顶层项目是根的子节点。
+
+删除的节点只做标记（parent = NO_NODE），id 不复用；version 在每次结构/名称变化后递增，
+removed_log / renamed_log 记录变化的节点，供各索引增量同步：索引用 open_log() 登记一个游标，
+read_log() 读出自己还没处理的部分，所有游标都读过的日志随即丢弃（没有游标时不记录）。
+删除标记和改名留下的旧名称由 compact() 回收：按显示顺序重新分配 id，generation 加 1。
+"""
+import weakref
+from itertools import chain
+
+import numpy as np
+
+NO_NODE = -1
+ROOT = 0
+_LINK_COLUMNS = ("parent", "first_child", "last_child", "next_sibling", "row", "child_count")
+
+
+# -------------------------- 1. 字符串池：所有字符串拼成一块 UTF-8 缓冲区 + 偏移量数组 --------------------------
+class StringPool:
+    """id -> 字符串。dedupe=True 时相同字符串只存一份（适合文件类型这类取值很少的列）"""
+
+    def __init__(self, dedupe=False):
+        self._blob = bytearray()
+        self._offsets = np.zeros(1024, dtype=np.int64)
+        self._size = 0
+        self._ids = {} if dedupe else None
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, string_id):
+        start, end = self._offsets[string_id], self._offsets[string_id + 1]
+        return self._blob[start:end].decode()
+
+    def strings(self, string_ids):
+        """批量取字符串（比逐个 pool[i] 快得多）"""
+        blob = self._blob
+        starts = self._offsets[string_ids].tolist()
+        ends = self._offsets[np.asarray(string_ids) + 1].tolist()
+        return [blob[start:end].decode() for start, end in zip(starts, ends)]
+
+    def encoded(self, string_ids):
+        """批量取 UTF-8 字节：返回 (拼接后的 uint8 数组, 每个字符串的字节数)，不经过 Python 字符串"""
+        string_ids = np.asarray(string_ids)
+        starts = self._offsets[string_ids]
+        lengths = self._offsets[string_ids + 1] - starts
+        if not len(string_ids):
+            return np.zeros(0, dtype=np.uint8), lengths
+        low, high = int(starts.min()), int((starts + lengths).max())
+        blob = np.frombuffer(self._blob[low:high], dtype=np.uint8)  # 切片是副本，不锁住 _blob
+        if high - low == int(lengths.sum()) and np.all(starts[1:] >= starts[:-1]):
+            return blob, lengths  # 连续追加的字符串（最常见）：直接就是这一段
+        sources = np.arange(int(lengths.sum())) + np.repeat(starts - low - np.cumsum(lengths) + lengths,
+                                                              lengths)
+        return blob[sources], lengths
+
+    def _grow(self, count):
+        needed = self._size + count + 1
+        if needed > len(self._offsets):
+            grown = np.zeros(max(needed, len(self._offsets) * 2), dtype=np.int64)
+            grown[:self._size + 1] = self._offsets[:self._size + 1]
+            self._offsets = grown
+
+    def add(self, string):
+        if self._ids is not None and string in self._ids:
+            return self._ids[string]
+        return int(self.add_many([string])[0])
+
+    def add_many(self, strings):
+        """批量加入，返回 id 数组"""
+        if self._ids is not None:
+            return np.fromiter((self._add_one(s) for s in strings), dtype=np.int32,
+                               count=len(strings))
+        encoded = [s.encode() for s in strings]
+        count = len(encoded)
+        self._grow(count)
+        first = self._size
+        ends = np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=count))
+        self._offsets[first + 1:first + count + 1] = self._offsets[first] + ends
+        self._blob += b"".join(encoded)
+        self._size += count
+        return np.arange(first, first + count, dtype=np.int32)
+
+    def _add_one(self, string):
+        string_id = self._ids.get(string)
+        if string_id is None:
+            data = string.encode()
+            self._grow(1)
+            self._blob += data
+            self._offsets[self._size + 1] = self._offsets[self._size] + len(data)
+            string_id = self._ids[string] = self._size
+            self._size += 1
+        return string_id
+
+    def subset(self, string_ids):
+        """只含 string_ids 这些字符串的新池（新 id 依次为 0, 1, ...），压缩时用"""
+        data, lengths = self.encoded(string_ids)
+        pool = StringPool()
+        pool._grow(len(lengths))
+        pool._offsets[1:len(lengths) + 1] = np.cumsum(lengths)
+        pool._blob = bytearray(data.tobytes())
+        pool._size = len(lengths)
+        return pool
+
+    def find(self, string):
+        """仅 dedupe 池可用：字符串 -> id，不存在返回 NO_NODE"""
+        return self._ids.get(string, NO_NODE)
+
+    def nbytes(self):
+        return len(self._blob) + self._offsets.nbytes
+
+
+# -------------------------- 2. 节点存储 --------------------------
+class LogCursor:
+    """一个索引在 removed_log / renamed_log 中读到的位置（绝对位置，日志裁剪后仍然有效）"""
+    __slots__ = ("removed", "renamed", "__weakref__")
+
+    def __init__(self, removed, renamed):
+        self.removed = removed
+        self.renamed = renamed
+
+
+class NodeStore:
+    def __init__(self, capacity=1024):
+        capacity = max(capacity, 1)
+        for column in _LINK_COLUMNS:
+            setattr(self, column, np.full(capacity, NO_NODE, dtype=np.int32))
+        self.name_id = np.full(capacity, NO_NODE, dtype=np.int32)
+        self.type_id = np.full(capacity, NO_NODE, dtype=np.int32)  # int16 在第 32768 个类型时会静默回绕
+        self.names = StringPool()
+        self.types = StringPool(dedupe=True)
+        self._size = 0
+        self._children_cache = {}
+        self.version = 0
+        self.append_ordered = True  # 同一父节点下 id 顺序 == 行号顺序（只在末尾追加时成立）
+        self.generation = 0         # compact() 后加 1：节点 id 全部重新分配，索引需要重建
+        self.removed_log = []
+        self.renamed_log = []
+        self._removed_base = 0      # 已丢弃的日志条数
+        self._renamed_base = 0
+        self._cursors = weakref.WeakSet()
+        self._removed_count = 0     # 删除标记的节点数
+        self._stale_names = 0       # 改名后不再使用的旧名称数
+        self._allocate(1)  # 根节点
+        self.child_count[ROOT] = 0
+
+    def __len__(self):
+        """节点数（不含根）"""
+        return self._size - 1
+
+    def _columns(self):
+        return _LINK_COLUMNS + ("name_id", "type_id")
+
+    def _allocate(self, count):
+        """在末尾分配 count 个连续节点 id，返回首个 id"""
+        first = self._size
+        needed = first + count
+        capacity = len(self.parent)
+        if needed > capacity:
+            capacity = max(needed, capacity * 2)
+            for column in self._columns():
+                old = getattr(self, column)
+                grown = np.full(capacity, NO_NODE, dtype=old.dtype)
+                grown[:first] = old[:first]
+                setattr(self, column, grown)
+        self._size = needed
+        return first
+
+    # -------------------------- 构建 --------------------------
+    @classmethod
+    def from_projects(cls, data):
+        """由 {项目名: [文件名, ...]} 构建（与 4.QTreeWidget.py 的数据格式相同）"""
+        store = cls(capacity=1 + len(data) + sum(map(len, data.values())))
+        store.extend_projects(data.items())
+        return store
+
+    def extend_projects(self, items):
+        """批量追加一批 (项目名, [文件名...])，所有链接用 numpy 向量化计算"""
+        items = list(items)
+        if not items:
+            return
+        projects = [key for key, _ in items]
+        files = list(chain.from_iterable(values for _, values in items))
+        counts = np.fromiter((len(values) for _, values in items), dtype=np.int32,
+                             count=len(items))
+        project_ids = self._append_children(ROOT, projects, None)
+        if files:
+            self._append_grouped(project_ids, counts, files)
+
+    def add_node(self, parent, name, type_name=None):
+        """在 parent 的子节点末尾追加一个节点，返回新节点 id"""
+        types = None if type_name is None else [type_name]
+        return int(self._append_children(parent, [name], types)[0])
+
+    def _append_children(self, parent, names, type_names):
+        """给同一个父节点追加连续的一组子节点"""
+        count = len(names)
+        first = self._allocate(count)
+        ids = np.arange(first, first + count, dtype=np.int32)
+        self.parent[ids] = parent
+        self.row[ids] = self.child_count[parent] + np.arange(count, dtype=np.int32)
+        self.child_count[ids] = 0
+        self.next_sibling[ids[:-1]] = ids[1:]
+        self.name_id[ids] = self.names.add_many(names)
+        if type_names is not None:
+            self.type_id[ids] = self.types.add_many(type_names)
+        if self.last_child[parent] == NO_NODE:
+            self.first_child[parent] = first
+        else:
+            self.next_sibling[self.last_child[parent]] = first
+        self.last_child[parent] = ids[-1]
+        self.child_count[parent] += count
+        cached = self._children_cache.get(parent)
+        if cached is not None:
+            self._children_cache[parent] = np.concatenate((cached, ids))
+        self.version += 1
+        return ids
+
+    def _append_grouped(self, parents, counts, files):
+        """给多个（此前没有子节点的）父节点各追加 counts[i] 个文件节点"""
+        total = len(files)
+        first = self._allocate(total)
+        ids = np.arange(first, first + total, dtype=np.int32)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int32)
+        self.parent[ids] = np.repeat(parents, counts)
+        self.row[ids] = np.arange(total, dtype=np.int32) - np.repeat(starts, counts)
+        self.child_count[ids] = 0
+        self.next_sibling[ids[:-1]] = ids[1:]
+        has_files = counts > 0
+        ends = first + starts + counts - 1
+        self.next_sibling[ends[has_files]] = NO_NODE
+        self.first_child[parents[has_files]] = first + starts[has_files]
+        self.last_child[parents[has_files]] = ends[has_files]
+        self.child_count[parents] = counts
+        self.name_id[ids] = self.names.add_many(files)
+        self.type_id[ids] = self.types.add_many([name.split(".")[-1].upper() for name in files])
+        self.version += 1
+
+    # -------------------------- 修改（供差量更新使用）--------------------------
+    def insert_children(self, parent, row, names, type_names=None):
+        """在 parent 的第 row 行前插入一组节点，返回新节点 id 数组"""
+        count = int(self.child_count[parent])
+        if row >= count:
+            return self._append_children(parent, names, type_names)
+        siblings = self.children(parent)
+        ids = self._append_children(parent, names, type_names)  # 先挂到末尾，再移动到 row 处
+        old_last = int(siblings[-1])
+        self.next_sibling[old_last] = NO_NODE
+        self.last_child[parent] = old_last
+        self.next_sibling[ids[-1]] = siblings[row]
+        if row == 0:
+            self.first_child[parent] = ids[0]
+        else:
+            self.next_sibling[siblings[row - 1]] = ids[0]
+        self.row[ids] = row + np.arange(len(ids), dtype=np.int32)
+        self.row[siblings[row:]] += len(ids)
+        self._children_cache[parent] = np.concatenate((siblings[:row], ids, siblings[row:]))
+        self.append_ordered = False
+        return ids
+
+    def remove_children(self, parent, first, last):
+        """删除 parent 的第 first..last 行（含子树），返回被删除的节点 id 数组"""
+        return self.remove_rows(parent, np.arange(first, last + 1))
+
+    def remove_rows(self, parent, rows):
+        """一次删除 parent 下任意多行（含子树），链接与行号整体向量化重算"""
+        siblings = self.children(parent)
+        keep = np.ones(len(siblings), dtype=bool)
+        keep[rows] = False
+        removed, kept = siblings[~keep], siblings[keep]
+        if len(kept):
+            self.next_sibling[kept[:-1]] = kept[1:]
+            self.next_sibling[kept[-1]] = NO_NODE
+            self.first_child[parent], self.last_child[parent] = kept[0], kept[-1]
+        else:
+            self.first_child[parent] = self.last_child[parent] = NO_NODE
+        first_changed = int(np.argmin(keep)) if len(removed) else len(siblings)
+        self.row[kept[first_changed:]] = np.arange(first_changed, len(kept), dtype=np.int32)
+        self.child_count[parent] = len(kept)
+        self._children_cache[parent] = kept
+        # 整个子树做删除标记
+        pending = [removed]
+        while pending:
+            nodes = pending.pop()
+            for node in nodes[self.child_count[nodes] > 0].tolist():
+                pending.append(self.children(node))
+                self._children_cache.pop(node, None)
+            self.parent[nodes] = NO_NODE
+            self._removed_count += len(nodes)
+            if self._cursors:
+                self.removed_log.append(nodes)
+        self.version += 1
+        return removed
+
+    def rename(self, node, name, type_name=None):
+        """原地改名（旧字符串留在池中，compact() 时回收）"""
+        self.name_id[node] = self.names.add(name)
+        self.type_id[node] = NO_NODE if type_name is None else self.types.add(type_name)
+        self._stale_names += 1
+        if self._cursors:
+            self.renamed_log.append(node)
+        self.version += 1
+
+    def is_alive(self, node):
+        return node == ROOT or self.parent[node] != NO_NODE
+
+    # -------------------------- 变化日志 --------------------------
+    def open_log(self):
+        """登记一个日志读者，从现在起的删除 / 改名都会记录给它；读者被回收后自动注销"""
+        cursor = LogCursor(self._removed_base + len(self.removed_log),
+                           self._renamed_base + len(self.renamed_log))
+        self._cursors.add(cursor)
+        return cursor
+
+    def read_log(self, cursor):
+        """返回 (删除的节点, 改名的节点，已去重) 并前移游标；所有游标都读过的日志随即丢弃"""
+        removed = self.removed_log[cursor.removed - self._removed_base:]
+        renamed = self.renamed_log[cursor.renamed - self._renamed_base:]
+        cursor.removed += len(removed)
+        cursor.renamed += len(renamed)
+        removed_seen = min(c.removed for c in self._cursors) - self._removed_base
+        renamed_seen = min(c.renamed for c in self._cursors) - self._renamed_base
+        del self.removed_log[:removed_seen], self.renamed_log[:renamed_seen]
+        self._removed_base += removed_seen
+        self._renamed_base += renamed_seen
+        empty = np.zeros(0, dtype=np.int32)
+        return (np.concatenate(removed) if removed else empty,
+                np.unique(renamed).astype(np.int32) if renamed else empty)
+
+    # -------------------------- 压缩 --------------------------
+    def garbage(self):
+        """删除标记的节点占全部节点、废弃的旧名称占名称池的比例（取较大者）"""
+        return max(self._removed_count / max(len(self), 1),
+                   (self._removed_count + self._stale_names) / max(len(self.names), 1))
+
+    def compact(self):
+        """回收删除标记的节点和旧名称：存活节点按层、同层按（父节点、行号）顺序重新分配 id，
+        同一父节点的子节点 id 连续。返回旧 id -> 新 id 的映射（删除的节点为 NO_NODE）。
+        所有节点 id 都会变化，持有 id 的一方（模型的持久索引、各索引）需要按映射更新或重建"""
+        size = self._size
+        parents = self.parent[:size].astype(np.int64)
+        parents[parents == NO_NODE] = size          # 根节点和删除的节点指向哨兵
+        rank = np.full(size + 1, -1, dtype=np.int64)  # 当前层节点 -> 层内序号
+        level = np.array([ROOT], dtype=np.int64)
+        levels = [level]
+        while len(level):
+            rank[level] = np.arange(len(level))
+            children = np.flatnonzero(rank[parents] >= 0)
+            order = np.lexsort((self.row[children], rank[parents[children]]))
+            rank[level] = -1
+            level = children[order]
+            levels.append(level)
+        old_ids = np.concatenate(levels)
+        mapping = np.full(size, NO_NODE, dtype=np.int32)
+        mapping[old_ids] = np.arange(len(old_ids), dtype=np.int32)
+
+        def remap(column):
+            values = column[old_ids]
+            return np.where(values == NO_NODE, NO_NODE, mapping[values]).astype(np.int32)
+
+        for column in ("parent", "first_child", "last_child", "next_sibling"):
+            setattr(self, column, remap(getattr(self, column)))
+        self.row = self.row[old_ids]
+        self.child_count = self.child_count[old_ids]
+        self.type_id = self.type_id[old_ids]
+        self.names = self.names.subset(self.name_id[old_ids[1:]])
+        self.name_id = np.concatenate(([NO_NODE], np.arange(len(old_ids) - 1))).astype(np.int32)
+        self._size = len(old_ids)
+        self._children_cache = {}
+        self.append_ordered = True
+        self.removed_log, self.renamed_log = [], []
+        self._removed_base = self._renamed_base = 0
+        self._cursors = weakref.WeakSet()  # 旧游标作废：读者看到 generation 变化后重建
+        self._removed_count = self._stale_names = 0
+        self.generation += 1
+        self.version += 1
+        return mapping
+
+    # -------------------------- 查询 --------------------------
+    def children(self, node):
+        """node 的子节点 id 数组（按行号顺序）；结果按父节点缓存"""
+        cached = self._children_cache.get(node)
+        if cached is not None:
+            return cached
+        count = int(self.child_count[node])
+        first, last = int(self.first_child[node]), int(self.last_child[node])
+        if count == 0:
+            result = np.zeros(0, dtype=np.int32)
+        elif last - first + 1 == count and (
+                count == 1 or np.array_equal(self.next_sibling[first:last],
+                                             np.arange(first + 1, last + 1))):
+            result = np.arange(first, last + 1, dtype=np.int32)  # 连续分配：无需遍历链表
+        else:
+            result = np.empty(count, dtype=np.int32)
+            child = first
+            for i in range(count):
+                result[i] = child
+                child = int(self.next_sibling[child])
+        if len(self._children_cache) >= 1024:
+            self._children_cache.pop(next(iter(self._children_cache)))
+        self._children_cache[node] = result
+        return result
+
+    def child(self, node, row):
+        return int(self.children(node)[row])
+
+    def name(self, node):
+        return self.names[self.name_id[node]]
+
+    def type_name(self, node):
+        type_id = self.type_id[node]
+        return self.types[type_id] if type_id != NO_NODE else ""
+
+    def nbytes(self):
+        """存储占用字节数（按已分配容量计）"""
+        arrays = sum(getattr(self, column).nbytes for column in self._columns())
+        return arrays + self.names.nbytes() + self.types.nbytes()
+
+    def bytes_per_node(self):
+        return self.nbytes() / max(len(self), 1)
@@ -0,0 +1,356 @@
+"""基于 NodeStore 的树模型：QModelIndex 的 internalId 就是节点 id，不创建任何 item 对象"""
+from difflib import SequenceMatcher
+
+import numpy as np
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from lazy_tree_model import HEADERS, file_type
+from node_store import NO_NODE, ROOT, NodeStore
+from filtered_tree import FilteredTree
+from name_index import NameIndex
+from type_index import TypeIndex
+
+NAME_COLUMN, TYPE_COLUMN = range(2)
+
+# 行信号与 layoutChanged 的耗时估算（bench_tree_diff.py，10 万项目 / 60 万节点实测）：
+# 每发一次 beginInsertRows/beginRemoveRows/dataChanged，Qt 要对每个持久索引（视图里展开的每个节点、
+# 当前项、选中项）回调一次 parent()/index() 判断是否受影响：约 0.5 ms + 每个持久索引 12 µs；
+# 一次 layoutChanged 只逐个映射一遍持久索引：约每个 0.2 ms。
+_ROW_SIGNAL_MS = 0.5
+_ROW_SIGNAL_PER_PERSISTENT_MS = 0.012
+_LAYOUT_PER_PERSISTENT_MS = 0.2
+_ROW_SIGNAL_BUDGET_MS = 30  # 在这之内宁可逐区间发信号（代理模型 / 其它视图能精确更新）
+
+
+def _row_ranges(rows):
+    """[1, 2, 3, 7, 8] -> [(1, 3), (7, 8)]（输入已排序）"""
+    ranges = []
+    for row in rows:
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return ranges
+
+
+class UpdateStats:
+    """一次差量更新发出的信号统计"""
+
+    def __init__(self):
+        self.inserted_rows = 0
+        self.removed_rows = 0
+        self.changed_rows = 0
+        self.signals = 0
+
+    def __repr__(self):
+        return (f"UpdateStats(inserted={self.inserted_rows}, removed={self.removed_rows}, "
+                f"changed={self.changed_rows}, signals={self.signals})")
+
+
+class NodeTreeModel(QAbstractItemModel):
+    def __init__(self, store=None, parent=None):
+        super().__init__(parent)
+        self._store = store if store is not None else NodeStore()
+        self._type_index = None
+        self._name_index = None
+        self._filter = None  # FilteredTree，None 表示显示全部
+        self._filter_column = NAME_COLUMN
+        self._filter_text = ""
+        self._file_hashes = None  # 项目节点 -> 文件列表的 hash（差量更新时快速跳过未变化的项目）
+
+    @property
+    def store(self):
+        return self._store
+
+    def node(self, index):
+        """QModelIndex -> 节点 id（无效索引对应根节点）"""
+        return index.internalId() if index.isValid() else ROOT
+
+    def index_of(self, node, column=0):
+        """节点 id -> QModelIndex"""
+        if node == ROOT:
+            return QModelIndex()
+        return self.createIndex(int(self._store.row[node]), column, node)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if self._filter is None:
+            # 热路径：直接做边界检查，不经过 hasIndex（它会再回调 Python 的 rowCount/columnCount）
+            node = self.node(parent)
+            if (parent.column() > 0 or not 0 <= column < len(HEADERS)
+                    or not 0 <= row < self._store.child_count[node]):
+                return QModelIndex()
+            return self.createIndex(row, column, self._store.child(node, row))
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, int(self._filter.projects[row]))
+        return self.createIndex(row, column, self._filter.file(parent.row(), row))
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        parent = int(self._store.parent[index.internalId()])
+        if self._filter is not None and parent != ROOT:
+            return self.createIndex(self._filter.project_row(parent), 0, parent)
+        return self.index_of(parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        if self._filter is not None:
+            if not parent.isValid():
+                return len(self._filter.projects)
+            if self._store.parent[parent.internalId()] == ROOT:
+                return self._filter.file_count(parent.row())
+            return 0
+        return int(self._store.child_count[self.node(parent)])
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        node = index.internalId()
+        if index.column() == NAME_COLUMN:
+            return self._store.name(node)
+        return self._store.type_name(node) or None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            if section == self._filter_column and self._filter is not None:
+                label = (self._filter_text.upper() if section == TYPE_COLUMN
+                         else f"'{self._filter_text}'")
+                return f"{HEADERS[section]}: {label} ({len(self._filter.files)})"
+            return HEADERS[section]
+        return None
+
+    # -------------------------- 按文件类型过滤（基于 TypeIndex，不扫描整棵树）--------------------------
+    def type_index(self):
+        """首次使用时构建类型索引；树结构变化后自动重建"""
+        if self._type_index is None:
+            self._type_index = TypeIndex(self._store)
+        elif self._type_index.is_stale:
+            self._type_index.rebuild()
+        return self._type_index
+
+    def set_type_filter(self, type_name=None):
+        """只显示某类型的文件（及其所在项目）；None 或空串恢复显示全部"""
+        tree = None
+        if type_name:
+            index = self.type_index()
+            type_id = index.find(type_name)
+            tree = index.filter(type_id) if type_id != NO_NODE else FilteredTree.empty()
+        self._set_filter(tree, TYPE_COLUMN, type_name)
+
+    # -------------------------- 名称搜索（基于 NameIndex，随节点增加增量维护）--------------------------
+    def name_index(self):
+        if self._name_index is None:
+            self._name_index = NameIndex(self._store)
+        return self._name_index
+
+    def search(self, text, prefix=False):
+        """返回 SearchResult（命中节点 + 祖先），不改变显示"""
+        return self.name_index().search(text, prefix)
+
+    def set_name_filter(self, text=None):
+        """只显示名称包含 text 的节点及其祖先；None 或空串恢复显示全部"""
+        tree = None
+        if text:
+            tree = FilteredTree.from_nodes(self._store, self.search(text).nodes)
+        self._set_filter(tree, NAME_COLUMN, text)
+
+    def _set_filter(self, tree, column, text):
+        self.beginResetModel()
+        self._filter = tree
+        self._filter_column = column
+        self._filter_text = text or ""
+        self.endResetModel()
+        self.headerDataChanged.emit(Qt.Horizontal, NAME_COLUMN, TYPE_COLUMN)
+
+    # -------------------------- 差量更新：只发出最小的插入/删除/修改信号，展开与选中状态不受影响 --------------------------
+    def update_projects(self, data, max_row_signals=None, compact_ratio=0.5):
+        """用新的 {项目名: [文件名, ...]} 更新树，返回 UpdateStats。
+        新项目追加在末尾；已有项目的顺序不随 data 调整（不做移动）。
+        变动区间（相邻行已合并）不超过 max_row_signals 个时逐区间发 beginInsertRows/beginRemoveRows/dataChanged；
+        更分散的变动合并为一次 layoutChanged（持久索引逐个映射，展开/选中同样保留）。
+        max_row_signals 为 None 时按当前持久索引数估算（见 row_signal_limit）。
+        过滤视图下直接刷新过滤结果。删除 / 改名留下的垃圾超过 compact_ratio 时顺带 compact()。"""
+        stats = UpdateStats()
+        if self._file_hashes is None:
+            self._file_hashes = self._snapshot_hashes()
+        store = self._store
+        projects = store.children(ROOT)
+        current = dict(zip(store.names.strings(store.name_id[projects]), projects.tolist()))
+
+        gone = sorted(int(store.row[node]) for name, node in current.items() if name not in data)
+        gone_ranges = _row_ranges(gone)
+        changed = []  # 文件列表 hash 变化的项目
+        for name, node in current.items():
+            files = data.get(name)
+            if files is not None:
+                files_hash = hash(tuple(files))
+                if self._file_hashes.get(node) != files_hash:
+                    changed.append((node, files, files_hash))
+        added = [name for name in data if name not in current]
+
+        if self._filter is not None:
+            self._apply_update(gone_ranges, changed, added, data, stats, emit=False)
+            self._refresh_filter()
+        elif len(gone_ranges) + len(changed) + bool(added) > (
+                self.row_signal_limit() if max_row_signals is None else max_row_signals):
+            self._apply_as_layout_change(gone_ranges, changed, added, data, stats)
+        else:
+            self._apply_update(gone_ranges, changed, added, data, stats, emit=True)
+        if compact_ratio is not None and self._store.garbage() > compact_ratio:
+            self.compact()
+        if self._name_index is not None:
+            # 在加入节点时维护搜索索引（后台建后缀数组），不把这部分开销留给下一次按键
+            self._name_index.sync()
+        return stats
+
+    def row_signal_limit(self):
+        """逐区间发信号比一次 layoutChanged 更划算的最多区间数。
+        1 万持久索引时逐个行信号约 120 ms，1% 的分散变动（约 1000 个区间）逐个发要十几秒，
+        layoutChanged 只要几百毫秒；没有展开任何节点时约 60 个区间以内逐个发"""
+        persistent = len(self.persistentIndexList())
+        return int((_ROW_SIGNAL_BUDGET_MS + _LAYOUT_PER_PERSISTENT_MS * persistent)
+                   / (_ROW_SIGNAL_MS + _ROW_SIGNAL_PER_PERSISTENT_MS * persistent))
+
+    def _apply_update(self, gone_ranges, changed, added, data, stats, emit):
+        store = self._store
+        # 1. 删除的项目：按连续行区间从下往上删除（不发信号时一次性删除）
+        if emit:
+            for first, last in reversed(gone_ranges):
+                self._remove_rows(ROOT, first, last, stats, emit)
+        elif gone_ranges:
+            rows = np.concatenate([np.arange(first, last + 1) for first, last in gone_ranges])
+            for node in store.remove_rows(ROOT, rows).tolist():
+                self._file_hashes.pop(node, None)
+            stats.removed_rows += len(rows)
+        # 2. 文件列表变化的项目：行级 diff
+        for node, files, files_hash in changed:
+            self._update_files(node, files, stats, emit)
+            self._file_hashes[node] = files_hash
+        # 3. 新增的项目：一次性追加到末尾
+        if added:
+            first = int(store.child_count[ROOT])
+            if emit:
+                self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            store.extend_projects((name, data[name]) for name in added)
+            if emit:
+                self.endInsertRows()
+            stats.inserted_rows += len(added)
+            stats.signals += emit
+            for node in store.children(ROOT)[first:].tolist():
+                self._file_hashes[node] = hash(tuple(data[store.name(node)]))
+
+    def _apply_as_layout_change(self, gone_ranges, changed, added, data, stats):
+        """分散的大量变动：一次 layoutAboutToBeChanged/layoutChanged，持久索引按节点 id 重新定位"""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        nodes = [(index.internalId(), index.column()) for index in persistent]
+        self._apply_update(gone_ranges, changed, added, data, stats, emit=False)
+        store = self._store
+        moved = [self.createIndex(int(store.row[node]), column, node)
+                 if store.is_alive(node) else QModelIndex()
+                 for node, column in nodes]
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+        stats.signals += 2
+
+    # -------------------------- 压缩：回收删除的节点和旧名称 --------------------------
+    def compact(self):
+        """NodeStore.compact() 重新分配全部节点 id：一次 layoutChanged，持久索引（展开 / 选中）按映射更新；
+        类型索引按 version 自动重建，名称索引看到 generation 变化后在后台重建"""
+        store = self._store
+        if self._filter is not None:
+            mapping = store.compact()
+            self._remap_hashes(mapping)
+            self._refresh_filter()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            persistent = self.persistentIndexList()
+            nodes = [(index.internalId(), index.column()) for index in persistent]
+            mapping = store.compact()
+            self._remap_hashes(mapping)
+            moved = []
+            for node, column in nodes:
+                node = int(mapping[node])
+                moved.append(self.index_of(node, column) if node != NO_NODE else QModelIndex())
+            self.changePersistentIndexList(persistent, moved)
+            self.layoutChanged.emit()
+        if self._name_index is not None:
+            self._name_index.sync()
+
+    def _remap_hashes(self, mapping):
+        if self._file_hashes is not None:
+            self._file_hashes = {int(mapping[node]): files_hash
+                                 for node, files_hash in self._file_hashes.items()
+                                 if mapping[node] != NO_NODE}
+
+    def _snapshot_hashes(self):
+        """一次性计算现有每个项目的文件列表 hash"""
+        store = self._store
+        size = len(store) + 1
+        parents = store.parent[:size]
+        files = np.flatnonzero(parents > ROOT).astype(np.int32)
+        files = files[np.lexsort((store.row[files], parents[files]))]
+        names = store.names.strings(store.name_id[files])
+        groups = parents[files]
+        bounds = np.flatnonzero(np.diff(groups)) + 1 if len(files) else np.zeros(0, dtype=np.int64)
+        starts = [0] + bounds.tolist()
+        ends = bounds.tolist() + [len(files)]
+        hashes = {node: hash(()) for node in store.children(ROOT).tolist()}
+        for start, end in zip(starts, ends):
+            if end > start:
+                hashes[int(groups[start])] = hash(tuple(names[start:end]))
+        return hashes
+
+    def _update_files(self, project, files, stats, emit):
+        store = self._store
+        old = store.names.strings(store.name_id[store.children(project)])
+        opcodes = SequenceMatcher(None, old, files, autojunk=False).get_opcodes()
+        # 从后往前应用，前面的行号不受影响
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                continue
+            if tag == "replace" and i2 - i1 == j2 - j1:
+                for row, name in zip(range(i1, i2), files[j1:j2]):
+                    store.rename(store.child(project, row), name, file_type(name))
+                if emit:
+                    parent = self.index_of(project)
+                    self.dataChanged.emit(self.index(i1, NAME_COLUMN, parent),
+                                          self.index(i2 - 1, TYPE_COLUMN, parent))
+                stats.changed_rows += i2 - i1
+                stats.signals += emit
+                continue
+            if i2 > i1:
+                self._remove_rows(project, i1, i2 - 1, stats, emit)
+            if j2 > j1:
+                names = files[j1:j2]
+                if emit:
+                    self.beginInsertRows(self.index_of(project), i1, i1 + len(names) - 1)
+                store.insert_children(project, i1, names, [file_type(name) for name in names])
+                if emit:
+                    self.endInsertRows()
+                stats.inserted_rows += len(names)
+                stats.signals += emit
+
+    def _remove_rows(self, parent, first, last, stats, emit):
+        if emit:
+            self.beginRemoveRows(self.index_of(parent), first, last)
+        removed = self._store.remove_children(parent, first, last)
+        if emit:
+            self.endRemoveRows()
+        if parent == ROOT:
+            for node in removed.tolist():
+                self._file_hashes.pop(node, None)
+        stats.removed_rows += last - first + 1
+        stats.signals += emit
+
+    def _refresh_filter(self):
+        if self._filter_column == TYPE_COLUMN:
+            self.set_type_filter(self._filter_text)
+        else:
+            self.set_name_filter(self._filter_text)
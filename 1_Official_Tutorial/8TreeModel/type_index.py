@@ -0,0 +1,64 @@
+"""文件类型索引：一次构建，之后按类型统计 / 过滤都不再扫描整棵树
+
+- counts：每个类型的文件数（类型汇总）
+- postings：按类型分组的文件节点 id，组内已按（项目行号，文件行号）排好序
+  → 过滤某个类型只是切一段数组，再用 diff 找出涉及的项目
+"""
+import numpy as np
+
+from filtered_tree import FilteredTree
+from node_store import NO_NODE
+
+
+class TypeIndex:
+    def __init__(self, store):
+        self._store = store
+        self.rebuild()
+
+    def rebuild(self):
+        store = self._store
+        size = len(store) + 1
+        type_ids = store.type_id[:size]
+        files = np.flatnonzero((type_ids != NO_NODE)
+                               & (store.parent[:size] != NO_NODE)).astype(np.int32)
+        file_types = type_ids[files]
+        parents = store.parent[files]
+        # 排序键：类型 → 所属项目行号 → 文件行号
+        order = np.lexsort((store.row[files], store.row[parents], file_types))
+        self._postings = files[order]
+        self.counts = np.bincount(file_types, minlength=len(store.types))
+        self._offsets = np.concatenate(([0], np.cumsum(self.counts)))
+        self._version = store.version
+
+    @property
+    def is_stale(self):
+        """树结构变化后需要 rebuild()"""
+        return self._version != self._store.version
+
+    def type_count(self):
+        return len(self.counts)
+
+    def type_name(self, type_id):
+        return self._store.types[type_id]
+
+    def find(self, type_name):
+        return self._store.types.find(type_name.upper())
+
+    def postings(self, type_id):
+        """该类型全部文件节点 id（显示顺序），返回视图不拷贝"""
+        return self._postings[self._offsets[type_id]:self._offsets[type_id + 1]]
+
+    def summary(self):
+        """[(类型名, 文件数), ...]，按数量降序"""
+        order = np.argsort(-self.counts, kind="stable")
+        return [(self.type_name(t), int(self.counts[t])) for t in order if self.counts[t]]
+
+    def filter(self, type_id):
+        """类型过滤结果：(可见项目 id, 每个项目的文件起始偏移, 文件 id)"""
+        files = self.postings(type_id)
+        parents = self._store.parent[files]
+        if len(files):
+            starts = np.flatnonzero(np.concatenate(([True], parents[1:] != parents[:-1])))
+        else:
+            starts = np.zeros(0, dtype=np.int64)
+        return FilteredTree(parents[starts], np.append(starts, len(files)), files)
@@ -0,0 +1,20 @@
+"""基准测试共用的内存统计（7TableModel/benchmark.py、8TreeModel/bench_node_store.py）
+
+各目录的基准脚本把 1_Official_Tutorial 加入 sys.path 后 import：
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+"""
+import os
+
+
+def current_rss():
+    """当前进程常驻内存（字节）；优先 psutil，其次 Linux /proc"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
@@ -0,0 +1,85 @@
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
+                               QProgressBar, QPushButton, QVBoxLayout, QLabel)
+from PySide6.QtCore import Qt, Slot
+import asyncio
+import sys
+
+from qt_asyncio import AsyncTask, exec_window
+
+
+# -------------------------- 1. 协程任务（运行在主线程的事件循环上，不需要线程）--------------------------
+async def many_io_jobs(task, job_count=200, steps=100):
+    """job_count 个 I/O 任务并发执行，每个分 steps 步，每步等待 50 ms（模拟网络请求）"""
+    done = 0
+
+    async def one_job():
+        nonlocal done
+        for _ in range(steps):
+            await asyncio.sleep(0.05)  # 代替 time.sleep(0.05)：等待期间不占线程
+            done += 1
+            task.report_progress(done * 100 // (job_count * steps))
+
+    await asyncio.gather(*(one_job() for _ in range(job_count)))
+    return job_count
+
+
+# -------------------------- 2. 主窗口类（与 QThreadUI2.py 相同的界面）--------------------------
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+        self.background_task = AsyncTask(many_io_jobs, parent=self)
+        self.background_task.progress_updated.connect(self.update_progress_bar)
+        self.background_task.task_finished.connect(self.on_task_finished)
+
+    def initUI(self):
+        self.setWindowTitle("asyncio 协程并发 I/O 示例")
+        self.resize(400, 200)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.status_label = QLabel("就绪状态")
+        self.start_btn = QPushButton("启动 200 个并发任务")
+        self.stop_btn = QPushButton("取消任务")
+        self.start_btn.clicked.connect(self.on_start_clicked)
+        self.stop_btn.clicked.connect(self.on_stop_clicked)
+        self.stop_btn.setEnabled(False)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.start_btn)
+        layout.addWidget(self.stop_btn)
+
+    @Slot()
+    def on_start_clicked(self):
+        self.progress_bar.setValue(0)
+        self.status_label.setText("任务执行中...（0 个额外线程）")
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.background_task.start_task.emit()
+
+    @Slot()
+    def on_stop_clicked(self):
+        self.background_task.stop_task()
+        self.stop_btn.setEnabled(False)
+
+    @Slot(int)
+    def update_progress_bar(self, progress):
+        self.progress_bar.setValue(progress)
+        self.status_label.setText(f"进度：{progress}%")
+
+    @Slot(str)
+    def on_task_finished(self, result):
+        self.status_label.setText(result)
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(exec_window(window))  # 代替 app.exec()：Qt 事件循环同时驱动 asyncio
@@ -0,0 +1,117 @@
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
+                               QPushButton, QVBoxLayout, QHBoxLayout, QLabel)
+from PySide6.QtCore import QThread, QTimer, Signal, Qt, Slot
+import sys
+import time
+
+import numpy as np
+
+from cancel_token import CancelToken
+from plot_widget import StreamPlot
+
+SAMPLE_RATE = 20_000  # 每秒采样数
+BATCH_MS = 10         # 每 10 ms 发送一批
+
+
+# -------------------------- 1. 后台线程类（BackgroundWorker 风格：按固定速率产生采样，成批发送）--------------------------
+class SignalWorker(QThread):
+    samples_ready = Signal(object)  # 一批采样（numpy 数组）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.token = CancelToken()
+
+    def run(self):
+        batch = SAMPLE_RATE * BATCH_MS // 1000
+        rng = np.random.default_rng()
+        sent = 0
+        start = time.perf_counter()
+        while not self.token.cancelled:
+            # 模拟采集：两个正弦叠加噪声；一批一次 emit，而不是每个点一次
+            t = (sent + np.arange(batch)) / SAMPLE_RATE
+            samples = 0.6 * np.sin(2 * np.pi * 3 * t) + 0.2 * np.sin(2 * np.pi * 50 * t) \
+                + rng.normal(0, 0.05, batch)
+            self.samples_ready.emit(samples)
+            sent += batch
+            # 按采样率补足时间（可被取消立即打断）
+            self.token.wait(max(start + sent / SAMPLE_RATE - time.perf_counter(), 0))
+
+    def stop(self):
+        self.token.cancel()
+        self.wait()
+
+
+# -------------------------- 2. 主窗口类 --------------------------
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.worker = None
+        self.initUI()
+        # 每 500 ms 刷新一次统计
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(500)
+        self.stats_timer.timeout.connect(self.update_stats)
+
+    def initUI(self):
+        self.setWindowTitle("实时曲线（按像素列抽取）示例")
+        self.resize(800, 360)
+
+        # 保留 50 秒历史；每 20 个采样一列，20 kHz 时每秒画 1000 列
+        self.plot = StreamPlot(capacity=SAMPLE_RATE * 50, samples_per_column=20)
+        self.status_label = QLabel("就绪状态")
+        self.start_btn = QPushButton("开始采集")
+        self.stop_btn = QPushButton("停止")
+        self.start_btn.clicked.connect(self.on_start_clicked)
+        self.stop_btn.clicked.connect(self.on_stop_clicked)
+        self.stop_btn.setEnabled(False)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.addWidget(self.plot, 1)
+        layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.stop_btn)
+        layout.addLayout(btn_layout)
+
+    @Slot()
+    def on_start_clicked(self):
+        self.worker = SignalWorker()
+        self.worker.samples_ready.connect(self.plot.append)
+        self.start_time = time.perf_counter()
+        self.start_count = self.plot.sample_count
+        self.start_paints = self.plot.paint_count
+        self.worker.start()
+        self.stats_timer.start()
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+
+    @Slot()
+    def on_stop_clicked(self):
+        self.worker.stop()
+        self.worker = None
+        self.stats_timer.stop()
+        self.update_stats()
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+    @Slot()
+    def update_stats(self):
+        elapsed = time.perf_counter() - self.start_time
+        rate = (self.plot.sample_count - self.start_count) / elapsed
+        paints = (self.plot.paint_count - self.start_paints) / elapsed
+        self.status_label.setText(f"{rate:,.0f} 点/秒，重绘 {paints:.0f} 次/秒，"
+                                  f"最近一次绘制 {self.plot.last_paint_ms:.2f} ms")
+
+    def closeEvent(self, event):
+        if self.worker is not None:
+            self.worker.stop()
+        event.accept()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
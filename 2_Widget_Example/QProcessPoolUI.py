@@ -0,0 +1,87 @@
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
+                               QProgressBar, QPushButton, QVBoxLayout, QLabel)
+from PySide6.QtCore import Qt, Slot
+import sys
+
+from process_task import ProcessTask, count_primes, make_chunks
+
+
+# -------------------------- 主窗口类（与 QThreadUI2.py 相同的界面，任务换成进程池执行）--------------------------
+class MainWindow(QMainWindow):
+    LIMIT = 3_000_000  # 统计 [0, LIMIT) 内的素数：纯 Python CPU 密集计算
+
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+        self.init_task()
+
+    def initUI(self):
+        self.setWindowTitle("进程池执行 CPU 密集任务示例")
+        self.resize(400, 200)
+
+        # UI 控件（与 QThreadUI2.py 一致）
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.status_label = QLabel("就绪状态")
+        self.start_btn = QPushButton("启动后台任务")
+        self.stop_btn = QPushButton("取消任务")
+        self.start_btn.clicked.connect(self.on_start_clicked)
+        self.stop_btn.clicked.connect(self.on_stop_clicked)
+        self.stop_btn.setEnabled(False)
+
+        # 布局
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.start_btn)
+        layout.addWidget(self.stop_btn)
+
+    def init_task(self):
+        """任务对象：信号与 BackgroundTask 相同，计算在子进程中进行（不受 GIL 限制）"""
+        self.background_task = ProcessTask(count_primes, make_chunks(self.LIMIT, 64), parent=self)
+        self.background_task.progress_updated.connect(self.update_progress_bar)
+        self.background_task.results_ready.connect(self.on_results_ready)
+        self.background_task.task_finished.connect(self.on_task_finished)
+
+    @Slot()
+    def on_start_clicked(self):
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"任务执行中...（{self.background_task.max_workers} 个进程）")
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.background_task.start_task.emit()
+
+    @Slot()
+    def on_stop_clicked(self):
+        self.background_task.stop_task()
+        self.status_label.setText("正在取消任务...")
+        self.stop_btn.setEnabled(False)
+
+    @Slot(int)
+    def update_progress_bar(self, progress):
+        self.progress_bar.setValue(progress)
+        self.status_label.setText(f"进度：{progress}%")
+
+    @Slot(object)
+    def on_results_ready(self, counts):
+        self.setWindowTitle(f"[0, {self.LIMIT:,}) 内共有 {sum(counts):,} 个素数")
+
+    @Slot(str)
+    def on_task_finished(self, result):
+        self.status_label.setText(result)
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        """窗口关闭时取消任务并关闭进程池"""
+        self.background_task.shutdown()
+        event.accept()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
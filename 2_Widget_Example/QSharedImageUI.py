@@ -0,0 +1,179 @@
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
+                               QProgressBar, QPushButton, QVBoxLayout, QHBoxLayout, QLabel)
+from PySide6.QtCore import QObject, QThread, Signal, Qt, Slot
+from PySide6.QtGui import QPainter
+import sys
+import time
+
+import numpy as np
+
+from cancel_token import CancelToken
+from progress_throttle import ThrottledProgress
+from shared_frames import FrameRing
+
+WIDTH, HEIGHT = 1280, 720
+FRAMES = 600
+
+
+# -------------------------- 1. 任务逻辑类（BackgroundTask 的扩展：把每一帧画进共享内存槽）--------------------------
+class FrameTask(QObject):
+    progress_updated = Signal(int)  # 进度信号（0-100）
+    task_finished = Signal(str)     # 完成信号（返回结果）
+    frame_ready = Signal(int)       # 新的一帧：只发槽号，像素留在共享内存里
+    start_task = Signal()           # 触发任务启动的信号
+
+    def __init__(self, ring, parent=None):
+        super().__init__(parent)
+        self.ring = ring
+        self.token = CancelToken()
+
+    @Slot()
+    def run_task(self):
+        """运行在子线程：界面还没用完旧帧时 acquire 会等待（不会越画越多）"""
+        self.token = CancelToken()
+        token = self.token
+        y, x = np.mgrid[0:HEIGHT, 0:WIDTH].astype(np.uint16)
+        start = time.perf_counter()
+        with ThrottledProgress(self.progress_updated, max_rate=30) as progress:
+            for frame in range(FRAMES):
+                slot = None
+                while slot is None and not token.cancelled:
+                    slot = self.ring.acquire(timeout=0.05)
+                if slot is None:
+                    break
+                # 直接写共享内存（B, G, R, A），不需要再复制一份给界面
+                pixels = self.ring.array(slot)
+                pixels[..., 0] = (x + frame * 4).astype(np.uint8)
+                pixels[..., 1] = (y + frame * 2).astype(np.uint8)
+                pixels[..., 2] = ((x ^ y) + frame).astype(np.uint8)
+                pixels[..., 3] = 255
+                del pixels
+                self.frame_ready.emit(slot)
+                progress.update((frame + 1) * 100 // FRAMES)
+        if token.cancelled:
+            self.task_finished.emit("任务已取消！")
+            return
+        fps = FRAMES / (time.perf_counter() - start)
+        self.task_finished.emit(f"后台任务执行完成！（{FRAMES} 帧，{fps:.0f} 帧/秒）")
+
+    def stop_task(self):
+        self.token.cancel()
+
+
+# -------------------------- 2. 显示控件（直接画共享内存中的 QImage）--------------------------
+class ImageView(QWidget):
+    def __init__(self, ring, parent=None):
+        super().__init__(parent)
+        self.ring = ring
+        self.image = None
+        self.slot = None
+        self.setMinimumSize(320, 180)
+
+    @Slot(int)
+    def show_frame(self, slot):
+        """换成新帧后把旧帧的槽还给生产者"""
+        if not self.ring.slots:  # 共享内存已关闭（窗口关闭后仍在排队的帧）
+            return
+        old = self.slot
+        self.image, self.slot = self.ring.image(slot), slot
+        if old is not None:
+            self.ring.release(old)
+        self.update()
+
+    def clear(self):
+        self.image = None
+        if self.slot is not None:
+            self.ring.release(self.slot)
+            self.slot = None
+        self.update()
+
+    def paintEvent(self, event):
+        if self.image is not None:
+            painter = QPainter(self)
+            painter.drawImage(self.rect(), self.image)
+
+
+# -------------------------- 3. 主窗口类 --------------------------
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        # 三缓冲：一个正在显示、一个等待显示、一个正在画
+        self.ring = FrameRing(WIDTH, HEIGHT, slots=3)
+        self.initUI()
+        self.init_thread_and_task()
+
+    def initUI(self):
+        self.setWindowTitle("共享内存图像（零拷贝）示例")
+        self.resize(660, 460)
+
+        self.view = ImageView(self.ring)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.status_label = QLabel("就绪状态")
+        self.start_btn = QPushButton("启动后台任务")
+        self.stop_btn = QPushButton("取消任务")
+        self.start_btn.clicked.connect(self.on_start_clicked)
+        self.stop_btn.clicked.connect(self.on_stop_clicked)
+        self.stop_btn.setEnabled(False)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.addWidget(self.view, 1)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.stop_btn)
+        layout.addLayout(btn_layout)
+
+    def init_thread_and_task(self):
+        self.frame_task = FrameTask(self.ring)
+        self.worker_thread = QThread(self)
+        self.frame_task.moveToThread(self.worker_thread)
+        self.frame_task.start_task.connect(self.frame_task.run_task)
+        self.frame_task.frame_ready.connect(self.view.show_frame)
+        self.frame_task.progress_updated.connect(self.update_progress_bar)
+        self.frame_task.task_finished.connect(self.on_task_finished)
+        self.worker_thread.start()
+
+    @Slot()
+    def on_start_clicked(self):
+        self.progress_bar.setValue(0)
+        self.status_label.setText("任务执行中...")
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.frame_task.start_task.emit()
+
+    @Slot()
+    def on_stop_clicked(self):
+        self.frame_task.stop_task()
+        self.status_label.setText("正在取消任务...")
+        self.stop_btn.setEnabled(False)
+
+    @Slot(int)
+    def update_progress_bar(self, progress):
+        self.progress_bar.setValue(progress)
+        self.status_label.setText(f"进度：{progress}%")
+
+    @Slot(str)
+    def on_task_finished(self, result):
+        self.status_label.setText(result)
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        """停止任务、等线程退出，释放所有指向共享内存的 QImage 后再关闭共享内存"""
+        self.frame_task.stop_task()
+        self.worker_thread.quit()
+        self.worker_thread.wait(1000)
+        self.view.clear()
+        self.ring.close()
+        event.accept()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
@@ -0,0 +1,166 @@
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QTableView,
+                               QProgressBar, QPushButton, QVBoxLayout, QHBoxLayout, QLabel)
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QThread, QTimer, Qt, Signal, Slot
+import sys
+
+from cancel_token import TaskCancelled
+from result_channel import ResultChannel
+
+TOTAL_ROWS = 500_000  # 后台任务产生的结果行数
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+
+
+# -------------------------- 1. 任务逻辑类（QObject + moveToThread，把结果行写进 ResultChannel）--------------------------
+class StreamTask(QObject):
+    start_task = Signal(object)  # 触发任务启动的信号（参数：ResultChannel）
+
+    @Slot(object)
+    def run_task(self, channel):
+        """运行在子线程：逐行产生结果；界面来不及显示时 put 会阻塞，内存不会无限增长"""
+        try:
+            for i in range(TOTAL_ROWS):
+                value = i * i % 9973  # 模拟一次很小的计算
+                channel.put((i, value))  # 产生一行结果
+        except TaskCancelled:
+            pass
+        finally:
+            channel.close()
+
+
+# -------------------------- 2. 结果模型（每次追加一整块行）--------------------------
+class ResultsModel(QAbstractTableModel):
+    HEADERS = ("序号", "结果")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == _HORIZONTAL:
+            return self.HEADERS[section]
+        return None
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+    @Slot(object)
+    def append_rows(self, rows):
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+
+# -------------------------- 3. 主窗口类 --------------------------
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.channel = None
+        self.initUI()
+        self.init_thread_and_task()
+        # 每 100 ms 刷新一次队列深度 / 生产者阻塞时间
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(100)
+        self.stats_timer.timeout.connect(self.update_stats)
+
+    def initUI(self):
+        self.setWindowTitle("有界结果流（背压）示例")
+        self.resize(500, 500)
+
+        self.model = ResultsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, TOTAL_ROWS)
+        self.status_label = QLabel("就绪状态")
+        self.start_btn = QPushButton("启动后台任务")
+        self.stop_btn = QPushButton("取消任务")
+        self.start_btn.clicked.connect(self.on_start_clicked)
+        self.stop_btn.clicked.connect(self.on_stop_clicked)
+        self.stop_btn.setEnabled(False)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.addWidget(self.table)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.stop_btn)
+        layout.addLayout(btn_layout)
+
+    def init_thread_and_task(self):
+        self.stream_task = StreamTask()
+        self.worker_thread = QThread(self)
+        self.stream_task.moveToThread(self.worker_thread)
+        self.stream_task.start_task.connect(self.stream_task.run_task)
+        self.worker_thread.start()
+
+    @Slot()
+    def on_start_clicked(self):
+        self.model.clear()
+        self.progress_bar.setValue(0)
+        self.status_label.setText("任务执行中...")
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        # 每次任务一个新的通道：最多排队 8 块 × 1000 行，每轮事件循环最多取 8 ms
+        self.channel = ResultChannel(max_chunks=8, chunk_size=1000, budget_ms=8, parent=self)
+        self.channel.chunk_ready.connect(self.model.append_rows)
+        self.channel.finished.connect(self.on_task_finished)
+        self.stats_timer.start()
+        self.stream_task.start_task.emit(self.channel)
+
+    @Slot()
+    def on_stop_clicked(self):
+        self.channel.cancel()
+        self.status_label.setText("正在取消任务...")
+        self.stop_btn.setEnabled(False)
+
+    @Slot()
+    def update_stats(self):
+        channel = self.channel
+        self.progress_bar.setValue(channel.rows_delivered)
+        self.status_label.setText(f"已显示 {channel.rows_delivered} 行，队列 {channel.depth}/{channel.max_chunks} 块，"
+                                  f"生产者阻塞 {channel.stalls} 次 / {channel.stall_time:.2f} 秒")
+
+    @Slot()
+    def on_task_finished(self):
+        self.stats_timer.stop()
+        self.update_stats()
+        channel = self.channel
+        result = "后台任务执行完成！" if channel.rows_delivered == TOTAL_ROWS else "任务已取消！"
+        self.status_label.setText(f"{result}（{channel.rows_delivered} 行，队列最多 {channel.max_depth} 块，"
+                                  f"生产者阻塞 {channel.stall_time:.2f} 秒）")
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        """窗口关闭时取消任务（解除 put 的阻塞）并等待线程退出"""
+        if self.channel is not None:
+            self.channel.cancel()
+        self.worker_thread.quit()
+        self.worker_thread.wait(1000)
+        event.accept()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
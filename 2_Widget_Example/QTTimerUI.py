@@ -3,12 +3,17 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
 from PySide6.QtCore import QTimer, Qt, Slot
 import sys
 
+from frame_scheduler import FrameScheduler
+from progress_tracker import ProgressTracker
+
+TOTAL_STEPS = 100_000  # 每个阶段拆成的小步数（每步只需几微秒）
+
 # -------------------------- 主窗口类（定时器+UI+任务逻辑一体化）--------------------------
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.initUI()
-        self.init_timer()  # 初始化定时器
+        self.init_scheduler()  # 初始化帧调度器
 
     def initUI(self):
         self.setWindowTitle("定时器实现后台更新 UI 示例")
@@ -18,8 +23,12 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)  # 进度条范围 0-100
         self.status_label = QLabel("就绪状态")
+        self.timing_label = QLabel()  # 任务结束后显示各阶段耗时
         self.start_btn = QPushButton("启动后台任务")
         self.start_btn.clicked.connect(self.start_task)  # 绑定按钮点击事件
+        self.cancel_btn = QPushButton("取消任务")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_task)
 
         # 布局
         central_widget = QWidget()
@@ -27,46 +36,104 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.timing_label)
         layout.addWidget(self.start_btn)
+        layout.addWidget(self.cancel_btn)
 
-    def init_timer(self):
-        # 创建定时器（核心组件）
-        self.task_timer = QTimer(self)
-        # 设置定时器触发间隔：50ms（和原线程版 time.sleep(0.05) 一致）
-        self.task_timer.setInterval(50)
-        # 定时器触发时，执行任务的一小步
-        self.task_timer.timeout.connect(self.do_task_step)
-        # 初始化进度计数器（记录当前进度）
-        self.current_progress = 0
+    def init_scheduler(self):
+        # 创建帧调度器（核心组件）：原来每 50ms 只执行一步，现在每帧（16ms）在预算内执行尽可能多的步
+        self.scheduler = FrameScheduler(frame_ms=16, budget_ms=8, parent=self)
+        self.scheduler.task_finished.connect(self.on_task_finished)
+        self.scheduler.task_cancelled.connect(self.on_task_cancelled)
+        self.scheduler.task_failed.connect(self.on_task_failed)
+        self.task = None  # 当前任务（FrameTask）
+        self.tracker = None  # 当前任务的进度（ProgressTracker）
+        # 进度：每帧读一次快照，而不是每个 yield 都更新控件
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(16)
+        self.poll_timer.timeout.connect(self.update_progress)
 
     def start_task(self):
-        # 1. 重置状态（进度、UI、定时器）
-        self.current_progress = 0
+        # 1. 重置状态（进度、UI）
         self.progress_bar.setValue(0)
         self.status_label.setText("任务执行中...")
+        self.timing_label.clear()
         self.start_btn.setEnabled(False)  # 禁用按钮，防止重复启动
+        self.cancel_btn.setEnabled(True)
+
+        # 2. 声明阶段和权重：原来按 30% / 70% 划分，timing_label 实测两个阶段耗时差不多，改为 1:1
+        self.tracker = ProgressTracker("后台任务")
+        self.tracker.add_stage("生成数据", weight=1, total=TOTAL_STEPS)
+        self.tracker.add_stage("统计", weight=1, total=TOTAL_STEPS)
+
+        # 3. 交给调度器（开始“分段执行”任务）
+        self.task = self.scheduler.spawn(background_job(self.tracker))
+        self.poll_timer.start()
 
-        # 2. 启动定时器（开始“分段执行”任务）
-        self.task_timer.start()
+    def cancel_task(self):
+        if self.task is not None:
+            self.task.cancel()
 
     @Slot()
-    def do_task_step(self):
-        """定时器每次触发时执行的“任务小步”（运行在主线程，但不阻塞UI）"""
-        # 1. 执行当前步任务（原线程版的耗时操作，这里拆成101步，每步50ms）
-        # （如果是真实耗时任务，这里写单次计算/单次网络请求等小粒度操作）
-
-        # 2. 进度推进
-        self.current_progress += 1
-
-        # 3. 更新UI（直接更新，因为定时器回调本身就在主线程）
-        self.progress_bar.setValue(self.current_progress)
-        self.status_label.setText(f"进度：{self.current_progress}%")
-
-        # 4. 任务完成判断（进度达到100%时停止定时器）
-        if self.current_progress >= 100:
-            self.task_timer.stop()  # 停止定时器，结束任务
-            self.status_label.setText("后台任务执行完成！")
-            self.start_btn.setEnabled(True)  # 恢复按钮可用
+    def update_progress(self):
+        """更新UI（直接更新，因为调度器本身就在主线程）"""
+        snapshot = self.tracker.snapshot()
+        self.progress_bar.setValue(snapshot.percent)
+        self.status_label.setText(f"{snapshot.text()}（每帧预算 {self.scheduler.budget_ms:.1f} ms）")
+
+    @Slot(int)
+    def on_task_finished(self, task_id):
+        self.update_progress()
+        self.status_label.setText(f"后台任务执行完成！结果 {self.task.result}，"
+                                  f"占用主线程 {self.task.cpu_time * 1000:.0f} ms")
+        self.reset_buttons()
+
+    @Slot(int)
+    def on_task_cancelled(self, task_id):
+        self.status_label.setText("任务已取消！")
+        self.reset_buttons()
+
+    @Slot(int, str)
+    def on_task_failed(self, task_id, error):
+        # error 是调度器捕获的 traceback，状态栏只显示最后一行（异常类型和信息）
+        self.status_label.setText(f"任务失败：{error.strip().splitlines()[-1]}")
+        self.reset_buttons()
+
+    def reset_buttons(self):
+        self.poll_timer.stop()
+        self.timing_label.setText(self.tracker.summary())
+        self.start_btn.setEnabled(True)  # 恢复按钮可用
+        self.cancel_btn.setEnabled(False)
+
+
+# -------------------------- 任务（生成器：每个 yield 是一个暂停点，由调度器在时间预算内恢复执行）--------------------------
+# 进度记在 ProgressTracker 的阶段里（界面每帧轮询），yield 只用来暂停；
+# 取消时生成器被 close()，退出 with 的阶段记为未完成
+def generate_data(stage):
+    """阶段 1：生成数据"""
+    data = []
+    with stage:
+        for i in range(stage.total):
+            data.append(i * i % 1000)  # 模拟一次很小的计算
+            stage.advance()
+            yield  # 暂停
+    return data
+
+
+def background_job(tracker):
+    # 多阶段任务直接按顺序写，不用手写 current_progress 之类的状态机
+    prepare, summarize = tracker.children
+    with tracker:
+        data = yield from generate_data(prepare)
+        # 阶段 2：统计
+        acc = 0
+        with summarize:
+            for value in data:
+                acc += value
+                summarize.advance()
+                yield
+    return acc
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
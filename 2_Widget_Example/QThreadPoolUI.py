@@ -0,0 +1,100 @@
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
+                               QProgressBar, QPushButton, QVBoxLayout, QLabel)
+from PySide6.QtCore import Qt, Slot
+import sys
+import time
+
+from task_executor import TaskExecutor
+
+
+# -------------------------- 1. 任务函数（运行在线程池中，不碰 UI!）--------------------------
+def sample_job(handle, steps):
+    """模拟一个短任务：分 steps 步执行，每步检查取消并报告进度"""
+    for i in range(steps):
+        # 模拟耗时操作（I/O 等待）；用 token.wait 代替 time.sleep，取消时立即返回
+        if handle.token.wait(0.002):
+            return None
+        handle.report_progress((i + 1) * 100 // steps)
+    return handle.id
+
+
+# -------------------------- 2. 主窗口类（提交大量任务，汇总进度）--------------------------
+class MainWindow(QMainWindow):
+    JOB_COUNT = 1000
+
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+        # QThreadPool 执行器：同时最多运行 CPU 核数个任务，其余按优先级排队
+        self.executor = TaskExecutor(parent=self)
+        self.executor.task_finished.connect(self.on_task_done)
+        self.executor.task_cancelled.connect(self.on_task_done)
+        self.executor.task_failed.connect(self.on_task_done)
+        self.executor.all_finished.connect(self.on_all_finished)
+
+    def initUI(self):
+        self.setWindowTitle("QThreadPool 多任务执行示例")
+        self.resize(400, 200)
+
+        # UI 控件
+        self.progress_bar = QProgressBar()
+        self.status_label = QLabel("就绪状态")
+        self.start_btn = QPushButton(f"提交 {self.JOB_COUNT} 个任务")
+        self.stop_btn = QPushButton("全部取消")
+        self.start_btn.clicked.connect(self.on_start_clicked)
+        self.stop_btn.clicked.connect(self.on_stop_clicked)
+        self.stop_btn.setEnabled(False)
+
+        # 布局
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.start_btn)
+        layout.addWidget(self.stop_btn)
+
+    @Slot()
+    def on_start_clicked(self):
+        """一次提交全部任务：每 10 个任务中有 1 个高优先级任务，会被优先执行"""
+        self.done_count = 0
+        self.start_time = time.perf_counter()
+        self.progress_bar.setRange(0, self.JOB_COUNT)
+        self.progress_bar.setValue(0)
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        for i in range(self.JOB_COUNT):
+            self.executor.submit(sample_job, 10, priority=1 if i % 10 == 0 else 0)
+        self.status_label.setText(f"执行中...（{self.executor.max_workers} 个线程）")
+
+    @Slot()
+    def on_stop_clicked(self):
+        self.executor.cancel_all()
+        self.status_label.setText("正在取消任务...")
+        self.stop_btn.setEnabled(False)
+
+    @Slot()
+    def on_task_done(self, task_id, *args):
+        """任意一个任务结束（完成 / 取消 / 失败），运行在主线程"""
+        self.done_count += 1
+        self.progress_bar.setValue(self.done_count)
+
+    @Slot()
+    def on_all_finished(self):
+        elapsed = time.perf_counter() - self.start_time
+        self.status_label.setText(f"全部结束：{self.done_count} 个任务，用时 {elapsed:.2f} 秒")
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        """窗口关闭时取消所有任务并等待线程池退出"""
+        self.executor.cancel_all()
+        self.executor.wait_for_done(1000)
+        event.accept()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
@@ -1,25 +1,39 @@
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
                                QProgressBar, QPushButton, QVBoxLayout, QLabel)
-from PySide6.QtCore import QThread, Signal, Qt, Slot
+from PySide6.QtCore import QTimer, Qt, Slot
 import sys
-import time
 
+from progress_tracker import ProgressTracker
+from warm_worker import WarmWorker
 
-# -------------------------- 1. 后台线程类（执行耗时任务，不碰 UI! QThread里改动UI会让程序崩溃）--------------------------
-class BackgroundWorker(QThread):
-    # 定义信号：用于向主线程发送进度更新（int 类型参数）和任务完成信号
-    progress_updated = Signal(int)  # 进度信号（0-100）
-    task_finished = Signal(str)  # 完成信号（返回结果）
 
-    def run(self):
-        total = 100  # 模拟任务总量
-        for i in range(total + 1):
-            # 模拟耗时操作（如网络请求、数据处理）
-            time.sleep(0.05)
-            # 发送进度信号（通过信号间接通知主线程更新 UI）
-            self.progress_updated.emit(i)
-        # 任务完成后发送结果信号
-        self.task_finished.emit("后台任务执行完成！")
+# -------------------------- 1. 后台任务（在常驻后台线程中执行，不碰 UI! QThread里改动UI会让程序崩溃）--------------------------
+class BackgroundWorker:
+    """原来的 BackgroundWorker 不再是 QThread：run(request) 交给 WarmWorker 在常驻线程上执行
+
+    进度仍然走 progress_updated 信号：request.report_progress 经 ThrottledProgress 节流
+    （每秒最多 30 次，最后一个值一定送达）；各阶段的明细记在 tracker 里，界面按帧率轮询
+    """
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def __call__(self, request):
+        self.run(request)
+
+    def run(self, request):
+        # 模拟任务：按 tracker 声明的阶段依次执行大量很小的步骤
+        with self.tracker:
+            for stage in self.tracker.children:
+                with stage:
+                    for i in range(stage.total):
+                        if i % 10_000 == 0:
+                            # 又点了一次按钮：放弃这次（阶段记为未完成），执行最新的请求
+                            request.token.raise_if_cancelled()
+                            # 发送进度信号（节流后通过信号间接通知主线程更新 UI）
+                            request.report_progress(int(self.tracker.fraction * 100))
+                        stage.advance()
+        request.report_progress(100)
 
 
 # -------------------------- 2. 主窗口类（UI 线程，接收信号并更新 UI）--------------------------
@@ -27,7 +41,15 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.initUI()
-        self.worker = None  # 存储后台线程实例
+        # 常驻后台线程：只创建一次，每次点击把请求排到这个线程上
+        self.worker = WarmWorker()
+        self.worker.progress_updated.connect(self.update_progress_bar)
+        self.worker.task_finished.connect(self.on_task_finished)
+        # 阶段 / 速度 / 剩余时间：主线程每帧读一次当前请求的进度快照
+        self.tracker = None
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(16)
+        self.poll_timer.timeout.connect(self.update_status)
 
     def initUI(self):
         self.setWindowTitle("后台更新 UI 示例")
@@ -37,6 +59,8 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)  # 进度条范围 0-100
         self.status_label = QLabel("就绪状态")
+        self.stats_label = QLabel()
+        self.timing_label = QLabel()  # 任务结束后显示各阶段耗时
         self.start_btn = QPushButton("启动后台任务")
         self.start_btn.clicked.connect(self.start_background_task)  # 绑定按钮点击事件
 
@@ -46,34 +70,51 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.stats_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.timing_label)
         layout.addWidget(self.start_btn)
 
     def start_background_task(self):
         # 1. 重置 UI 状态
         self.progress_bar.setValue(0)
         self.status_label.setText("任务执行中...")
-        self.start_btn.setEnabled(False)  # 禁用按钮，防止重复点击
+        self.timing_label.clear()
 
-        # 2. 创建后台线程实例，绑定信号与槽
-        self.worker = BackgroundWorker()
-        self.worker.progress_updated.connect(self.update_progress_bar)
-        self.worker.task_finished.connect(self.on_task_finished)
-        # 线程结束后自动回收（避免内存泄漏）
-        self.worker.finished.connect(self.worker.deleteLater)
+        # 2. 声明阶段和权重（权重 ≈ 预计耗时占比），每个请求一个新的 tracker
+        self.tracker = ProgressTracker("后台任务")
+        self.tracker.add_stage("读取", weight=1, total=400_000)
+        self.tracker.add_stage("处理", weight=4, total=1_600_000)
 
-        # 3. 启动线程（调用 run 方法）
-        self.worker.start()
+        # 3. 提交到常驻线程（不新建 QThread）：重复点击时只执行最新的请求，旧请求被取代
+        self.worker.submit(BackgroundWorker(self.tracker))
+        self.poll_timer.start()
 
-    @Slot()
+    @Slot(int)
     def update_progress_bar(self, progress):
         """接收进度信号，更新进度条（运行在主线程）"""
         self.progress_bar.setValue(progress)
-        self.status_label.setText(f"进度：{progress}%")
+
+    @Slot()
+    def update_status(self):
+        """读取进度快照，更新阶段 / 速度 / 剩余时间（运行在主线程，每帧一次）"""
+        self.status_label.setText(self.tracker.snapshot().text())
+
     @Slot()
     def on_task_finished(self, result):
         """接收完成信号，更新状态（运行在主线程）"""
+        if self.tracker.finished_at is None:
+            return  # 被取代的旧请求结束了，最新的请求还在排队 / 运行
+        self.poll_timer.stop()
         self.status_label.setText(result)
-        self.start_btn.setEnabled(True)  # 恢复按钮可用
+        self.timing_label.setText(self.tracker.summary())
+        stats = self.worker.stats
+        self.stats_label.setText(f"请求 {stats.requests} 次，合并 {stats.collapsed + stats.interrupted} 次，"
+                                 f"少建线程 {stats.threads_avoided} 个，"
+                                 f"平均排队 {stats.mean_wait * 1000:.1f} ms")
+
+    def closeEvent(self, event):
+        self.worker.stop()  # 取消当前请求并结束常驻线程
+        event.accept()
 
 
 if __name__ == "__main__":
@@ -1,44 +1,59 @@
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
                                QProgressBar, QPushButton, QVBoxLayout, QLabel)
-from PySide6.QtCore import QObject, QThread, Signal, Qt, Slot
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Qt, Slot
 import sys
-import time
+
+from cancel_token import CancelToken, TaskCancelled
+from progress_throttle import ThrottledProgress
+from progress_tracker import ProgressTracker
 
 
 # -------------------------- 1. 任务逻辑类（封装耗时操作，继承 QObject）--------------------------
 # QObject + moveToThread
 class BackgroundTask(QObject):
-    # 定义信号：与原版本一致（进度更新、任务完成）
-    progress_updated = Signal(int)  # 进度信号（0-100）
+    # 定义信号：与原版本一致（进度更新、任务完成）；阶段 / 速度 / 剩余时间由主线程按帧率读取 self.tracker
+    progress_updated = Signal(int)  # 进度信号（0-100，经 ThrottledProgress 节流）
     task_finished = Signal(str)  # 完成信号（返回结果）
     # 控制信号：用于外部触发任务开始
     start_task = Signal()  # 触发任务启动的信号
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.is_running = True  # 任务运行标记（用于优雅退出）
+        # 取消标记（线程安全，cancel() 立即唤醒 token.wait 中的等待）；每次任务由主线程在 start_task 前换新，
+        # 这样 start_task 发出后、run_task 还没开始执行时点的取消也不会丢
+        self.token = CancelToken()
+        self.tracker = None  # 当前任务的 ProgressTracker（主线程在 start_task 前设置）
 
     @Slot()
     def run_task(self):
         """耗时任务的核心逻辑（被 start_task 信号触发，运行在子线程）"""
-        self.is_running = True
-        total = 100  # 模拟任务总量
-        for i in range(total + 1):
-            if not self.is_running:  # 检查是否需要退出
-                self.task_finished.emit("任务已取消！")
-                return
-
-            # 模拟耗时操作（如网络请求、数据处理）
-            time.sleep(0.05)
-            # 发送进度信号（间接通知主线程更新 UI）
-            self.progress_updated.emit(i)
-
+        token = self.token
+        tracker = self.tracker
+        # 模拟任务：两个阶段，都是大量很小的步骤；每步只做一次整数加法记录到 tracker，
+        # 每 1000 步换算一次总百分比交给节流器（每秒最多发 30 次，退出 with 时补发最后一个值）
+        # 退出 with 时记录阶段结束时间；因取消退出的阶段不算完成
+        progress = ThrottledProgress(self.progress_updated, max_rate=30)
+        try:
+            with progress, tracker:
+                for stage in tracker.children:
+                    with stage:
+                        for i in range(stage.total):
+                            token.raise_if_cancelled()  # 检查是否需要退出
+                            stage.advance()
+                            if i % 1000 == 0:
+                                progress.update(int(tracker.fraction * 100))
+                progress.update(100)
+        except TaskCancelled:
+            latency = token.stopped() * 1000
+            self.task_finished.emit(f"任务已取消！（取消延迟 {latency:.2f} ms）")
+            return
         # 任务完成后发送结果信号
-        self.task_finished.emit("后台任务执行完成！")
+        self.task_finished.emit(f"后台任务执行完成！（用时 {tracker.elapsed:.2f} s，发送 {progress.emitted} 次，"
+                                f"省略 {progress.suppressed} 次）")
 
     def stop_task(self):
         """停止任务（优雅退出，运行在主线程）"""
-        self.is_running = False
+        self.token.cancel()
 
 
 # -------------------------- 2. 主窗口类（UI 线程，管理线程和任务对象）--------------------------
@@ -56,6 +71,7 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.status_label = QLabel("就绪状态")
+        self.timing_label = QLabel()  # 任务结束后显示各阶段耗时
         self.start_btn = QPushButton("启动后台任务")
         self.stop_btn = QPushButton("取消任务")  # 新增取消按钮
         self.start_btn.clicked.connect(self.on_start_clicked)
@@ -68,6 +84,7 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.status_label, alignment=Qt.AlignCenter)
+        layout.addWidget(self.timing_label)
         # 按钮横向布局
         btn_layout = QVBoxLayout()
         btn_layout.addWidget(self.start_btn)
@@ -92,6 +109,10 @@ class MainWindow(QMainWindow):
         # - 任务对象：进度/完成信号 → 主线程槽函数（更新 UI）
         self.background_task.progress_updated.connect(self.update_progress_bar)
         self.background_task.task_finished.connect(self.on_task_finished)
+        # - 阶段 / 速度 / 剩余时间：主线程定时器按帧率读取 tracker 快照
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(16)
+        self.poll_timer.timeout.connect(self.update_status)
 
         # - 线程结束信号 → 线程自动回收（避免内存泄漏）
         self.worker_thread.finished.connect(self.worker_thread.deleteLater)
@@ -105,9 +126,18 @@ class MainWindow(QMainWindow):
         # 重置 UI 状态
         self.progress_bar.setValue(0)
         self.status_label.setText("任务执行中...")
+        self.timing_label.clear()
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
+        # 声明阶段和权重（权重 ≈ 预计耗时占比，决定进度条和剩余时间的准确度）
+        tracker = ProgressTracker("后台任务")
+        tracker.add_stage("准备", weight=1, total=500_000)
+        tracker.add_stage("计算", weight=3, total=1_500_000)
+        self.background_task.tracker = tracker
+        self.background_task.token = CancelToken()
+        self.poll_timer.start()
+
         # 触发任务开始（通过信号通知子线程执行 run_task）
         self.background_task.start_task.emit()
 
@@ -120,14 +150,20 @@ class MainWindow(QMainWindow):
 
     @Slot(int)
     def update_progress_bar(self, progress):
-        """接收进度信号，更新 UI（主线程执行）"""
+        """接收进度信号，更新进度条（主线程执行）"""
         self.progress_bar.setValue(progress)
-        self.status_label.setText(f"进度：{progress}%")
+
+    @Slot()
+    def update_status(self):
+        """读取进度快照，显示当前阶段、速度和剩余时间（主线程执行，每帧一次）"""
+        self.status_label.setText(self.background_task.tracker.snapshot().text())
 
     @Slot(str)
     def on_task_finished(self, result):
         """接收完成信号，恢复 UI 状态（主线程执行）"""
+        self.poll_timer.stop()
         self.status_label.setText(result)
+        self.timing_label.setText(self.background_task.tracker.summary())
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
 
@@ -0,0 +1,135 @@
+"""I/O 密集任务：每个任务一个线程（阻塞 socket）vs Qt 事件循环上的 asyncio 协程
+
+用法：python bench_asyncio.py [并发任务数，默认 500] [每个任务的往返次数，默认 20]
+本地 echo 服务器运行在独立子进程中（代替真实的远端服务，每次回显前等待 5 ms 模拟网络延迟）。
+统计总耗时、使用的线程数，以及主线程 10 ms 定时器间隔的 p99 / 最大值（界面是否卡顿）。
+"""
+import asyncio
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QObject, QTimer, Signal
+
+from qt_asyncio import run
+
+LINE = b"x" * 100 + b"\n"
+LATENCY = 0.005
+
+
+async def _echo(reader, writer):
+    while data := await reader.readline():
+        await asyncio.sleep(LATENCY)
+        writer.write(data)
+        await writer.drain()
+    writer.close()
+
+
+async def _serve(port_queue):
+    server = await asyncio.start_server(_echo, "127.0.0.1", 0, backlog=4096)
+    port_queue.put(server.sockets[0].getsockname()[1])
+    await server.serve_forever()
+
+
+def _server_main(port_queue):
+    asyncio.run(_serve(port_queue))
+
+
+def start_echo_server():
+    """在子进程中启动 echo 服务器（不和客户端争抢 GIL），返回 (进程, 端口)"""
+    context = multiprocessing.get_context("spawn")
+    port_queue = context.Queue()
+    process = context.Process(target=_server_main, args=(port_queue,), daemon=True)
+    process.start()
+    return process, port_queue.get()
+
+
+class UiProbe:
+    """主线程 10 ms 定时器，记录最大间隔"""
+
+    def __init__(self):
+        self.ticks = []
+        self._timer = QTimer()
+        self._timer.setInterval(10)
+        self._timer.timeout.connect(lambda: self.ticks.append(time.perf_counter()))
+        self._timer.start()
+
+    def gaps_ms(self):
+        """(p99, 最大值)"""
+        self._timer.stop()
+        gaps = sorted(b - a for a, b in zip(self.ticks, self.ticks[1:])) or [float("nan")]
+        return gaps[int(len(gaps) * 0.99) - 1] * 1000, gaps[-1] * 1000
+
+
+class _Done(QObject):
+    finished = Signal()
+
+
+def bench_threads(port, tasks, rounds):
+    def client():
+        with socket.create_connection(("127.0.0.1", port)) as sock:
+            stream = sock.makefile("rb")
+            for _ in range(rounds):
+                sock.sendall(LINE)
+                stream.readline()
+
+    done = _Done()
+    loop = QEventLoop()
+    done.finished.connect(loop.quit)
+    probe = UiProbe()
+    start = time.perf_counter()
+
+    def wait_all():
+        for thread in threads:
+            thread.join()
+        done.finished.emit()
+
+    threads = [threading.Thread(target=client) for _ in range(tasks)]
+    for thread in threads:
+        thread.start()
+    peak = threading.active_count()
+    threading.Thread(target=wait_all).start()
+    loop.exec()
+    return time.perf_counter() - start, peak, probe.gaps_ms()
+
+
+def bench_asyncio(port, tasks, rounds):
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for _ in range(rounds):
+            writer.write(LINE)
+            await writer.drain()
+            await reader.readline()
+        writer.close()
+        await writer.wait_closed()
+
+    async def main():
+        await asyncio.gather(*(client() for _ in range(tasks)))
+        return threading.active_count()
+
+    probe = UiProbe()
+    start = time.perf_counter()
+    peak = run(main())
+    return time.perf_counter() - start, peak, probe.gaps_ms()
+
+
+def main(tasks, rounds):
+    app = QCoreApplication(sys.argv[:1])
+    server, port = start_echo_server()
+    base = threading.active_count()
+    print(f"{tasks} 个任务 × {rounds} 次往返（服务器每次延迟 {LATENCY * 1000:.0f} ms）")
+    for label, bench in (("线程（每任务一个）", bench_threads), ("asyncio 协程", bench_asyncio)):
+        elapsed, peak, (p99, worst) = bench(port, tasks, rounds)
+        print(f"{label:<12}: {elapsed:6.2f} s  额外线程 {peak - base:>4}  "
+              f"主线程定时器间隔 p99 {p99:6.1f} ms / 最大 {worst:6.1f} ms")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,82 @@
+"""取消延迟：is_running 标记 + time.sleep vs CancelToken 可中断等待
+
+用法：python bench_cancel.py [次数，默认 200]
+后台线程循环“每步等待 50 ms”（与 QThreadUI2.py 原来的 time.sleep(0.05) 相同），
+主线程在随机时刻取消，统计从发出取消到后台线程真正停下的延迟；
+另测父标记取消后，等待在子标记上的子任务的停止延迟。
+"""
+import random
+import sys
+import threading
+import time
+
+from cancel_token import CancelToken
+
+STEP = 0.05
+
+
+class FlagTask:
+    """原写法：布尔标记 + time.sleep"""
+
+    def __init__(self):
+        self.is_running = True
+
+    def run(self, stopped):
+        while self.is_running:
+            time.sleep(STEP)
+        stopped.append(time.perf_counter())
+
+    def cancel(self):
+        self.is_running = False
+
+
+class TokenTask:
+    def __init__(self, token=None):
+        self.token = token or CancelToken()
+
+    def run(self, stopped):
+        while not self.token.wait(STEP):
+            pass
+        stopped.append(time.perf_counter())
+
+    def cancel(self):
+        self.token.cancel()
+
+
+def measure(make_task, count, cancel=None):
+    latencies = []
+    for _ in range(count):
+        task = make_task()
+        stopped = []
+        thread = threading.Thread(target=task.run, args=(stopped,))
+        thread.start()
+        time.sleep(random.uniform(0, STEP))
+        start = time.perf_counter()
+        (cancel or task.cancel)()
+        thread.join()
+        latencies.append((stopped[0] - start) * 1000)
+    latencies.sort()
+    return latencies
+
+
+def report(label, latencies):
+    print(f"{label:<26}: 中位数 {latencies[len(latencies) // 2]:7.3f} ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1]:7.3f} ms  最大 {latencies[-1]:7.3f} ms")
+
+
+def main(count):
+    random.seed(0)
+    report("is_running + time.sleep", measure(FlagTask, count))
+    report("CancelToken.wait", measure(TokenTask, count))
+    parent = [None]
+
+    def make_child_task():
+        parent[0] = CancelToken()
+        return TokenTask(parent[0].child().child())  # 孙子标记
+
+    report("父标记取消 → 孙子任务停下", measure(make_child_task, count,
+                                             cancel=lambda: parent[0].cancel()))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
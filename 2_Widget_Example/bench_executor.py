@@ -0,0 +1,55 @@
+"""TaskExecutor：1000 个短任务的吞吐与 CPU 利用率
+
+用法：python bench_executor.py [任务数，默认 1000]
+任务是会释放 GIL 的 numpy 计算（排序 + 矩阵乘），对比串行执行与线程池执行的总耗时，
+CPU 利用率 = 进程 CPU 时间 / (墙钟时间 × 核数)。
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QEventLoop
+
+from task_executor import TaskExecutor
+
+
+def numpy_job(handle, seed):
+    rng = np.random.default_rng(seed)
+    data = rng.random(20_000)
+    data.sort()
+    matrix = rng.random((60, 60))
+    return float((matrix @ matrix).trace() + data[0])
+
+
+def measure(label, run, cores):
+    wall, cpu = time.perf_counter(), time.process_time()
+    run()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(f"{label:<22}: {wall:6.2f} s   CPU 利用率 {cpu / wall / cores:6.1%}")
+    return wall
+
+
+def main(count):
+    app = QCoreApplication(sys.argv[:1])
+    executor = TaskExecutor()
+    cores = executor.max_workers
+    print(f"任务数 {count}，线程数 {cores}")
+
+    serial = measure("serial", lambda: [numpy_job(None, i) for i in range(count)], cores)
+
+    def pooled():
+        loop = QEventLoop()
+        executor.all_finished.connect(loop.quit)
+        for i in range(count):
+            executor.submit(numpy_job, i)
+        loop.exec()  # 主线程阻塞在事件循环里等待，不空转抢 CPU
+
+    pooled_time = measure("TaskExecutor", pooled, cores)
+    print(f"加速比 {serial / pooled_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
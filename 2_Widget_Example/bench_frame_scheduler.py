@@ -0,0 +1,106 @@
+"""主线程分段执行：每 50 ms 一步 vs 一次做完 vs FrameScheduler
+
+用法：python bench_frame_scheduler.py [步数，默认 200000] [任务数，默认 4]
+每步是一段几微秒的计算。同时用一个 1 ms 的探测定时器测主线程的响应间隔
+（最大间隔 ≈ 界面最长卡顿时间）。
+- 定时器每 50 ms 一步（QTTimerUI.py 原写法）：只按步数推算总耗时
+- 一次做完：在一个槽函数里循环执行所有步骤
+- FrameScheduler：多个任务、每帧按预算执行（step 函数 / 生成器两种写法）
+"""
+import sys
+import time
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer, Qt
+
+from frame_scheduler import FrameScheduler
+
+
+def make_step(total):
+    state = {"i": 0, "acc": 0}
+
+    def step():
+        state["acc"] += sum(range(50))  # 模拟几微秒的小计算
+        state["i"] += 1
+        return state["i"] >= total
+    return step
+
+
+def make_generator(total):
+    acc = 0
+    for _ in range(total):
+        acc += sum(range(50))
+        yield
+    return acc
+
+
+class Probe:
+    """记录主线程相邻两次处理定时器事件的最大间隔"""
+
+    def __init__(self):
+        self.max_gap = 0.0
+        self._last = None
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start(1)
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.max_gap = max(self.max_gap, now - self._last)
+        self._last = now
+
+    def stop(self):
+        self._timer.stop()
+        return self.max_gap * 1000
+
+
+def run_blocking(total, tasks):
+    probe = Probe()
+    loop = QEventLoop()
+    start = [0.0]
+
+    def work():
+        start[0] = time.perf_counter()
+        for step in [make_step(total) for _ in range(tasks)]:
+            while not step():
+                pass
+        start[0] = time.perf_counter() - start[0]
+        QTimer.singleShot(20, loop.quit)
+    QTimer.singleShot(20, work)
+    loop.exec()
+    return start[0], probe.stop(), None
+
+
+def run_scheduler(total, tasks, generator=False):
+    probe = Probe()
+    scheduler = FrameScheduler()
+    loop = QEventLoop()
+    scheduler.all_finished.connect(loop.quit)
+    start = time.perf_counter()
+    for i in range(tasks):
+        if generator:
+            scheduler.spawn(make_generator(total), priority=i % 2)
+        else:
+            scheduler.schedule(make_step(total), priority=i % 2)
+    loop.exec()
+    return time.perf_counter() - start, probe.stop(), scheduler
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    app = QCoreApplication(sys.argv)
+    print(f"{tasks} 个任务 × {total} 步")
+    print(f"每 50 ms 一步（推算）  总耗时 {total * tasks * 0.05:10.1f} s")
+    elapsed, gap, _ = run_blocking(total, tasks)
+    print(f"一次做完              总耗时 {elapsed:10.2f} s  主线程最大间隔 {gap:8.1f} ms")
+    for name, generator in (("FrameScheduler step", False), ("FrameScheduler 生成器", True)):
+        elapsed, gap, scheduler = run_scheduler(total, tasks, generator)
+        print(f"{name:<20}  总耗时 {elapsed:10.2f} s  主线程最大间隔 {gap:8.1f} ms  "
+              f"帧数 {scheduler.frames}  最终预算 {scheduler.budget_ms:.1f} ms")
+    del app
+
+
+if __name__ == "__main__":
+    main()
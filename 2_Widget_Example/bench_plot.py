@@ -0,0 +1,82 @@
+"""实时曲线每帧耗时：逐点折线 vs StreamPlot（按像素列 min/max、只重画脏区域）
+
+用法：python bench_plot.py
+控件宽 1000 像素；每个像素列对应 spc 个点，一屏显示 1000 × spc 个点，每帧新增 20 列的点。
+先灌满一屏（StreamPlot 另外保留 1000 万点历史），再测 30 帧“追加一批点 + 绘制”的平均耗时。
+- 逐点折线：每帧把一屏的点全部转换成 QPolygonF 并 drawPolyline（最常见的写法）
+- StreamPlot：plot_widget.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPainter, QPolygonF
+from PySide6.QtWidgets import QApplication, QWidget
+
+from plot_widget import StreamPlot
+
+FRAMES = 30
+
+
+class PolylinePlot(QWidget):
+    def __init__(self, capacity):
+        super().__init__()
+        self.capacity = capacity
+        self.data = np.zeros(0)
+
+    def append(self, samples):
+        self.data = np.concatenate([self.data, samples])[-self.capacity:]
+        self.update()
+
+    def paintEvent(self, event):
+        if not len(self.data):
+            return
+        width, height = self.width(), self.height()
+        xs = np.linspace(0, width - 1, len(self.data))
+        ys = (1 - self.data) * (height - 1) / 2
+        painter = QPainter(self)
+        painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)]))
+
+
+def frame_time(plot, history, batch, flush):
+    rng = np.random.default_rng(0)
+    plot.append(rng.uniform(-1, 1, history))
+    flush()
+    QApplication.processEvents()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        plot.append(rng.uniform(-1, 1, batch))
+        flush()
+        QApplication.processEvents()  # 处理 update() 请求，实际绘制
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    app = QApplication(sys.argv)
+    print(f"控件 1000×300，每帧新增 20 列，{FRAMES} 帧平均")
+    print(f"{'每列点数':>8} {'一屏点数':>12} {'逐点折线 ms/帧':>16} {'StreamPlot ms/帧':>18}")
+    for spc in (1, 10, 100, 1000, 10000):
+        window = 1000 * spc
+        plot = StreamPlot(capacity=10_000_000, samples_per_column=spc)
+        plot.resize(1000, 300)
+        plot.show()
+        fast = frame_time(plot, window, 20 * spc, plot._flush)
+        plot.close()
+        if window <= 1_000_000:
+            naive = PolylinePlot(window)
+            naive.resize(1000, 300)
+            naive.show()
+            slow = f"{frame_time(naive, window, 20 * spc, lambda: None):16.2f}"
+            naive.close()
+        else:
+            slow = f"{'（太慢，略）':>12}"
+        print(f"{spc:>10} {window:>14,} {slow} {fast:18.3f}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""CPU 密集任务：单进程 vs ProcessTask 进程池（1、2、4 … 个进程）
+
+用法：python bench_process_task.py [上限，默认 2000000]
+任务为纯 Python 试除法统计素数（在 QThread 中会被 GIL 串行化）。进程池预热后计时，
+输出耗时与相对单进程的加速比。
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QEventLoop
+
+from process_task import ProcessTask, count_primes, make_chunks
+
+
+def run_pool(stop, workers):
+    task = ProcessTask(count_primes, make_chunks(stop, workers * 4), max_workers=workers)
+    task.warm_up()
+    loop = QEventLoop()
+    results = []
+    task.results_ready.connect(results.extend)
+    task.task_finished.connect(loop.quit)
+    start = time.perf_counter()
+    task.run_task()
+    loop.exec()
+    elapsed = time.perf_counter() - start
+    task.shutdown()
+    return sum(results), elapsed
+
+
+def main(stop):
+    app = QCoreApplication(sys.argv[:1])
+    cores = os.cpu_count() or 1
+    start = time.perf_counter()
+    expected = count_primes(range(stop))
+    serial = time.perf_counter() - start
+    print(f"CPU 核数 {cores}，统计 [0, {stop:,}) 的素数：{expected:,} 个")
+    print(f"单进程（GUI 进程内直接计算）: {serial:6.2f} s")
+    workers = 1
+    while workers <= cores:
+        total, elapsed = run_pool(stop, workers)
+        assert total == expected
+        print(f"ProcessTask x{workers:<2}              : {elapsed:6.2f} s  加速比 {serial / elapsed:4.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
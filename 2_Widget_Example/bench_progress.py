@@ -0,0 +1,94 @@
+"""进度信号：每步 emit vs ThrottledProgress 节流 vs ProgressTracker 轮询
+
+用法：python bench_progress.py [步数，默认 1000000]
+后台 QThread 跑 N 个很小的步骤，每步报告一次进度；主线程用 10 ms 定时器模拟界面刷新，
+统计主线程收到的进度信号数、定时器最大间隔（界面卡顿）以及任务结束到主线程收到完成信号的延迟。
+tracker 模式不发进度信号：后台每步 stage.advance()，主线程每次定时器触发读一次 snapshot()。
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QThread, QTimer, Signal
+from PySide6.QtWidgets import QApplication
+
+from progress_throttle import ThrottledProgress
+from progress_tracker import ProgressTracker
+
+
+class StepWorker(QThread):
+    progress_updated = Signal(int)
+    task_finished = Signal(float)  # 后台循环结束的时刻
+
+    def __init__(self, steps, mode):
+        super().__init__()
+        self.steps = steps
+        self.mode = mode
+        self.progress = None
+        self.tracker = ProgressTracker()
+        self.tracker.add_stage("steps", total=steps)
+
+    def run(self):
+        if self.mode == "tracker":
+            with self.tracker.children[0] as stage:
+                for i in range(self.steps):
+                    stage.advance()
+        elif self.mode == "throttled":
+            with ThrottledProgress(self.progress_updated) as self.progress:
+                for i in range(self.steps):
+                    self.progress.update(i + 1)
+        else:
+            for i in range(self.steps):
+                self.progress_updated.emit(i + 1)
+        self.task_finished.emit(time.perf_counter())
+
+
+def run(app, steps, mode):
+    worker = StepWorker(steps, mode)
+    received = []
+    worker.progress_updated.connect(received.append)
+    done = []
+    worker.task_finished.connect(lambda loop_end: done.append(time.perf_counter() - loop_end))
+
+    ticks = []
+    snapshots = []
+
+    def tick():
+        ticks.append(time.perf_counter())
+        if mode == "tracker":
+            start = time.perf_counter()
+            received.append(worker.tracker.children[0].done)
+            worker.tracker.snapshot()
+            snapshots.append(time.perf_counter() - start)
+    timer = QTimer()
+    timer.setInterval(10)
+    timer.timeout.connect(tick)
+    timer.start()
+    start = time.perf_counter()
+    worker.start()
+    while not done:
+        app.processEvents()
+    total = time.perf_counter() - start
+    timer.stop()
+    worker.wait()
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])] or [total]
+    if mode == "tracker":
+        received.append(worker.tracker.children[0].done)
+    print(f"{mode:<11}: {len(received):>9,} updates  last={received[-1]:,}  "
+          f"total {total:.2f} s  max UI gap {max(gaps) * 1000:7.1f} ms  "
+          f"finish latency {done[0] * 1000:7.1f} ms")
+    if worker.progress is not None:
+        print(f"             emitted={worker.progress.emitted}  suppressed={worker.progress.suppressed:,}")
+    if snapshots:
+        print(f"             snapshot() mean {sum(snapshots) / len(snapshots) * 1e6:.1f} us  "
+              f"max {max(snapshots) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv[:1])
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    run(app, count, "every step")
+    run(app, count, "throttled")
+    run(app, count, "tracker")
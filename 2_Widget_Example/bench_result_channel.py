@@ -0,0 +1,130 @@
+"""大量结果行送到界面：每块直接 emit（无界）vs ResultChannel（有界 + 背压）
+
+用法：python bench_result_channel.py [行数，默认 500000] [消费每块耗时 ms，默认 5]
+生产者线程每 1000 行一块；主线程的消费者处理每块要花一段时间（模拟插入模型、刷新视图），比生产者慢。
+统计：总耗时、在途块数峰值（已发出未处理）、tracemalloc 内存峰值、主线程最大响应间隔、生产者阻塞时间。
+"""
+import sys
+import threading
+import time
+import tracemalloc
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QThread, QTimer, Qt, Signal
+
+from result_channel import ResultChannel
+
+CHUNK = 1000
+
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class Probe:
+    """记录主线程相邻两次处理定时器事件的最大间隔"""
+
+    def __init__(self):
+        self.max_gap = 0.0
+        self._last = None
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start(1)
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.max_gap = max(self.max_gap, now - self._last)
+        self._last = now
+
+    def stop(self):
+        self._timer.stop()
+        return self.max_gap * 1000
+
+
+class Consumer:
+    def __init__(self, cost):
+        self.cost = cost
+        self.rows = 0
+        self.chunks = 0
+
+    def on_chunk(self, chunk):
+        self.rows += len(chunk)
+        self.chunks += 1
+        busy(self.cost)
+
+
+class UnboundedProducer(QThread):
+    chunk_ready = Signal(object)
+
+    def __init__(self, total):
+        super().__init__()
+        self.total = total
+        self.sent = 0
+
+    def run(self):
+        for start in range(0, self.total, CHUNK):
+            self.chunk_ready.emit([(i, i * i % 9973) for i in range(start, min(start + CHUNK, self.total))])
+            self.sent += 1
+
+
+def run_unbounded(total, cost):
+    consumer = Consumer(cost)
+    producer = UnboundedProducer(total)
+    peak = [0]
+
+    def on_chunk(chunk):
+        peak[0] = max(peak[0], producer.sent - consumer.chunks)
+        consumer.on_chunk(chunk)
+    producer.chunk_ready.connect(on_chunk)
+    loop = QEventLoop()
+    producer.finished.connect(loop.quit)  # finished 排在所有块之后
+    return measure(loop, producer.start, consumer, lambda: (peak[0], 0.0), producer.wait)
+
+
+def run_channel(total, cost):
+    consumer = Consumer(cost)
+    channel = ResultChannel(max_chunks=8, chunk_size=CHUNK)
+    channel.chunk_ready.connect(consumer.on_chunk)
+    loop = QEventLoop()
+    channel.finished.connect(loop.quit)
+
+    def produce():
+        for i in range(total):
+            channel.put((i, i * i % 9973))
+        channel.close()
+    thread = threading.Thread(target=produce)
+    return measure(loop, thread.start, consumer, lambda: (channel.max_depth, channel.stall_time), thread.join)
+
+
+def measure(loop, start, consumer, extra, join):
+    tracemalloc.start()
+    probe = Probe()
+    t = time.perf_counter()
+    start()
+    loop.exec()
+    elapsed = time.perf_counter() - t
+    join()
+    gap = probe.stop()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    in_flight, stall = extra()
+    return elapsed, consumer.rows, in_flight, peak_memory / 1e6, gap, stall
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    cost = (float(sys.argv[2]) if len(sys.argv) > 2 else 5) / 1000
+    app = QCoreApplication(sys.argv)
+    print(f"{total} 行，每块 {CHUNK} 行，消费每块 {cost * 1000:.1f} ms")
+    for name, fn in (("每块直接 emit", run_unbounded), ("ResultChannel", run_channel)):
+        elapsed, rows, in_flight, memory, gap, stall = fn(total, cost)
+        print(f"{name:<14} 总耗时 {elapsed:6.2f} s  行数 {rows}  在途峰值 {in_flight:5d} 块  "
+              f"内存峰值 {memory:7.1f} MB  主线程最大间隔 {gap:7.1f} ms  生产者阻塞 {stall:5.2f} s")
+    del app
+
+
+if __name__ == "__main__":
+    main()
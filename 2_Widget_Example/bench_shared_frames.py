@@ -0,0 +1,177 @@
+"""大图像从后台送到界面：复制 / pickle vs FrameRing 共享内存
+
+用法：python bench_shared_frames.py [帧数，默认 200] [宽 默认 1920] [高 默认 1080]
+每帧 宽 × 高 × 4 字节，后台填充像素后交给主线程，主线程包装成 QImage 并读一个像素（模拟显示）。
+- 线程 + Signal(object)：后台把帧 QImage.copy() 一份再 emit（否则下一帧会覆盖正在显示的数据）
+- 线程 + FrameRing：后台写共享内存槽，只 emit 槽号
+- 进程 + Queue(bytes)：子进程 tobytes() 后经 multiprocessing.Queue（pickle + 管道）发送，主进程再构造 QImage
+- 进程 + FrameRing：子进程写共享内存槽，只通过队列发送槽号
+统计：帧/秒、主线程每帧构造 QImage 并读像素的耗时（不含从队列接收）。
+"""
+import multiprocessing
+import sys
+import threading
+import time
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QEventLoop, QObject, Signal
+from PySide6.QtGui import QImage
+
+from shared_frames import FrameRing
+
+FORMAT = QImage.Format.Format_RGB32
+
+
+def fill(pixels, frame):
+    pixels.fill(frame & 0xFF)
+
+
+# -------------------------- 子进程（spawn 需要能 import 到的顶层函数）--------------------------
+def produce_bytes(out, count, width, height):
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    for frame in range(count):
+        fill(pixels, frame)
+        out.put(pixels.tobytes())
+    out.put(None)
+
+
+def produce_ring(out, handle, count):
+    ring = FrameRing.attach(handle)
+    for frame in range(count):
+        slot = ring.acquire()
+        pixels = ring.array(slot)
+        fill(pixels, frame)
+        del pixels
+        out.put(slot)
+    out.put(None)
+    ring.close()
+
+
+# -------------------------- 主进程 --------------------------
+class Relay(QObject):
+    frame = Signal(object)
+    done = Signal()
+
+
+class Consumer:
+    def __init__(self):
+        self.frames = 0
+        self.main_time = 0.0
+
+    def consume(self, make_image):
+        start = time.perf_counter()
+        image = make_image()
+        image.pixel(0, 0)
+        self.main_time += time.perf_counter() - start
+        self.frames += 1
+        return image
+
+
+def run_thread_copy(count, width, height):
+    relay, consumer, loop = Relay(), Consumer(), QEventLoop()
+    relay.frame.connect(lambda image: consumer.consume(lambda: image))
+    relay.done.connect(loop.quit)
+
+    def produce():
+        pixels = np.empty((height, width, 4), dtype=np.uint8)
+        for frame in range(count):
+            fill(pixels, frame)
+            relay.frame.emit(QImage(pixels.data, width, height, width * 4, FORMAT).copy())
+        relay.done.emit()
+    return run_loop(loop, threading.Thread(target=produce), consumer)
+
+
+def run_thread_ring(count, width, height):
+    ring = FrameRing(width, height, slots=3)
+    relay, consumer, loop = Relay(), Consumer(), QEventLoop()
+    shown = [None, None]  # 当前显示的 (槽号, QImage)
+
+    def on_frame(slot):
+        image = consumer.consume(lambda: ring.image(slot, FORMAT))
+        old = shown[0]
+        shown[:] = [slot, image]
+        if old is not None:
+            ring.release(old)
+    relay.frame.connect(on_frame)
+    relay.done.connect(loop.quit)
+
+    def produce():
+        for frame in range(count):
+            slot = ring.acquire()
+            pixels = ring.array(slot)
+            fill(pixels, frame)
+            del pixels
+            relay.frame.emit(slot)
+        relay.done.emit()
+    result = run_loop(loop, threading.Thread(target=produce), consumer)
+    shown.clear()
+    ring.close()
+    return result
+
+
+def run_process_bytes(count, width, height):
+    context = multiprocessing.get_context("spawn")
+    out = context.Queue(maxsize=3)
+    consumer = Consumer()
+    process = context.Process(target=produce_bytes, args=(out, count, width, height))
+    return run_queue(process, out, consumer,
+                     lambda data: consumer.consume(lambda: QImage(data, width, height, width * 4, FORMAT)))
+
+
+def run_process_ring(count, width, height):
+    context = multiprocessing.get_context("spawn")
+    ring = FrameRing(width, height, slots=3, context=context)
+    out = context.Queue()
+    consumer = Consumer()
+    shown = [None, None]
+
+    def on_frame(slot):
+        image = consumer.consume(lambda: ring.image(slot, FORMAT))
+        old = shown[0]
+        shown[:] = [slot, image]
+        if old is not None:
+            ring.release(old)
+    process = context.Process(target=produce_ring, args=(out, ring.handle(), count))
+    result = run_queue(process, out, consumer, on_frame)
+    shown.clear()
+    ring.close()
+    return result
+
+
+def run_loop(loop, thread, consumer):
+    start = time.perf_counter()
+    thread.start()
+    loop.exec()
+    thread.join()
+    return consumer.frames / (time.perf_counter() - start), consumer.main_time / consumer.frames * 1000
+
+
+def run_queue(process, out, consumer, on_item):
+    """主线程直接读队列（子进程启动时间不计入）"""
+    process.start()
+    first = out.get()
+    start = time.perf_counter()
+    item = first
+    while item is not None:
+        on_item(item)
+        item = out.get()
+    elapsed = time.perf_counter() - start
+    process.join()
+    return (consumer.frames - 1) / elapsed, consumer.main_time / consumer.frames * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 1920
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 1080
+    app = QCoreApplication(sys.argv)
+    print(f"{count} 帧 × {width}×{height}（每帧 {width * height * 4 / 1e6:.1f} MB）")
+    for name, fn in (("线程 + Signal(copy)", run_thread_copy), ("线程 + FrameRing", run_thread_ring),
+                     ("进程 + Queue(bytes)", run_process_bytes), ("进程 + FrameRing", run_process_ring)):
+        fps, main_ms = fn(count, width, height)
+        print(f"{name:<20} {fps:8.1f} 帧/秒  构造 QImage {main_ms:7.3f} ms")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""跨线程信号 / 槽吞吐量与延迟基准（QThreadUI.py 的 progress_updated / task_finished 能承载多少数据）
+
+用法：python bench_signals.py [--messages 20000] [--producers 1,2,4] [--json 结果.json]
+                            [--repeat 3] [--baseline 旧结果.json] [--tolerance 0.3]
+只用 QCoreApplication，不需要显示器（无界面，与 offscreen QPA 一样可在 CI 中运行）。
+
+每个生产者是一个 QThread，在 run() 里连续 emit；每个生产者对应一个主线程中的接收对象。
+- 载荷：Signal(int)、Signal(str)、Signal(object)（小元组）、Signal(bytes) 1 MB、Signal(object) NumPy 1 MB
+- 连接方式：
+    queued          QueuedConnection（跨线程默认）：生产者不等待，事件在主线程队列里排队
+    blocking        BlockingQueuedConnection：每次 emit 都等主线程执行完槽函数
+    direct          DirectConnection：槽函数在生产者线程中执行（只作为开销下限对照，不能更新界面）
+- 吞吐量 = 消息数 / (第一次 emit → 最后一次槽函数执行)；延迟 = 槽函数执行时刻 - emit 时刻
+  （queued 的延迟包含排队时间，生产者越快队列越长）；每个组合运行 repeat 次取吞吐量最高的一次
+--json 写出机器可读结果；--baseline 与旧结果比较，吞吐量下降超过 tolerance 的组合以退出码 1 报告。
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+import PySide6
+from PySide6.QtCore import QCoreApplication, QEventLoop, QObject, QThread, Qt, Signal, Slot, qVersion
+
+LARGE = 1 << 20  # 大载荷 1 MB
+
+CONNECTIONS = {
+    "queued": Qt.ConnectionType.QueuedConnection,
+    "blocking": Qt.ConnectionType.BlockingQueuedConnection,
+    "direct": Qt.ConnectionType.DirectConnection,
+}
+
+
+def make_payloads():
+    """载荷名 -> (信号名, 生成第 i 条消息的函数, 每条字节数, 消息数比例)"""
+    blob = bytes(LARGE)
+    array = np.zeros(LARGE // 8, dtype=np.float64)
+    return {
+        "int": ("sent_int", lambda i: i, 0, 1),
+        "str": ("sent_str", lambda i: f"进度：{i % 101}%", 0, 1),
+        "object": ("sent_object", lambda i: (i, i % 101, "ok"), 0, 1),
+        "bytes_1MB": ("sent_bytes", lambda i: blob, LARGE, 1 / 5),
+        "ndarray_1MB": ("sent_object", lambda i: array, LARGE, 1 / 5),
+    }
+
+
+class Producer(QThread):
+    sent_int = Signal(int)
+    sent_str = Signal(str)
+    sent_object = Signal(object)
+    sent_bytes = Signal(bytes)
+
+    def __init__(self, signal_name, make_message, count):
+        super().__init__()
+        self._signal = getattr(self, signal_name)
+        self._make_message = make_message
+        self.count = count
+        self.sent_at = [0.0] * count
+
+    def run(self):
+        signal, make_message, sent_at = self._signal, self._make_message, self.sent_at
+        clock = time.perf_counter
+        for i in range(self.count):
+            message = make_message(i)
+            sent_at[i] = clock()
+            signal.emit(message)
+
+
+class Consumer(QObject):
+    """生活在主线程；每个生产者一个（队列连接下同一生产者的消息按顺序到达）"""
+
+    def __init__(self):
+        super().__init__()
+        self.received_at = []
+
+    @Slot(object)
+    def on_message(self, message):
+        self.received_at.append(time.perf_counter())
+
+
+def run_case(payload, connection, producers, messages, payloads):
+    signal_name, make_message, size, ratio = payloads[payload]
+    count = max(int(messages * ratio), 10)
+    pairs = []
+    for _ in range(producers):
+        producer = Producer(signal_name, make_message, count)
+        consumer = Consumer()
+        getattr(producer, signal_name).connect(consumer.on_message, CONNECTIONS[connection])
+        pairs.append((producer, consumer))
+
+    loop = QEventLoop()
+    remaining = [producers]
+
+    def on_finished():  # finished 排在该线程发出的所有消息之后
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            loop.quit()
+    for producer, _ in pairs:
+        producer.finished.connect(on_finished)
+    for producer, _ in pairs:
+        producer.start()
+    loop.exec()
+    for producer, _ in pairs:
+        producer.wait()
+
+    latencies = []
+    for producer, consumer in pairs:
+        assert len(consumer.received_at) == count, (payload, connection, len(consumer.received_at))
+        latencies.extend(r - s for r, s in zip(consumer.received_at, producer.sent_at))
+    start = min(producer.sent_at[0] for producer, _ in pairs)
+    end = max(consumer.received_at[-1] for _, consumer in pairs)
+    latencies.sort()
+    total = count * producers
+    elapsed = end - start
+    return {
+        "payload": payload, "connection": connection, "producers": producers,
+        "messages": total,
+        "elapsed_s": round(elapsed, 4),
+        "msgs_per_s": round(total / elapsed),
+        "mb_per_s": round(total * size / elapsed / 1e6, 1) if size else None,
+        "latency_p50_us": round(latencies[len(latencies) // 2] * 1e6, 1),
+        "latency_p99_us": round(latencies[int(len(latencies) * 0.99)] * 1e6, 1),
+    }
+
+
+def compare(results, baseline_path, tolerance):
+    """返回吞吐量比基线下降超过 tolerance 的组合"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["payload"], r["connection"], r["producers"]): r
+                    for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        old = baseline.get((r["payload"], r["connection"], r["producers"]))
+        if old and r["msgs_per_s"] < old["msgs_per_s"] * (1 - tolerance):
+            regressions.append((r, old))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="跨线程信号吞吐量 / 延迟基准")
+    parser.add_argument("--messages", type=int, default=20000, help="每个生产者的小消息数（大载荷为 1/5）")
+    parser.add_argument("--producers", default="1,2,4", help="生产者线程数列表")
+    parser.add_argument("--payloads", default=",".join(make_payloads()))
+    parser.add_argument("--connections", default=",".join(CONNECTIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="每个组合的运行次数")
+    parser.add_argument("--json", help="写出结果的路径")
+    parser.add_argument("--baseline", help="用于比较的旧结果 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="允许的吞吐量下降比例")
+    options = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    payloads = make_payloads()
+    results = []
+    print(f"PySide6 {PySide6.__version__} / Qt {qVersion()} / Python {platform.python_version()}")
+    print(f"{'载荷':<12}{'连接':<10}{'线程':>4}{'消息/秒':>12}{'MB/s':>9}{'p50 µs':>11}{'p99 µs':>11}")
+    for payload in options.payloads.split(","):
+        for connection in options.connections.split(","):
+            for producers in map(int, options.producers.split(",")):
+                r = max((run_case(payload, connection, producers, options.messages, payloads)
+                         for _ in range(options.repeat)), key=lambda r: r["msgs_per_s"])
+                results.append(r)
+                mb = f"{r['mb_per_s']:9.1f}" if r["mb_per_s"] is not None else f"{'-':>9}"
+                print(f"{payload:<12}{connection:<10}{producers:>4}{r['msgs_per_s']:>12}{mb}"
+                      f"{r['latency_p50_us']:>11.1f}{r['latency_p99_us']:>11.1f}")
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump({"pyside6": PySide6.__version__, "qt": qVersion(),
+                       "python": platform.python_version(), "platform": platform.platform(),
+                       "messages": options.messages, "repeat": options.repeat, "results": results},
+                      f, ensure_ascii=False, indent=2)
+    code = 0
+    if options.baseline:
+        regressions = compare(results, options.baseline, options.tolerance)
+        for r, old in regressions:
+            print(f"吞吐量下降：{r['payload']} / {r['connection']} / {r['producers']} 线程 "
+                  f"{old['msgs_per_s']} → {r['msgs_per_s']} 消息/秒")
+        code = 1 if regressions else 0
+    del app
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
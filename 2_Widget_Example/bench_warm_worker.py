@@ -0,0 +1,130 @@
+"""连续快速点击：每次新建 QThread vs 常驻 WarmWorker
+
+用法：python bench_warm_worker.py [点击次数，默认 200] [点击间隔 ms，默认 2]
+每次“点击”提交一个约 10 ms 的 CPU 任务（分 10 步，每步忙算 1 ms，持有 GIL）。
+- 每次新建：与 QThreadUI.py 原写法相同，每次点击 new 一个 QThread 并 start，所有请求都跑完
+- WarmWorker：请求排到同一个常驻线程，运行中的旧请求被取消、排队中的旧请求被取代
+统计：创建的线程数、提交 → 开始执行的延迟、最后一次点击 → 它的结果送达的时间、实际执行的任务步数。
+"""
+import sys
+import time
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QThread, QTimer, Signal
+
+from warm_worker import WarmWorker
+
+STEPS = 10
+STEP = 0.001
+
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class PerClickWorker(QThread):
+    task_finished = Signal(int)
+
+    def __init__(self, request_id, counters):
+        super().__init__()
+        self._id = request_id
+        self._counters = counters
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+
+    def run(self):
+        self.started_at = time.perf_counter()
+        for _ in range(STEPS):
+            busy(STEP)
+            self._counters["steps"].append(1)  # list.append 线程安全
+        self.task_finished.emit(self._id)
+
+
+def warm_job(request, counters):
+    for _ in range(STEPS):
+        if request.token.cancelled:
+            return None
+        busy(STEP)
+        counters["steps"].append(1)
+    return request.id
+
+
+def click(count, interval, submit):
+    """每 interval ms 调用一次 submit(i)，模拟连续点击；返回最后一次点击的时刻"""
+    loop = QEventLoop()
+    state = {"i": 0, "last": 0.0}
+    timer = QTimer()
+    timer.setInterval(interval)
+
+    def on_timeout():
+        state["last"] = time.perf_counter()
+        submit(state["i"])
+        state["i"] += 1
+        if state["i"] == count:
+            timer.stop()
+            loop.quit()
+    timer.timeout.connect(on_timeout)
+    timer.start()
+    loop.exec()
+    return state["last"]
+
+
+def wait_until(done):
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.timeout.connect(lambda: done() and loop.quit())
+    timer.start(1)
+    loop.exec()
+
+
+def run_per_click(count, interval):
+    counters = {"steps": []}
+    workers, finished = [], {}
+    def submit(i):
+        worker = PerClickWorker(i, counters)
+        worker.task_finished.connect(lambda rid: finished.setdefault(rid, time.perf_counter()))
+        workers.append(worker)
+        worker.start()
+    last_click = click(count, interval, submit)
+    wait_until(lambda: count - 1 in finished)
+    latest = finished[count - 1] - last_click
+    wait_until(lambda: len(finished) == count)
+    for worker in workers:
+        worker.wait()
+    starts = [w.started_at - w.submitted_at for w in workers]
+    return {"threads": count, "start_ms": sum(starts) / len(starts) * 1000,
+            "latest_ms": latest * 1000, "steps": len(counters["steps"])}
+
+
+def run_warm(count, interval):
+    counters = {"steps": []}
+    worker = WarmWorker()
+    finished = {}
+    worker.request_finished.connect(lambda rid, _: finished.setdefault(rid, time.perf_counter()))
+    ids = []
+    last_click = click(count, interval, lambda i: ids.append(worker.submit(warm_job, counters)))
+    wait_until(lambda: ids[-1] in finished)
+    latest = finished[ids[-1]] - last_click
+    stats = worker.stats
+    worker.stop()
+    return {"threads": 1, "start_ms": stats.mean_wait * 1000, "latest_ms": latest * 1000,
+            "steps": len(counters["steps"]), "stats": stats}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    interval = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    app = QCoreApplication(sys.argv)
+    print(f"{count} 次点击，间隔 {interval} ms，每个任务 {STEPS} × {STEP * 1000:.0f} ms")
+    for name, fn in (("每次新建 QThread", run_per_click), ("WarmWorker", run_warm)):
+        r = fn(count, interval)
+        print(f"{name:<16} 线程 {r['threads']:>4} 个  提交→开始 {r['start_ms']:7.2f} ms  "
+              f"最后一次点击→结果 {r['latest_ms']:7.1f} ms  执行步数 {r['steps']}")
+        if "stats" in r:
+            print(f"{'':<16} {r['stats']}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""可中断的取消标记：cancel() 立即唤醒正在 wait / sleep 的后台线程
+
+QThreadUI2.py 里 stop_task() 只是设置 is_running = False，后台线程要等当前
+time.sleep(0.05) 睡完才看得到；closeEvent 再用 worker_thread.wait(1000) 等它退出。
+CancelToken 基于 threading.Event：
+- token.wait(t) / token.sleep(t) 代替 time.sleep(t)，取消时立刻返回（空闲等待的取消延迟 < 1 ms）
+- token.child() 创建子标记：父标记取消时所有子标记一起取消，子标记单独取消不影响父标记
+- cancelled_at / stop_latency 记录“发出取消 → 任务真正停下”的耗时
+"""
+import threading
+import time
+import weakref
+
+
+class TaskCancelled(Exception):
+    """任务函数中抛出，表示响应了取消请求"""
+
+
+class CancelToken:
+    """线程安全的取消标记"""
+
+    def __init__(self, parent=None):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._parent = parent                # 子标记持有父标记（父标记只弱引用子标记，不会积累）
+        self._children = weakref.WeakSet()
+        self.cancelled_at = None   # cancel() 的时刻（perf_counter）
+        self.stop_latency = None   # stopped() 记录的取消延迟（秒）
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.cancelled_at = time.perf_counter()
+            self._event.set()
+            children = list(self._children)
+        for child in children:
+            child.cancel()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def child(self):
+        """子标记：随本标记一起取消"""
+        token = CancelToken(parent=self)
+        with self._lock:
+            if not self._event.is_set():
+                self._children.add(token)
+                return token
+        token.cancel()
+        return token
+
+    def wait(self, timeout=None):
+        """可中断的等待：被取消返回 True，超时返回 False"""
+        return self._event.wait(timeout)
+
+    def sleep(self, seconds):
+        """可中断的 time.sleep：等待期间被取消则抛出 TaskCancelled"""
+        if self._event.wait(seconds):
+            raise TaskCancelled()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise TaskCancelled()
+
+    def stopped(self):
+        """任务响应取消、真正停下时调用，记录并返回取消延迟（秒）"""
+        if self.cancelled_at is not None and self.stop_latency is None:
+            self.stop_latency = time.perf_counter() - self.cancelled_at
+        return self.stop_latency
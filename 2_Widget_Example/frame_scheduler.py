@@ -0,0 +1,219 @@
+"""主线程协作式调度器：每帧在时间预算内执行尽可能多的任务小步
+
+QTTimerUI.py 每 50 ms 的定时器只执行一次 do_task_step，100 步的任务固定要 5 秒，
+哪怕每一步只要几微秒。FrameScheduler：
+- 每帧（默认 16 ms，PreciseTimer）触发一次，在 budget_ms 内循环执行各任务的 step()，
+  用完预算就返回事件循环，让界面有时间处理输入和重绘
+- 可同时调度多个任务：优先级高的先执行，同一优先级轮流执行（各执行一步）；
+  高优先级任务没做完时，低优先级任务在这一帧拿不到时间
+- 根据实测帧间隔自适应预算：帧间隔明显超过目标（事件处理 / 重绘变慢）就缩小预算，
+  否则逐步放大，直到 max_budget_ms
+- schedule(step)：step() 返回真值表示任务完成；抛出异常时任务失败并移出调度
+- spawn(generator)：任务写成生成器，每次 yield 是一个暂停点（一次 step）：
+    yield                 只是暂停，让出时间
+    yield 42              报告进度（task_progress 信号）
+    result = yield task   等待另一个任务结束，得到它的 return 值；
+                          它失败时在这里抛出同样的异常，被取消时抛出 TaskCancelled；
+                          task 必须是 schedule() / spawn() 返回的，否则在这里抛出 ValueError
+  生成器 return 的值保存在 task.result；取消时生成器被 close()（finally 会执行）
+- 每个任务的 cpu_time 累计它占用主线程的时间（借用判断预算时读取的 perf_counter，不额外计时）
+
+所有任务都在主线程执行，可以直接更新界面，但单步耗时必须远小于预算。
+"""
+import itertools
+import time
+import traceback
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+from cancel_token import TaskCancelled
+
+
+class FrameTask:
+    """schedule() / spawn() 的返回值"""
+
+    def __init__(self, task_id, step, priority):
+        self.id = task_id
+        self.priority = priority
+        self.step = step
+        self.steps = 0          # 已执行的步数
+        self.cpu_time = 0.0     # 占用主线程的累计时间（秒）
+        self.result = None
+        self.error = None       # 失败时的异常
+        self.done = False
+        self.cancelled = False
+        self._scheduler = None  # 加入调度器时设置；没加入过的任务永远不会结束，不能被等待
+        self._waiting_on = None
+
+    @property
+    def blocked(self):
+        """正在等待另一个尚未结束的任务"""
+        return self._waiting_on is not None and not self._waiting_on.done
+
+    def cancel(self):
+        """已结束的任务不受影响（结果 / 异常保持不变，等待它的任务照常拿到结果）"""
+        if not self.done:
+            self.cancelled = True
+
+    def _close(self):
+        pass
+
+
+class GeneratorTask(FrameTask):
+    """由生成器驱动的任务：每次 step 恢复生成器执行到下一个 yield"""
+
+    def __init__(self, task_id, generator, priority, report_progress):
+        super().__init__(task_id, self._resume, priority)
+        self._generator = generator
+        self._report_progress = report_progress
+
+    def _resume(self):
+        waited, self._waiting_on = self._waiting_on, None
+        try:
+            if waited is None:
+                value = self._generator.send(None)
+            elif waited.error is not None:
+                value = self._generator.throw(waited.error)
+            elif waited.cancelled:
+                value = self._generator.throw(TaskCancelled())
+            else:
+                value = self._generator.send(waited.result)
+            error = self._check(value)
+            while error is not None:
+                value = self._generator.throw(error)
+                error = self._check(value)
+        except StopIteration as stop:
+            self.result = stop.value
+            return True
+        if isinstance(value, FrameTask):
+            self._waiting_on = value
+        elif value is not None:
+            self._report_progress(self.id, int(value))
+        return False
+
+    def _check(self, value):
+        """yield 的值不受支持时，返回要抛回生成器的异常"""
+        if isinstance(value, FrameTask):
+            if value is self:
+                return ValueError("任务不能等待自己")
+            if value._scheduler is None:
+                return ValueError("yield 的任务没有交给调度器（schedule / spawn），永远不会结束")
+            return None
+        if value is None or isinstance(value, (int, float)):
+            return None
+        return TypeError(f"不支持 yield {type(value).__name__}")
+
+    def _close(self):
+        self._generator.close()
+
+
+class FrameScheduler(QObject):
+    task_progress = Signal(int, int)  # (任务 id, 生成器 yield 的进度)
+    task_finished = Signal(int)       # 任务 id
+    task_failed = Signal(int, str)    # (任务 id, 异常信息)
+    task_cancelled = Signal(int)      # 任务 id
+    all_finished = Signal()           # 没有待执行的任务了
+
+    def __init__(self, frame_ms=16, budget_ms=8, min_budget_ms=1, max_budget_ms=None, parent=None):
+        super().__init__(parent)
+        self.frame_ms = frame_ms
+        self.budget_ms = budget_ms
+        self.min_budget_ms = min_budget_ms
+        self.max_budget_ms = max_budget_ms or frame_ms * 0.75
+        self._tasks = []                 # 按优先级从高到低排列
+        self._counter = itertools.count()
+        self._last_frame = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(frame_ms)
+        self._timer.timeout.connect(self._run_slice)
+        self.frames = 0                  # 执行过的时间片数
+        self.last_frame_ms = 0.0         # 最近一次实测帧间隔
+
+    def schedule(self, step, priority=0):
+        """调度 step()（反复调用直到返回真值），返回 FrameTask"""
+        return self._add(FrameTask(next(self._counter), step, priority))
+
+    def spawn(self, generator, priority=0):
+        """调度生成器任务（传入生成器对象，如 spawn(job(arg))），返回 FrameTask"""
+        return self._add(GeneratorTask(next(self._counter), generator, priority,
+                                       self.task_progress.emit))
+
+    def _add(self, task):
+        task._scheduler = self
+        index = next((i for i, t in enumerate(self._tasks) if t.priority < task.priority),
+                     len(self._tasks))
+        self._tasks.insert(index, task)
+        if not self._timer.isActive():
+            self._last_frame = None
+            self._timer.start()
+        return task
+
+    def cancel_all(self):
+        for task in self._tasks:
+            task.cancel()
+
+    def pending_count(self):
+        return len(self._tasks)
+
+    def _adapt_budget(self, now):
+        if self._last_frame is not None:
+            self.last_frame_ms = (now - self._last_frame) * 1000
+            if self.last_frame_ms > self.frame_ms * 1.5:
+                self.budget_ms = max(self.budget_ms * 0.75, self.min_budget_ms)
+            elif self.last_frame_ms < self.frame_ms * 1.1:
+                self.budget_ms = min(self.budget_ms + 0.5, self.max_budget_ms)
+        self._last_frame = now
+
+    def _run_slice(self):
+        now = time.perf_counter()
+        self._adapt_budget(now)
+        deadline = now + self.budget_ms / 1000
+        self.frames += 1
+        # 本帧开始时的任务按优先级分组；同组任务轮流执行，直到都结束 / 都在等待 / 预算用完
+        for _, group in itertools.groupby(list(self._tasks), key=lambda t: t.priority):
+            group = list(group)
+            while group:
+                for task in list(group):
+                    if self._step(task):
+                        group.remove(task)
+                    step_end = time.perf_counter()
+                    task.cpu_time += step_end - now
+                    now = step_end
+                    if now >= deadline:
+                        self._remove_finished()
+                        return
+        self._remove_finished()
+
+    def _step(self, task):
+        """执行一步，返回这一帧是否不再执行该任务（结束 / 正在等待其他任务）"""
+        if task.cancelled:
+            self._finish(task, self.task_cancelled, task.id)
+            return True
+        if task.blocked:
+            return True
+        try:
+            finished = task.step()
+        except TaskCancelled:
+            task.cancelled = True
+            self._finish(task, self.task_cancelled, task.id)
+            return True
+        except Exception as exc:
+            task.error = exc
+            self._finish(task, self.task_failed, task.id, traceback.format_exc(limit=3))
+            return True
+        task.steps += 1
+        if finished:
+            self._finish(task, self.task_finished, task.id)
+        return task.done
+
+    def _finish(self, task, signal, *args):
+        task.done = True
+        task._close()
+        signal.emit(*args)
+
+    def _remove_finished(self):
+        self._tasks = [task for task in self._tasks if not task.done]
+        if not self._tasks and self._timer.isActive():
+            self._timer.stop()
+            self.all_finished.emit()
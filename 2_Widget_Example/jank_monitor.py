@@ -0,0 +1,184 @@
+"""主线程卡顿（jank）监视器：可选地挂到任意 QApplication 上
+
+两部分配合：
+- 探测定时器（主线程，PreciseTimer，默认每 5 ms）：记录相邻两次触发的间隔比预期晚了多少，
+  计入延迟直方图；这个间隔就是主线程没法处理事件的时间
+- 看门狗线程：主线程超过 threshold_ms 没有心跳时，用 sys._current_frames() 抓取主线程
+  此刻的 Python 调用栈（卡在哪一行）；主线程恢复后与这次卡顿的时长一起记入 stalls
+
+用法一（代码中）：monitor = JankMonitor(threshold_ms=50); monitor.start() …… monitor.export_json(path)
+用法二（不改 demo）：python jank_monitor.py [--threshold 50] [--json jank.json] demo.py [demo 参数…]
+  包装 QApplication.exec()：进入事件循环时开始监视，退出时打印摘要并导出 JSON。
+  （QAsyncioUI.py 不调用 app.exec()，需要用法一）
+"""
+import argparse
+import bisect
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+import traceback
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+BUCKETS_MS = (1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000)  # 直方图各桶上界（最后还有一个溢出桶）
+MAX_STACK_DEPTH = 30
+
+
+class JankMonitor(QObject):
+    def __init__(self, interval_ms=5, threshold_ms=50, max_stalls=100, parent=None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.max_stalls = max_stalls
+        self.histogram = [0] * (len(BUCKETS_MS) + 1)
+        self.stalls = []          # 超过阈值的卡顿：{"at_s", "duration_ms", "stack"}
+        self.samples = 0
+        self.max_ms = 0.0
+        self.total_stall_ms = 0.0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._tick)
+        self._main_ident = threading.get_ident()
+        self._started_at = None
+        self._stopped_at = None
+        self._beat = None             # 最近一次心跳（perf_counter），看门狗只读
+        self._captured_beat = None    # 已为哪次心跳之后的卡顿抓过调用栈
+        self._stack = None
+        self._stop_event = threading.Event()
+        self._watchdog = None
+
+    def start(self):
+        """在主线程调用"""
+        self._main_ident = threading.get_ident()
+        self._started_at = self._beat = time.perf_counter()
+        self._stopped_at = None
+        self._stop_event.clear()
+        self._timer.start()
+        self._watchdog = threading.Thread(target=self._watch, name="jank-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stop_event.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        self._stopped_at = time.perf_counter()
+
+    # -------------------------- 主线程：探测定时器 --------------------------
+    def _tick(self):
+        now = time.perf_counter()
+        gap_ms = (now - self._beat) * 1000
+        self._beat = now
+        late_ms = max(gap_ms - self.interval_ms, 0.0)
+        self.samples += 1
+        self.histogram[bisect.bisect_left(BUCKETS_MS, late_ms)] += 1
+        self.max_ms = max(self.max_ms, late_ms)
+        if gap_ms >= self.threshold_ms:
+            self.total_stall_ms += gap_ms
+            if len(self.stalls) < self.max_stalls:
+                self.stalls.append({"at_s": round(now - gap_ms / 1000 - self._started_at, 3),
+                                    "duration_ms": round(gap_ms, 1),
+                                    "stack": self._stack})
+        self._stack = None
+
+    # -------------------------- 看门狗线程 --------------------------
+    def _watch(self):
+        threshold = self.threshold_ms / 1000
+        while not self._stop_event.wait(threshold / 4):
+            beat = self._beat
+            if beat != self._captured_beat and time.perf_counter() - beat >= threshold:
+                self._captured_beat = beat
+                frame = sys._current_frames().get(self._main_ident)
+                if frame is not None:
+                    self._stack = [f"{fs.filename}:{fs.lineno} {fs.name}"
+                                   for fs in traceback.extract_stack(frame)[-MAX_STACK_DEPTH:]]
+                    del frame
+
+    # -------------------------- 结果 --------------------------
+    def percentile(self, q):
+        """由直方图估算的分位数（返回所在桶的上界，ms）"""
+        target = q * self.samples
+        count = 0
+        for bound, n in zip(BUCKETS_MS + (None,), self.histogram):
+            count += n
+            if count >= target and n:
+                return bound if bound is not None else round(self.max_ms, 1)
+        return 0
+
+    def to_dict(self):
+        end = self._stopped_at or time.perf_counter()
+        return {
+            "interval_ms": self.interval_ms,
+            "threshold_ms": self.threshold_ms,
+            "duration_s": round(end - self._started_at, 3) if self._started_at else 0,
+            "samples": self.samples,
+            "max_late_ms": round(self.max_ms, 1),
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "total_stall_ms": round(self.total_stall_ms, 1),
+            "histogram": [{"le_ms": bound, "count": n}
+                          for bound, n in zip(BUCKETS_MS + (None,), self.histogram)],
+            "stalls": self.stalls,
+        }
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def summary(self):
+        data = self.to_dict()
+        lines = [f"主线程监视 {data['duration_s']} s，{data['samples']} 次探测：延迟 p50 ≤ {data['p50_ms']} ms，"
+                 f"p99 ≤ {data['p99_ms']} ms，最大 {data['max_late_ms']} ms；"
+                 f"超过 {self.threshold_ms} ms 的卡顿 {len(self.stalls)} 次，共 {data['total_stall_ms']} ms"]
+        for stall in sorted(self.stalls, key=lambda s: -s["duration_ms"])[:5]:
+            where = stall["stack"][-1] if stall["stack"] else "（未抓到调用栈）"
+            lines.append(f"  {stall['at_s']:8.3f} s  {stall['duration_ms']:8.1f} ms  {where}")
+        return "\n".join(lines)
+
+
+# -------------------------- 不改 demo 代码：包装 exec() 挂上监视器 --------------------------
+def install(threshold_ms=50, interval_ms=5, json_path=None):
+    """包装 QCoreApplication / QGuiApplication / QApplication 的 exec()（都是静态方法）"""
+    from PySide6 import QtCore, QtGui, QtWidgets
+
+    def wrap(cls):
+        original = cls.exec
+
+        def exec_with_monitor():
+            monitor = JankMonitor(interval_ms, threshold_ms)
+            monitor.start()
+            try:
+                return original()
+            finally:
+                monitor.stop()
+                print(monitor.summary(), file=sys.stderr)
+                if json_path:
+                    monitor.export_json(json_path)
+        cls.exec = staticmethod(exec_with_monitor)
+
+    for cls in (QtCore.QCoreApplication, QtGui.QGuiApplication, QtWidgets.QApplication):
+        wrap(cls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="监视任意 demo 的主线程卡顿")
+    parser.add_argument("--threshold", type=float, default=50, help="记录调用栈的卡顿阈值（ms）")
+    parser.add_argument("--interval", type=int, default=5, help="探测定时器间隔（ms）")
+    parser.add_argument("--json", help="导出 JSON 的路径")
+    parser.add_argument("script")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    options = parser.parse_args()
+    install(options.threshold, options.interval, options.json)
+    script = os.path.abspath(options.script)
+    sys.argv = [script] + options.args
+    sys.path.insert(0, os.path.dirname(script))
+    runpy.run_path(script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
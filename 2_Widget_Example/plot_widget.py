@@ -0,0 +1,124 @@
+"""实时曲线控件：后台每秒送来上万个采样点，界面只画每个像素列的最小 / 最大值
+
+- 采样存放在 NumPy 环形缓冲区（capacity 个点，写满后覆盖最旧的）
+- 每 samples_per_column 个点合成一个像素列，只画这一列的 [min, max] 竖线，不逐点连线
+- 扫描式显示（类似示波器 / 心电图）：新的列从左到右覆盖旧的列，光标前留 GAP 列空白；
+  已经画好的列不再移动，所以每帧只有新写入的几列需要重画
+- 列直接用 NumPy 光栅化到一张 QImage（与 numpy 数组共享内存），paintEvent 只把脏区域贴到屏幕
+- append() 只写缓冲区；光栅化和 update(脏区域) 由单次定时器合并，每帧最多一次
+- 绘制开销只与新增的列数和脏区域面积有关，与历史长度无关；改变大小或 y 范围时整幅重画一次
+"""
+import time
+
+import numpy as np
+from PySide6.QtCore import QRect, QTimer
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QWidget
+
+BACKGROUND = np.uint32(0xFF1E1E1E)
+FOREGROUND = np.uint32(0xFF4FC3F7)
+GAP = 8  # 扫描光标前的空白列数
+
+
+class StreamPlot(QWidget):
+    def __init__(self, capacity=1_000_000, samples_per_column=20, y_range=(-1.0, 1.0),
+                 frame_ms=16, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.samples_per_column = samples_per_column
+        self._data = np.zeros(capacity, dtype=np.float64)
+        self._count = 0            # 累计收到的采样数
+        self._drawn_columns = 0    # 累计已光栅化的列数
+        self._pixels = None        # (高, 宽) uint32，_image 与它共享内存
+        self._image = None
+        self.set_y_range(*y_range)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(frame_ms)
+        self._timer.timeout.connect(self._flush)
+        self.paint_count = 0
+        self.last_paint_ms = 0.0
+        self.setMinimumSize(200, 100)
+
+    @property
+    def sample_count(self):
+        return self._count
+
+    def append(self, samples):
+        """追加一批采样（主线程调用，通常连接到后台线程的 Signal(object)）"""
+        samples = np.asarray(samples, dtype=np.float64).ravel()
+        if len(samples) > self.capacity:
+            self._count += len(samples) - self.capacity
+            samples = samples[-self.capacity:]
+        start = self._count % self.capacity
+        head = min(len(samples), self.capacity - start)
+        self._data[start:start + head] = samples[:head]
+        self._data[:len(samples) - head] = samples[head:]
+        self._count += len(samples)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def set_y_range(self, low, high):
+        """纵轴范围 [low, high]；high 必须大于 low（相等时无法换算像素，反过来什么都画不出）"""
+        if not high > low:  # 也拦住 NaN
+            raise ValueError(f"y 范围必须满足 low < high，收到 ({low}, {high})")
+        self.y_range = (low, high)
+        self._redraw_all()
+
+    # -------------------------- 光栅化 --------------------------
+    def _flush(self):
+        """把新增的完整列画进 QImage，只对这些列（和光标前的空白）请求重绘"""
+        if self._pixels is None:
+            return
+        height, width = self._pixels.shape
+        spc = self.samples_per_column
+        total = self._count // spc
+        available = min(self._count, self.capacity) // spc - 1   # 环形缓冲区里还保留的完整列
+        new = min(total - self._drawn_columns, width - GAP, available)
+        if new <= 0:
+            return
+        first = total - new
+        indices = np.arange(first * spc, total * spc) % self.capacity
+        block = self._data[indices].reshape(new, spc)
+        columns = np.arange(first, total + GAP) % width
+        low, high = self.y_range
+        scale = (height - 1) / (high - low)
+        top = np.clip(((high - block.max(axis=1)) * scale).astype(np.int32), 0, height - 1)
+        bottom = np.clip(((high - block.min(axis=1)) * scale).astype(np.int32), 0, height - 1)
+        rows = np.arange(height)[:, None]
+        strip = np.full((height, new + GAP), BACKGROUND, dtype=np.uint32)
+        strip[:, :new] = np.where((rows >= top) & (rows <= bottom), FOREGROUND, BACKGROUND)
+        self._pixels[:, columns] = strip
+        self._drawn_columns = total
+        # 脏区域：从 first 列开始的 new + GAP 列，跨过右边界时拆成两块
+        x = first % width
+        span = new + GAP
+        self.update(QRect(x, 0, min(span, width - x), height))
+        if x + span > width:
+            self.update(QRect(0, 0, x + span - width, height))
+
+    def _redraw_all(self):
+        if self._pixels is None:
+            return
+        self._pixels[:] = BACKGROUND
+        self._drawn_columns = 0
+        self._flush()
+        self.update()
+
+    def resizeEvent(self, event):
+        size = event.size()
+        self._pixels = np.full((size.height(), size.width()), BACKGROUND, dtype=np.uint32)
+        self._image = QImage(self._pixels.data, size.width(), size.height(), size.width() * 4,
+                             QImage.Format.Format_RGB32)
+        self._redraw_all()
+
+    def paintEvent(self, event):
+        if self._image is None:
+            return
+        start = time.perf_counter()
+        rect = event.rect()
+        painter = QPainter(self)
+        painter.drawImage(rect, self._image, rect)
+        painter.end()
+        self.paint_count += 1
+        self.last_paint_ms = (time.perf_counter() - start) * 1000
@@ -0,0 +1,229 @@
+"""进程池后台任务：纯 Python 的 CPU 密集计算绕开 GIL（接口与 QThreadUI2.py 的 BackgroundTask 相同）
+
+QThread / QThreadPool 中的纯 Python 计算会被 GIL 串行化，多开线程也不会变快。
+ProcessTask 把任务拆成若干块交给 concurrent.futures.ProcessPoolExecutor：
+- 信号与 BackgroundTask 一致：start_task → run_task()，progress_updated(int)，task_finished(str)；
+  另有 results_ready(list)，按块顺序给出每块的返回值
+- 子进程里的任务函数调用 report_progress(n) 报告完成了 n 个单位，is_cancelled() 检查取消；
+  进度在子进程内先累计、最多每 50 ms 写一次 multiprocessing.Queue
+- 每次 run_task() 分配一个运行编号，进度和块完成都带上编号，上一次（或已取消的）运行
+  迟到的进度直接丢弃；取消时清空队列里还没转发的进度
+- 主进程用一个 QThread 阻塞在 queue.get() 上转发进度（不轮询、不占 CPU），
+  每块结束由 future 回调发信号，全部跨线程排队到 GUI 线程
+- 进程池用 spawn 方式启动并常驻复用（fork 一个已经加载了 Qt 的进程不安全）
+
+任务函数必须定义在模块顶层（子进程要能 import 到）。
+"""
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PySide6.QtCore import QObject, QThread, Signal, Slot
+
+_REPORT_INTERVAL = 0.05
+
+# -------------------------- 1. 子进程侧（由 initializer 设置的进程级全局变量）--------------------------
+_queue = None
+_cancel_event = None
+_run_id = 0
+_pending_units = 0
+_next_report = 0.0
+
+
+def _init_worker(queue, cancel_event):
+    global _queue, _cancel_event
+    _queue, _cancel_event = queue, cancel_event
+
+
+def report_progress(units=1):
+    """任务函数中调用：又完成了 units 个单位（累计后定时发送，开销很小）"""
+    global _pending_units, _next_report
+    _pending_units += units
+    now = time.monotonic()
+    if now >= _next_report:
+        _flush_progress()
+        _next_report = now + _REPORT_INTERVAL
+
+
+def is_cancelled():
+    """任务函数中调用：主进程是否请求了取消"""
+    return _cancel_event is not None and _cancel_event.is_set()
+
+
+def _flush_progress():
+    global _pending_units
+    if _pending_units and _queue is not None:
+        _queue.put((_run_id, _pending_units))
+        _pending_units = 0
+
+
+def _noop():
+    return os.getpid()
+
+
+def _run_chunk(fn, chunk, run_id):
+    global _run_id
+    _run_id = run_id  # 上一块结束时已经 flush，累计的进度都属于这次运行
+    try:
+        return fn(chunk)
+    finally:
+        _flush_progress()
+
+
+# -------------------------- 2. 主进程侧 --------------------------
+class _QueueDrain(QThread):
+    """阻塞读取进度队列并转发为信号；收到 None 时退出"""
+    units_done = Signal(int, int)  # (运行编号, 单位数)
+
+    def __init__(self, queue, parent=None):
+        super().__init__(parent)
+        self._queue = queue
+
+    def run(self):
+        while (item := self._queue.get()) is not None:
+            self.units_done.emit(*item)
+
+
+class ProcessTask(QObject):
+    progress_updated = Signal(int)  # 进度信号（0-100）
+    task_finished = Signal(str)     # 完成信号（返回结果说明）
+    results_ready = Signal(object)  # 每块的返回值列表（按块顺序）
+    start_task = Signal()           # 触发任务启动的信号
+    _chunk_done = Signal(int, int, object)  # 内部：(运行编号, 块序号, future)，从 future 回调线程排队到 GUI 线程
+
+    def __init__(self, fn, chunks, total_units=None, max_workers=None, parent=None):
+        """fn(chunk) 在子进程中处理一块；total_units 为所有块 report_progress 的总量，
+        默认每块报告 len(chunk) 个单位"""
+        super().__init__(parent)
+        self._fn = fn
+        self._chunks = list(chunks)
+        self._total_units = total_units or sum(len(chunk) for chunk in self._chunks)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        context = multiprocessing.get_context("spawn")
+        self._queue = context.Queue()
+        self._cancel_event = context.Event()
+        self._pool = None
+        self._drain = _QueueDrain(self._queue)
+        self._drain.units_done.connect(self._on_units_done)
+        self._drain.start()
+        self._run_id = 0
+        self._futures = []
+        self._results = []
+        self._done_units = 0
+        self._done_chunks = 0
+        self._last_percent = -1
+        self.start_task.connect(self.run_task)
+        self._chunk_done.connect(self._on_chunk_done)
+
+    def _ensure_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self.max_workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker, initargs=(self._queue, self._cancel_event))
+        return self._pool
+
+    def warm_up(self):
+        """提前启动全部子进程（spawn 启动较慢，避免算在第一次任务里）"""
+        pool = self._ensure_pool()
+        for future in [pool.submit(_noop) for _ in range(self.max_workers * 2)]:
+            future.result()
+
+    @Slot()
+    def run_task(self):
+        """提交所有块（GUI 线程调用，立即返回）"""
+        pool = self._ensure_pool()
+        self._cancel_event.clear()
+        self._run_id += 1
+        self._results = [None] * len(self._chunks)
+        self._done_units = self._done_chunks = 0
+        self._last_percent = -1
+        self._emit_progress(0)
+        self._futures = []
+        for index, chunk in enumerate(self._chunks):
+            future = pool.submit(_run_chunk, self._fn, chunk, self._run_id)
+            future.add_done_callback(
+                lambda f, r=self._run_id, i=index: self._chunk_done.emit(r, i, f))
+            self._futures.append(future)
+
+    def stop_task(self):
+        """取消：未开始的块直接取消，运行中的块由任务函数检查 is_cancelled() 后自行返回"""
+        self._cancel_event.set()
+        for future in self._futures:
+            future.cancel()
+        # 已经写进队列、还没转发的进度不再需要（转发线程同时在读，读到多少丢多少）
+        try:
+            while True:
+                item = self._queue.get_nowait()
+                if item is None:  # 不吞掉 shutdown() 的退出标记
+                    self._queue.put(None)
+                    break
+        except queue.Empty:
+            pass
+
+    def shutdown(self):
+        """关闭进程池与转发线程（窗口关闭时调用）"""
+        self.stop_task()
+        self._queue.put(None)
+        self._drain.wait()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    @Slot(int, int)
+    def _on_units_done(self, run_id, units):
+        if run_id != self._run_id:
+            return  # 上一次运行迟到的进度
+        self._done_units += units
+        self._emit_progress(min(self._done_units * 100 // max(self._total_units, 1), 99))
+
+    def _emit_progress(self, percent):
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress_updated.emit(percent)
+
+    @Slot(int, int, object)
+    def _on_chunk_done(self, run_id, index, future):
+        if run_id != self._run_id:
+            return  # 上一次运行的块（被取代或取消后才结束）
+        if not future.cancelled() and future.exception() is None:
+            self._results[index] = future.result()
+        self._done_chunks += 1
+        if self._done_chunks < len(self._chunks):
+            return
+        errors = [f.exception() for f in self._futures if not f.cancelled() and f.exception()]
+        if self._cancel_event.is_set():
+            self.task_finished.emit("任务已取消！")
+        elif errors:
+            self.task_finished.emit(f"任务失败：{errors[0]!r}")
+        else:
+            self._emit_progress(100)
+            self.results_ready.emit(self._results)
+            self.task_finished.emit("后台任务执行完成！")
+
+
+# -------------------------- 3. 示例任务（CPU 密集的纯 Python 计算）--------------------------
+def count_primes(numbers):
+    """统计 numbers 中的素数个数（试除法）；每 1000 个数报告一次进度、检查一次取消"""
+    count = reported = 0
+    for i, n in enumerate(numbers):
+        if i % 1000 == 0:
+            report_progress(i - reported)
+            reported = i
+            if is_cancelled():
+                return count
+        if n < 2:
+            continue
+        for d in range(2, int(n ** 0.5) + 1):
+            if n % d == 0:
+                break
+        else:
+            count += 1
+    report_progress(len(numbers) - reported)
+    return count
+
+
+def make_chunks(stop, chunk_count):
+    """把 range(stop) 切成 chunk_count 块（交错切分，各块计算量接近）"""
+    return [range(start, stop, chunk_count) for start in range(chunk_count)]
@@ -0,0 +1,122 @@
+"""跨线程进度节流：后台循环每一步都可以调用 update()，但每秒最多真正 emit max_rate 次
+
+后台循环如果每一步都 emit progress_updated，步数上百万时，每次 emit 都会往主线程事件队列
+塞一个排队事件，主线程处理不过来，界面反而卡死。QThreadUI2.py 的 BackgroundTask、
+WarmWorker（QThreadUI.py 的 BackgroundWorker 经 request.report_progress 报告进度）、
+TaskExecutor 的 TaskHandle、qt_asyncio 的 AsyncTask 都通过它发送进度。
+
+ThrottledProgress（在后台线程中使用）：
+- 距上次发送不足 1/max_rate 秒的值只暂存（只保留最新的一个），被后来的值覆盖的计入 suppressed
+- 与上次发送值相同的也不再发送（百万步换算成百分比，绝大部分是重复值）
+- 暂存值之后没有新的 update()（循环卡在一步很慢的操作上）时，由 flusher 在间隔到期时补发，
+  界面不会停在旧值上。默认的 flusher 是整个进程共用的一个长驻线程（ProgressFlusher.shared()），
+  首次需要补发时才启动，之后不再创建线程；后台线程一般没有运行事件循环，QTimer 不会触发。
+  在主线程里 update() 的（如 qt_asyncio 的协程）可以传入用事件循环定时器补发的 flusher，不需要任何线程
+- finish() 一定把最后的值发出去；也可以用 with 语句，退出时自动 finish()
+"""
+import heapq
+import itertools
+import threading
+import time
+
+
+class ProgressFlusher:
+    """为任意多个 ThrottledProgress 补发暂存值：一个长驻线程，到期时间排在堆里，Condition 等最早的一个"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._heap = []                 # (到期时间, 序号, throttle)
+        self._counter = itertools.count()
+        self._thread = None
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def schedule(self, throttle, delay):
+        """delay 秒后调用 throttle.flush()"""
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), throttle))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ProgressFlusher", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                deadline = self._heap[0][0]
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)  # 期间有更早的到期时间加入会被唤醒，重新检查
+                    continue
+                throttle = heapq.heappop(self._heap)[2]
+            throttle.flush()
+
+
+class ThrottledProgress:
+    def __init__(self, signal, max_rate=30, clock=time.monotonic, trailing=True, flusher=None):
+        self._signal = signal
+        self._interval = 1 / max_rate
+        self._clock = clock
+        self._flusher = (flusher or ProgressFlusher.shared()) if trailing else None
+        self._lock = threading.Lock()  # 发送 / 登记补发时加锁（update() 与 flusher 可能在不同线程）
+        self._flush_scheduled = False
+        self._next_time = 0.0
+        self._latest = None    # 最新的值（只由 update() 写）；与 _last_sent 不同即为暂存待发
+        self._last_sent = None
+        self.emitted = 0      # 实际 emit 次数
+        self.suppressed = 0   # 从未发送出去的值（被覆盖 / 与上次相同）
+
+    def update(self, value):
+        if value == self._last_sent:
+            self.suppressed += 1
+            return
+        if self._latest != self._last_sent:
+            self.suppressed += 1  # 上一个暂存值还没发出去就被覆盖
+        self._latest = value
+        now = self._clock()
+        if now >= self._next_time:
+            with self._lock:
+                self._send(now)
+        elif self._flusher is not None and not self._flush_scheduled:
+            # 热路径不加锁：先写 _latest 再看 _flush_scheduled；flush() 先清标记再读 _latest，
+            # 这里看到补发已登记，它就一定会读到刚写入的值
+            with self._lock:
+                if not self._flush_scheduled:
+                    self._flush_scheduled = True
+                    self._flusher.schedule(self, self._next_time - now)
+
+    def flush(self):
+        """flusher 到期时调用：暂存值还没被发出去就发出去"""
+        with self._lock:
+            self._flush_scheduled = False
+            self._send(self._clock())
+
+    def finish(self):
+        """发送暂存的最后一个值（若有）；之后到期的补发没有可发的值，什么也不做"""
+        with self._lock:
+            self._send(self._clock())
+
+    def _send(self, now):
+        value = self._latest
+        if value != self._last_sent:
+            self._last_sent = value
+            self._next_time = now + self._interval
+            self.emitted += 1
+            self._signal.emit(value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.finish()
+        return False
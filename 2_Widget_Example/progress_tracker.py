@@ -0,0 +1,234 @@
+"""多阶段进度：按权重汇总子阶段，计算平滑后的吞吐量（项/秒）和剩余时间
+
+QThreadUI.py / QThreadUI2.py / QTTimerUI.py 的进度条只有一个 0-100 的整数，看不出速度，也不知道还要多久。
+
+ProgressTracker（整个任务，本身也是一个 Stage）：
+- 任务开始前声明子阶段：add_stage(名称, weight, total)，子阶段还可以再 add_stage（层级）；
+  阶段进度 = 已完成项 / total，父阶段进度 = 子阶段进度按 weight 加权平均
+- 后台线程只做 stage.advance(n)：一次整数加法，不加锁、不发信号（每个阶段只有一个线程写）
+- 界面用定时器按帧率调用 snapshot()：得到 ProgressSnapshot（总进度、当前阶段、项/秒、剩余秒数）；
+  吞吐量用指数滑动平均（时间常数 smoothing_s），剩余时间 = 剩余进度 / 平滑后的进度速度
+- 每个阶段记录开始 / 结束时间：timings()、summary()、export_json() 用于事后找出最耗时的阶段
+"""
+import json
+import math
+import threading
+import time
+from typing import NamedTuple, Optional
+
+
+class ProgressSnapshot(NamedTuple):
+    fraction: float            # 总进度 0.0-1.0
+    stage: str                 # 当前阶段（层级用 / 连接），没有进行中的阶段时为 ""
+    stage_done: int
+    stage_total: Optional[int]
+    rate: float                # 当前阶段平滑后的吞吐量（项/秒）
+    eta: Optional[float]       # 预计剩余秒数，速度未知时为 None
+    elapsed: float
+
+    @property
+    def percent(self):
+        return int(self.fraction * 100)
+
+    def text(self):
+        eta = "--" if self.eta is None else format_seconds(self.eta)
+        stage = f"{self.stage}：" if self.stage else ""
+        return f"{stage}{self.percent}%，{self.rate:,.0f} 项/秒，剩余 {eta}"
+
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(math.ceil(seconds)), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+class Stage:
+    def __init__(self, name, weight=1.0, total=None, parent=None, clock=time.perf_counter):
+        self.name = name
+        self.weight = weight
+        self.total = total          # 总项数；None 表示未知（只有完成 / 未完成两种进度）
+        self.done = 0
+        self.parent = parent
+        self.children = []
+        self.started_at = None
+        self.finished_at = None
+        self.completed = False
+        self._clock = clock
+
+    @property
+    def path(self):
+        if self.parent is None or self.parent.parent is None:
+            return self.name
+        return f"{self.parent.path}/{self.name}"
+
+    def add_stage(self, name, weight=1.0, total=None):
+        stage = Stage(name, weight, total, parent=self, clock=self._clock)
+        self.children.append(stage)
+        return stage
+
+    # -------------------------- 后台线程调用 --------------------------
+    def start(self):
+        if self.started_at is None:
+            self.started_at = self._clock()
+            if self.parent is not None:
+                self.parent.start()
+        return self
+
+    def advance(self, n=1):
+        if self.started_at is None:
+            self.start()
+        self.done += n
+
+    def set(self, done):
+        if self.started_at is None:
+            self.start()
+        self.done = done
+
+    def finish(self, completed=True):
+        """结束阶段；completed=False（取消 / 出错）时保留实际进度，只记录结束时间"""
+        if self.finished_at is None:
+            self.start()
+            self.finished_at = self._clock()
+            self.completed = completed
+            if completed and self.total is not None:
+                self.done = self.total
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.finish(completed=exc_type is None)
+        return False
+
+    # -------------------------- 读取（任意线程）--------------------------
+    @property
+    def fraction(self):
+        if self.completed:
+            return 1.0
+        if self.children:
+            weights = sum(child.weight for child in self.children)
+            return sum(child.weight * child.fraction for child in self.children) / weights if weights else 0.0
+        if self.total:
+            return min(self.done / self.total, 1.0)
+        return 0.0
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or self._clock()) - self.started_at
+
+    def active(self):
+        """最深一层已开始、未结束的阶段"""
+        for child in self.children:
+            if child.started_at is not None and child.finished_at is None:
+                return child.active()
+        return self
+
+    @property
+    def planned_share(self):
+        """按权重，本阶段应占整个任务的比例"""
+        if self.parent is None:
+            return 1.0
+        weights = sum(child.weight for child in self.parent.children)
+        return self.weight / weights * self.parent.planned_share if weights else 0.0
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def __repr__(self):
+        return (f"Stage({self.path!r}, weight={self.weight}, done={self.done}, total={self.total}, "
+                f"fraction={self.fraction:.3f}, elapsed={self.elapsed:.3f} s)")
+
+
+class ProgressTracker(Stage):
+    def __init__(self, name="任务", smoothing_s=2.0, clock=time.perf_counter):
+        super().__init__(name, clock=clock)
+        self.smoothing_s = smoothing_s
+        self._lock = threading.Lock()  # 只保护 snapshot() 的平滑状态（界面可能在多处轮询）
+        self._last_time = None
+        self._last_fraction = 0.0
+        self._last_stage = None
+        self._last_done = 0
+        self._fraction_rate = None     # 平滑后的总进度速度（每秒）
+        self._item_rate = 0.0          # 平滑后的当前阶段吞吐量（项/秒）
+
+    def snapshot(self, min_interval=0.1):
+        """主线程按帧率调用；两次采样间隔不足 min_interval 秒时沿用上次的速度，避免抖动"""
+        with self._lock:
+            now = self._clock()
+            fraction = self.fraction
+            stage = self.active()
+            done = stage.done
+            if stage is not self._last_stage:
+                # 换了阶段：吞吐量重新从这个阶段的平均值开始
+                self._last_stage, self._last_done = stage, done
+                self._item_rate = done / stage.elapsed if stage.elapsed > 0 else 0.0
+            if self._last_time is None:
+                self._last_time, self._last_fraction = now, fraction
+                if self.elapsed > 0 and fraction > 0:
+                    self._fraction_rate = fraction / self.elapsed
+            elif now - self._last_time >= min_interval:
+                dt = now - self._last_time
+                alpha = 1 - math.exp(-dt / self.smoothing_s)
+                fraction_rate = (fraction - self._last_fraction) / dt
+                item_rate = (done - self._last_done) / dt
+                if self._fraction_rate is None:
+                    self._fraction_rate = fraction_rate
+                else:
+                    self._fraction_rate += alpha * (fraction_rate - self._fraction_rate)
+                self._item_rate += alpha * (item_rate - self._item_rate)
+                self._last_time, self._last_fraction, self._last_done = now, fraction, done
+            if self.completed:
+                eta = 0.0
+            elif self._fraction_rate:
+                eta = (1 - fraction) / self._fraction_rate
+            else:
+                eta = None
+            return ProgressSnapshot(fraction, stage.path if stage is not self else "", done, stage.total,
+                                    self._item_rate, eta, self.elapsed)
+
+    # -------------------------- 事后分析：各阶段耗时 --------------------------
+    def timings(self):
+        total = self.elapsed
+        rows = []
+        for stage in self.walk():
+            if stage is self:
+                continue
+            seconds = stage.elapsed
+            rows.append({
+                "stage": stage.path,
+                "weight": stage.weight,
+                "planned_share": round(stage.planned_share, 3),
+                "done": stage.done,
+                "total": stage.total,
+                "completed": stage.completed,
+                "seconds": round(seconds, 4),
+                "share": round(seconds / total, 3) if total else 0.0,
+                # 父阶段的各子阶段项目不同类，不汇总吞吐量
+                "rate": round(stage.done / seconds, 1) if seconds and not stage.children else None,
+            })
+        return rows
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "completed": self.completed,
+            "fraction": round(self.fraction, 4),
+            "seconds": round(self.elapsed, 4),
+            "stages": self.timings(),
+        }
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def summary(self):
+        """一行总耗时 + 每个阶段一行；权重与实际耗时占比差得越多，ETA 越不准"""
+        lines = [f"{self.name} 用时 {self.elapsed:.2f} s（进度 {self.fraction:.0%}）"]
+        for row in self.timings():
+            lines.append(f"  {row['stage']:<16} {row['seconds']:8.3f} s  占 {row['share']:6.1%}"
+                         f"（按权重 {row['planned_share']:6.1%}）"
+                         + (f"  {row['rate']:>12,.0f} 项/秒" if row["rate"] is not None else ""))
+        return "\n".join(lines)
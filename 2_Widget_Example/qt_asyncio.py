@@ -0,0 +1,211 @@
+"""在 Qt 事件循环上运行 asyncio 协程（I/O 密集任务不再一个任务占一个线程）
+
+QThreadUI.py / QThreadUI2.py 用 time.sleep(0.05) 模拟 I/O，每个任务都要独占一个线程。
+改成协程后，成百上千个任务在主线程里并发等待，不需要任何线程。
+
+PySide6.QtAsyncio（6.9）还没有实现 socket 相关接口（create_connection / create_server /
+add_reader 等会抛 NotImplementedError），所以这里用标准的 asyncio.SelectorEventLoop，
+只替换它的 selector：
+- QtSelector 把每个注册的 fd 映射成 QSocketNotifier
+- asyncio 需要等待时（select(timeout)），不阻塞在 select 上，而是进入 QEventLoop.exec()：
+  界面事件照常处理，fd 就绪或超时时退出，再用 select(0) 取就绪列表
+- asyncio 有待执行的回调时（timeout == 0），只处理一次已到达的 Qt 事件，不等待
+
+槽函数在 QEventLoop.exec() 内部执行，其中调用 call_soon / call_later（创建任务、设置 future 结果等）
+会让 QtEventLoop 立即结束这次等待，asyncio 随后执行新回调、重新计算超时。
+"""
+import asyncio
+import math
+import selectors
+
+from PySide6.QtCore import (QCoreApplication, QEvent, QEventLoop, QObject, QSocketNotifier, QTimer, Qt,
+                            Signal, Slot)
+
+from progress_throttle import ThrottledProgress
+
+
+# -------------------------- 1. 由 Qt 事件循环等待的 selector --------------------------
+class QtSelector(selectors.BaseSelector):
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()  # 真正判断就绪用（只以 timeout=0 调用）
+        self._notifiers = {}                          # fd -> {事件: QSocketNotifier}
+        self._wait_loop = QEventLoop()
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._wait_loop.quit)
+        self.waiting = False
+
+    def register(self, fileobj, events, data=None):
+        key = self._selector.register(fileobj, events, data)
+        self._update_notifiers(key.fd, events)
+        return key
+
+    def unregister(self, fileobj):
+        key = self._selector.unregister(fileobj)
+        self._update_notifiers(key.fd, 0)
+        return key
+
+    def modify(self, fileobj, events, data=None):
+        key = self._selector.modify(fileobj, events, data)
+        self._update_notifiers(key.fd, events)
+        return key
+
+    def _update_notifiers(self, fd, events):
+        notifiers = self._notifiers.setdefault(fd, {})
+        for event, kind in ((selectors.EVENT_READ, QSocketNotifier.Read),
+                            (selectors.EVENT_WRITE, QSocketNotifier.Write)):
+            notifier = notifiers.get(event)
+            if events & event and notifier is None:
+                notifier = notifiers[event] = QSocketNotifier(fd, kind)
+                notifier.activated.connect(self._wait_loop.quit)
+            elif not events & event and notifier is not None:
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+                del notifiers[event]
+        if not notifiers:
+            del self._notifiers[fd]
+
+    def select(self, timeout=None):
+        if timeout is not None and timeout <= 0:
+            QCoreApplication.processEvents()  # 有待执行的回调：只处理已到达的界面事件
+            return self._selector.select(0)
+        ready = self._selector.select(0)
+        if ready:
+            return ready
+        if timeout is not None:
+            self._timer.start(math.ceil(timeout * 1000))
+        self.waiting = True
+        self._wait_loop.exec()  # 阻塞在 Qt 事件循环中，直到 fd 就绪 / 超时 / 有新回调
+        self.waiting = False
+        self._timer.stop()
+        return self._selector.select(0)
+
+    def wake_up(self):
+        if self.waiting:
+            self._wait_loop.quit()
+
+    def get_map(self):
+        return self._selector.get_map()
+
+    def close(self):
+        for notifiers in self._notifiers.values():
+            for notifier in notifiers.values():
+                notifier.setEnabled(False)
+        self._notifiers.clear()
+        self._selector.close()
+
+
+class QtEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        super().__init__(QtSelector())
+
+    # 槽函数里新加的回调 / 定时器：结束当前等待（call_later 最终也调用 call_at）
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self._selector.wake_up()
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        self._selector.wake_up()
+        return handle
+
+
+def run(coro):
+    """在 Qt 事件循环上运行协程直到结束（需要先创建 QApplication / QCoreApplication）"""
+    loop = QtEventLoop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+class _CloseWatcher(QObject):
+    """窗口关闭（Close 事件被接受、窗口不再可见）时设置 future 结果"""
+
+    def __init__(self, window, future):
+        super().__init__(window)
+        self._window = window
+        self._future = future
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Close:
+            # 此时 closeEvent 还没处理，下一轮再看窗口是否真的关了
+            self._future.get_loop().call_soon(self._check)
+        return False
+
+    def _check(self):
+        if not self._window.isVisible() and not self._future.done():
+            self._future.set_result(None)
+
+
+def exec_window(window):
+    """替代 app.exec()：运行到 window 关闭，期间可以使用 asyncio
+    （lastWindowClosed 只在 app.exec() 中才会发出，这里直接监听窗口的 Close 事件）"""
+    async def wait_closed():
+        closed = asyncio.get_running_loop().create_future()
+        _CloseWatcher(window, closed)
+        await closed
+    run(wait_closed())
+    return 0
+
+
+# -------------------------- 2. 协程版 BackgroundTask --------------------------
+class _LoopFlusher:
+    """协程和 report_progress 都在主线程：进度补发交给事件循环的 call_later，不需要线程"""
+
+    def __init__(self, loop):
+        self._loop = loop
+
+    def schedule(self, throttle, delay):
+        self._loop.call_later(delay, throttle.flush)
+
+
+class AsyncTask(QObject):
+    """与 BackgroundTask 相同的信号接口；任务是协程函数 coro_fn(task, *args)，
+    其中调用 task.report_progress(value) 报告进度"""
+    progress_updated = Signal(int)  # 进度信号（0-100）
+    task_finished = Signal(str)     # 完成信号（返回结果说明）
+    start_task = Signal()           # 触发任务启动的信号
+
+    def __init__(self, coro_fn, *args, parent=None):
+        super().__init__(parent)
+        self._coro_fn = coro_fn
+        self._args = args
+        self._task = None
+        self._progress = None
+        self.result = None
+        self.start_task.connect(self.run_task)
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    @Slot()
+    def run_task(self):
+        """启动协程（需在 QtEventLoop 运行期间调用，例如按钮的槽函数中）"""
+        loop = asyncio.get_event_loop()
+        self._progress = ThrottledProgress(self.progress_updated, flusher=_LoopFlusher(loop))
+        self._task = loop.create_task(self._coro_fn(self, *self._args))
+        self._task.add_done_callback(self._on_done)
+
+    def stop_task(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    def report_progress(self, value):
+        self._progress.update(value)
+
+    def _on_done(self, task):
+        self._progress.finish()
+        if task.cancelled():
+            self.task_finished.emit("任务已取消！")
+        elif task.exception() is not None:
+            self.task_finished.emit(f"任务失败：{task.exception()!r}")
+        else:
+            self.result = task.result()
+            self.task_finished.emit("后台任务执行完成！")
@@ -0,0 +1,123 @@
+"""有界结果流：后台线程分块送出大量结果行，界面跟不上时生产者阻塞（背压）
+
+QThreadUI2.py 的 BackgroundTask 只发送进度和最后一个字符串。如果任务产生上百万行结果、
+每行（或每块）都直接 emit，生产者远快于界面时，主线程事件队列和内存会无限增长。
+ResultChannel（属于主线程的 QObject）：
+- 生产者线程调用 put(row) / put_many(rows)：先攒成 chunk_size 行一块，再放入最多 max_chunks 块的队列；
+  队列满时阻塞等待，直到界面取走一块（阻塞次数与时间记在 stalls / stall_time）
+- 主线程每轮事件循环最多用 budget_ms 毫秒取块，每块发一次 chunk_ready(list)（接到模型的追加函数）；
+  预算用完时用 0 ms 定时器把剩下的留到下一轮，中间先处理界面事件
+- 生产者结束时调用 close()（会送出最后不满一块的行）；所有块都送达后发出 finished
+- cancel()（主线程）丢弃未取出的块，阻塞中的 put 抛出 TaskCancelled
+"""
+import threading
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+from cancel_token import TaskCancelled
+
+
+class ResultChannel(QObject):
+    chunk_ready = Signal(object)  # 一块结果行（list），在主线程发出
+    finished = Signal()           # 生产者已 close()，且所有块都已送达
+    _wake = Signal()              # 内部：生产者线程通知主线程来取
+
+    def __init__(self, max_chunks=8, chunk_size=1000, budget_ms=8, parent=None):
+        super().__init__(parent)
+        self.max_chunks = max_chunks
+        self.chunk_size = chunk_size
+        self.budget_ms = budget_ms
+        self._condition = threading.Condition()
+        self._queue = deque()
+        self._buffer = []              # 生产者线程中攒的半块
+        self._closed = False
+        self._cancelled = False
+        self._drain_scheduled = False  # 已经通知主线程、还没取空
+        self._finished_sent = False
+        self.max_depth = 0             # 队列中同时存在的最多块数
+        self.stalls = 0                # 生产者因队列满而阻塞的次数
+        self.stall_time = 0.0          # 生产者阻塞的总时间（秒）
+        self.rows_put = 0
+        self.rows_delivered = 0
+        self._wake.connect(self._drain)
+
+    @property
+    def depth(self):
+        """当前队列中的块数"""
+        return len(self._queue)
+
+    # -------------------------- 生产者线程 --------------------------
+    def put(self, row):
+        self._buffer.append(row)
+        if len(self._buffer) >= self.chunk_size:
+            chunk, self._buffer = self._buffer, []
+            self._push(chunk)
+
+    def put_many(self, rows):
+        self._buffer.extend(rows)
+        while len(self._buffer) >= self.chunk_size:
+            chunk = self._buffer[:self.chunk_size]
+            del self._buffer[:self.chunk_size]
+            self._push(chunk)
+
+    def close(self):
+        """生产结束（正常结束或取消后都要调用）"""
+        if self._buffer and not self._cancelled:
+            chunk, self._buffer = self._buffer, []
+            try:
+                self._push(chunk)
+            except TaskCancelled:
+                pass
+        with self._condition:
+            self._closed = True
+            wake = not self._drain_scheduled
+            self._drain_scheduled = True
+        if wake:
+            self._wake.emit()
+
+    def _push(self, chunk):
+        with self._condition:
+            if len(self._queue) >= self.max_chunks and not self._cancelled:
+                start = time.perf_counter()
+                self.stalls += 1
+                while len(self._queue) >= self.max_chunks and not self._cancelled:
+                    self._condition.wait()
+                self.stall_time += time.perf_counter() - start
+            if self._cancelled:
+                raise TaskCancelled()
+            self._queue.append(chunk)
+            self.rows_put += len(chunk)
+            self.max_depth = max(self.max_depth, len(self._queue))
+            wake = not self._drain_scheduled
+            self._drain_scheduled = True
+        if wake:
+            self._wake.emit()
+
+    # -------------------------- 主线程 --------------------------
+    def cancel(self):
+        with self._condition:
+            self._cancelled = True
+            self._queue.clear()
+            self._condition.notify_all()
+
+    @Slot()
+    def _drain(self):
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._drain_scheduled = False
+                    finished = self._closed and not self._finished_sent
+                    self._finished_sent = self._finished_sent or finished
+                    break
+                chunk = self._queue.popleft()
+                self._condition.notify()  # 空出一个位置，唤醒阻塞的生产者
+            self.rows_delivered += len(chunk)
+            self.chunk_ready.emit(chunk)
+            if time.perf_counter() >= deadline:
+                QTimer.singleShot(0, self._drain)  # 预算用完：先回到事件循环，下一轮继续
+                return
+        if finished:
+            self.finished.emit()
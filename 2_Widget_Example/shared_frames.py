@@ -0,0 +1,95 @@
+"""共享内存图像环：后台线程 / 子进程直接把像素写进共享缓冲区，界面零拷贝包装成 QImage
+
+通过 Signal(object) 发送 QImage / numpy 数组时，为了让后台线程能继续写下一帧，通常要先 copy() 一份；
+跨进程时还要经过 pickle，至少再复制一次。FrameRing：
+- 由主进程创建 slots 块 multiprocessing.shared_memory（每块一帧 width × height × 4 字节，
+  QImage.Format_RGB32 / ARGB32 的像素布局）
+- 空闲槽号放在队列里（线程用 queue.Queue，进程用 multiprocessing 的 Queue）：
+  生产者 acquire() 取一个空闲槽（没有空闲槽时阻塞 = 背压），用 array(slot) 得到的 numpy 视图写像素，
+  再把槽号发给界面（信号或队列，只传一个整数）
+- 界面 image(slot) 得到直接指向共享内存的 QImage（不复制），显示下一帧后 release() 旧槽
+- 子进程用 handle() 得到的描述对象调用 FrameRing.attach(handle) 连接同一组缓冲区
+- image() 返回的 QImage 上挂着导出共享内存的数组：QImage 还活着时 close() 抛 BufferError，
+  不会关掉它正在指向的内存（否则之后再读像素会直接崩溃）；需要长期保存的帧请 image.copy()
+- 创建者 close() 时同时 unlink()
+
+典型用法是 3 个槽（三缓冲）：一个正在显示、一个等待显示、一个正在写。
+"""
+import queue
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+
+class FrameRing:
+    def __init__(self, width, height, slots=3, context=None):
+        """创建共享缓冲区；子进程要访问时传入 multiprocessing 上下文（如 get_context("spawn")）"""
+        self.width, self.height = width, height
+        self.bytes_per_line = width * 4
+        self.nbytes = self.bytes_per_line * height
+        self._owner = True
+        self._blocks = [shared_memory.SharedMemory(create=True, size=self.nbytes) for _ in range(slots)]
+        self._exports = []  # image() 导出的像素数组（弱引用）
+        self._free = context.Queue() if context is not None else queue.Queue()
+        for slot in range(slots):
+            self._free.put(slot)
+
+    @classmethod
+    def attach(cls, handle):
+        """在子进程中连接已有的共享缓冲区"""
+        ring = cls.__new__(cls)
+        names, ring.width, ring.height, ring._free = handle
+        ring.bytes_per_line = ring.width * 4
+        ring.nbytes = ring.bytes_per_line * ring.height
+        ring._owner = False
+        ring._blocks = [shared_memory.SharedMemory(name=name) for name in names]
+        ring._exports = []
+        return ring
+
+    def handle(self):
+        """可 pickle 的描述对象，作为子进程参数传给 attach()"""
+        return [block.name for block in self._blocks], self.width, self.height, self._free
+
+    @property
+    def slots(self):
+        return len(self._blocks)
+
+    # -------------------------- 生产者侧 --------------------------
+    def acquire(self, timeout=None):
+        """取一个空闲槽号；timeout 秒内没有空闲槽返回 None"""
+        try:
+            return self._free.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def array(self, slot):
+        """槽的 numpy 视图，形状 (height, width, 4)，每个像素按内存顺序为 B, G, R, A"""
+        return np.ndarray((self.height, self.width, 4), dtype=np.uint8, buffer=self._blocks[slot].buf)
+
+    # -------------------------- 界面侧 --------------------------
+    def image(self, slot, image_format=QImage.Format_RGB32):
+        """直接指向共享内存的 QImage（不复制像素；release 之前不要让生产者再写这个槽）"""
+        pixels = np.frombuffer(self._blocks[slot].buf, dtype=np.uint8)
+        image = QImage(pixels, self.width, self.height, self.bytes_per_line, image_format)
+        # QImage 自己不持有缓冲区：把导出的数组挂在它上面，QImage 活多久，共享内存就被占用多久
+        image._shared_pixels = pixels
+        self._exports = [ref for ref in self._exports if ref() is not None]
+        self._exports.append(weakref.ref(pixels))
+        return image
+
+    def release(self, slot):
+        """槽用完了（已经显示了更新的帧），还给生产者"""
+        self._free.put(slot)
+
+    def close(self):
+        """还有 image() 得到的 QImage 活着时抛 BufferError（此时什么都不关闭）"""
+        alive = sum(ref() is not None for ref in self._exports)
+        if alive:
+            raise BufferError(f"还有 {alive} 个 QImage 指向共享内存，释放后再 close()")
+        for block in self._blocks:
+            block.close()
+            if self._owner:
+                block.unlink()
+        self._blocks = []
@@ -0,0 +1,170 @@
+"""基于 QThreadPool 的任务执行器（QThreadUI2.py 中 BackgroundTask 的推广：一个 QThread 只能跑一个任务）
+
+- submit() 可以提交任意多个任务，按优先级（数值越大越先）排队，同优先级先进先出
+- 同时运行的任务数不超过 max_workers：每个工作 QRunnable 循环从队列取任务，
+  任务之间不需要回到主线程调度，短任务也能把线程占满
+- 任务函数的第一个参数是 TaskHandle：report_progress() 报告进度（自动节流：节流器在第一次
+  报告时才创建，所有任务共用执行器的一个 ProgressFlusher 补发暂存值，不按任务开线程），
+  cancelled 检查取消标记，handle.token.sleep() 可中断地等待；也可以直接 raise TaskCancelled
+- 任务里再提交子任务时传 token=handle.token.child()，取消父任务会连带取消子任务
+- 进度 / 完成 / 失败 / 取消信号由执行器（属于主线程的 QObject）发出，跨线程自动排队到主线程
+
+注意：纯 Python 计算受 GIL 限制，多线程只对会释放 GIL 的任务（numpy、I/O、sleep）有并行效果。
+"""
+import heapq
+import itertools
+import threading
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
+
+from cancel_token import CancelToken, TaskCancelled
+from progress_throttle import ProgressFlusher, ThrottledProgress
+
+
+class _TaskProgressSignal:
+    """把 task_progress(int, int) 包装成 ThrottledProgress 需要的 emit(value)"""
+
+    def __init__(self, signal, task_id):
+        self._signal = signal
+        self._task_id = task_id
+
+    def emit(self, value):
+        self._signal.emit(self._task_id, value)
+
+
+class TaskHandle:
+    """submit() 的返回值，同时作为任务函数的第一个参数"""
+
+    def __init__(self, executor, task_id, priority, fn, args, kwargs, token):
+        self.id = task_id
+        self.priority = priority
+        self.token = token or CancelToken()
+        self._fn, self._args, self._kwargs = fn, args, kwargs
+        self._executor = executor
+        self._progress = None  # 第一次 report_progress() 时创建（只在运行任务的线程里访问）
+
+    @property
+    def cancelled(self):
+        return self.token.cancelled
+
+    def cancel(self):
+        self.token.cancel()
+
+    def report_progress(self, value):
+        if self._progress is None:
+            executor = self._executor
+            self._progress = ThrottledProgress(_TaskProgressSignal(executor.task_progress, self.id),
+                                               max_rate=executor._progress_rate,
+                                               flusher=executor._flusher)
+        self._progress.update(value)
+
+
+class _Worker(QRunnable):
+    """线程池中的一个工作者：循环取任务直到队列为空"""
+
+    def __init__(self, executor):
+        super().__init__()
+        self._executor = executor
+
+    def run(self):
+        executor = self._executor
+        while (handle := executor._next_task()) is not None:
+            executor._execute(handle)
+
+
+class TaskExecutor(QObject):
+    task_progress = Signal(int, int)      # (任务 id, 进度)
+    task_finished = Signal(int, object)   # (任务 id, 返回值)
+    task_failed = Signal(int, str)        # (任务 id, 异常信息)
+    task_cancelled = Signal(int)          # 任务 id（排队中被取消或任务响应了取消）
+    all_finished = Signal()               # 队列清空且没有运行中的任务
+
+    def __init__(self, max_workers=None, progress_rate=30, parent=None):
+        super().__init__(parent)
+        self._max_workers = max_workers or QThread.idealThreadCount()
+        self._progress_rate = progress_rate
+        self._flusher = ProgressFlusher.shared()  # 所有任务的节流器共用一个补发线程
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(self._max_workers)
+        self._lock = threading.Lock()
+        self._queue = []           # (-priority, 序号, TaskHandle)
+        self._counter = itertools.count()
+        self._running = {}         # 任务 id -> 运行中的 TaskHandle
+        self._workers = 0          # 正在运行的 _Worker 数
+        self._pending = 0          # 排队 + 运行中的任务数
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def submit(self, fn, *args, priority=0, token=None, **kwargs):
+        """提交任务 fn(handle, *args, **kwargs)，返回 TaskHandle"""
+        with self._lock:
+            task_id = next(self._counter)
+            handle = TaskHandle(self, task_id, priority, fn, args, kwargs, token)
+            heapq.heappush(self._queue, (-priority, task_id, handle))
+            self._pending += 1
+            start_worker = self._workers < self._max_workers
+            if start_worker:
+                self._workers += 1
+        if start_worker:
+            self._pool.start(_Worker(self))
+        return handle
+
+    def cancel_all(self):
+        """取消所有排队中和运行中的任务"""
+        with self._lock:
+            handles = [handle for _, _, handle in self._queue] + list(self._running.values())
+        for handle in handles:
+            handle.cancel()
+
+    def wait_for_done(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+    def pending_count(self):
+        return self._pending
+
+    # -------------------------- 工作线程中执行 --------------------------
+    def _next_task(self):
+        """取下一个任务；队列为空时该工作者退出。排队中已取消的任务直接跳过"""
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._workers -= 1
+                    return None
+                handle = heapq.heappop(self._queue)[2]
+                if not handle.cancelled:
+                    self._running[handle.id] = handle
+                    return handle
+            handle.token.stopped()
+            self.task_cancelled.emit(handle.id)
+            self._task_done()
+
+    def _execute(self, handle):
+        error = None
+        try:
+            result = handle._fn(handle, *handle._args, **handle._kwargs)
+        except TaskCancelled:
+            handle.cancel()
+        except Exception:
+            error = traceback.format_exc(limit=3)
+        if handle._progress is not None:
+            handle._progress.finish()
+        if error is not None:
+            self.task_failed.emit(handle.id, error)
+        elif handle.cancelled:
+            handle.token.stopped()
+            self.task_cancelled.emit(handle.id)
+        else:
+            self.task_finished.emit(handle.id, result)
+        with self._lock:
+            self._running.pop(handle.id, None)
+        self._task_done()
+
+    def _task_done(self):
+        with self._lock:
+            self._pending -= 1
+            idle = self._pending == 0
+        if idle:
+            self.all_finished.emit()
@@ -0,0 +1,138 @@
+"""常驻后台线程：每次点击不再新建 QThread，请求排队到已经在运行的线程上
+
+QThreadUI.py 原来每次点击都 new 一个 BackgroundWorker（QThread）并依赖 deleteLater 回收：
+连续快速点击时每次都要付出创建线程的开销，self.worker 还会被新线程覆盖（旧线程仍在运行）。
+
+WarmWorker（QThread 子类，只 start 一次）：
+- submit(fn, *args) 把请求放进“最新请求”槽位：尚未开始的旧请求直接被取代（只有最新的会执行），
+  正在运行的旧请求通过 CancelToken 取消（cancel_running=False 时让它跑完）
+- 线程空闲时阻塞在条件变量上，不占 CPU
+- stats 统计：收到的请求、被合并掉的请求、实际运行次数、省下的线程创建次数、排队等待时间
+"""
+import threading
+import time
+
+from PySide6.QtCore import QThread, Signal
+
+from cancel_token import CancelToken, TaskCancelled
+from progress_throttle import ThrottledProgress
+
+
+class WorkerStats:
+    def __init__(self):
+        self.requests = 0            # submit() 次数
+        self.collapsed = 0           # 开始前就被更新的请求取代的请求数
+        self.interrupted = 0         # 运行中被更新的请求取消的请求数
+        self.runs = 0                # 实际开始执行的请求数
+        self.total_wait = 0.0        # 排队等待时间合计（秒）
+        self.max_wait = 0.0
+
+    @property
+    def threads_avoided(self):
+        """按“每次点击新建一个 QThread”的写法，省下的线程创建次数"""
+        return max(self.requests - 1, 0)
+
+    @property
+    def mean_wait(self):
+        return self.total_wait / self.runs if self.runs else 0.0
+
+    def __repr__(self):
+        return (f"WorkerStats(requests={self.requests}, collapsed={self.collapsed}, "
+                f"interrupted={self.interrupted}, runs={self.runs}, "
+                f"threads_avoided={self.threads_avoided}, "
+                f"wait mean={self.mean_wait * 1000:.2f} ms max={self.max_wait * 1000:.2f} ms)")
+
+
+class WorkerRequest:
+    """传给任务函数的第一个参数：token 检查取消，report_progress 报告进度"""
+
+    def __init__(self, request_id, fn, args):
+        self.id = request_id
+        self.fn, self.args = fn, args
+        self.token = CancelToken()
+        self.submitted_at = time.perf_counter()
+        self._progress = None
+
+    def report_progress(self, value):
+        self._progress.update(value)
+
+
+class WarmWorker(QThread):
+    progress_updated = Signal(int)          # 进度信号（0-100）
+    task_finished = Signal(str)             # 完成信号（完成 / 被取代的说明）
+    request_finished = Signal(int, object)  # (请求 id, 任务函数返回值)，被取消的请求不发
+
+    def __init__(self, parent=None, cancel_running=True):
+        super().__init__(parent)
+        self._cancel_running = cancel_running
+        self._condition = threading.Condition()
+        self._pending = None     # 最新的待执行请求（只保留一个）
+        self._current = None     # 正在执行的请求
+        self._stopping = False
+        self._next_id = 0
+        self.stats = WorkerStats()
+
+    def submit(self, fn, *args):
+        """GUI 线程调用：提交 fn(request, *args)，返回请求 id"""
+        with self._condition:
+            self._next_id += 1
+            request = WorkerRequest(self._next_id, fn, args)
+            self.stats.requests += 1
+            if self._pending is not None:
+                self.stats.collapsed += 1
+            self._pending = request
+            if self._cancel_running and self._current is not None \
+                    and not self._current.token.cancelled:
+                self._current.token.cancel()
+                self.stats.interrupted += 1
+            self._condition.notify()
+        if not self.isRunning():
+            self.start()
+        return request.id
+
+    def stop(self, msecs=1000):
+        """取消当前请求并结束线程（窗口关闭时调用）"""
+        with self._condition:
+            self._stopping = True
+            self._pending = None
+            if self._current is not None:
+                self._current.token.cancel()
+            self._condition.notify()
+        return self.wait(msecs)
+
+    def run(self):
+        while (request := self._take()) is not None:
+            request._progress = ThrottledProgress(self.progress_updated)
+            result = error = None
+            try:
+                result = request.fn(request, *request.args)
+            except TaskCancelled:
+                pass
+            except Exception as exc:  # 任务出错不能让常驻线程退出
+                error = exc
+            request._progress.finish()
+            with self._condition:
+                self._current = None
+            if error is not None:
+                self.task_finished.emit(f"任务失败：{error!r}")
+            elif request.token.cancelled:
+                request.token.stopped()
+                self.task_finished.emit(f"请求 #{request.id} 已被新的请求取代")
+            else:
+                self.request_finished.emit(request.id, result)
+                self.task_finished.emit("后台任务执行完成！")
+
+    def _take(self):
+        """等待下一个请求；stop() 后返回 None"""
+        with self._condition:
+            while self._pending is None and not self._stopping:
+                self._condition.wait()
+            if self._stopping:
+                return None
+            request, self._pending = self._pending, None
+            self._current = request
+            wait = time.perf_counter() - request.submitted_at
+            self.stats.runs += 1
+            self.stats.total_wait += wait
+            self.stats.max_wait = max(self.stats.max_wait, wait)
+            return request
@@ -0,0 +1,23 @@
+"""color_codec：整列 hex 解码的快速路径不能把长度不同的 code 拼错
+
+运行：python -m pytest test
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "1_Official_Tutorial", "7TableModel"))
+
+from color_codec import decode_hex_column  # noqa: E402
+
+
+def test_uniform_and_mixed_codes():
+    assert decode_hex_column(["#123456", "#ABCDEF"]).tolist() == [0x123456, 0xABCDEF]
+    assert decode_hex_column(["#123456", "abcdef"]).tolist() == [0x123456, 0xABCDEF]
+
+
+@pytest.mark.parametrize("codes", [["#123456#123456", ""], ["#12345", "#1234567"], ["#12345g"]])
+def test_malformed_codes_raise(codes):
+    with pytest.raises(ValueError):
+        decode_hex_column(codes)
@@ -0,0 +1,70 @@
+"""NameIndex：增量加入节点后的搜索结果与每次按键的耗时
+
+运行：python -m pytest test
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "1_Official_Tutorial", "8TreeModel"))
+
+from name_index import NameIndex  # noqa: E402
+from node_store import NodeStore  # noqa: E402
+
+KEYSTROKE_MS = 10
+QUERIES = ("new_1", "file_9", "_3.t", "zzz")
+
+
+def projects(prefix, first, count, files=9):
+    return [(f"{prefix} {i}", [f"{prefix.lower()}_{i}_{j}.txt" for j in range(files)])
+            for i in range(first, first + count)]
+
+
+def brute_force(store, text, prefix):
+    text = text.lower()
+    return {node for node in range(1, len(store) + 1) if store.is_alive(node)
+            and (store.name(node).lower().startswith(text) if prefix else text in store.name(node).lower())}
+
+
+def keystroke_ms(index, text):
+    """同一次按键查 3 次取最快，排除调度抖动"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        index.search(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def test_incremental_results_match_brute_force():
+    store = NodeStore()
+    store.extend_projects(projects("File", 0, 2_000))
+    index = NameIndex(store, merge_threshold=5_000, tail_threshold=1_000)
+    for batch in range(12):
+        store.extend_projects(projects("New", batch * 300, 300))
+        if batch % 3 == 1:
+            store.remove_children(0, batch, batch + 2)
+            store.rename(20 + batch, f"Ärger_{batch}.TXT")  # 非 ASCII 名称走逐个转小写的路径
+        if batch % 4 == 3:
+            index.wait()
+        for text in QUERIES + ("är", "ÄRGER_1"):
+            for prefix in (False, True):
+                assert set(index.search(text, prefix).nodes.tolist()) == brute_force(store, text, prefix)
+
+
+def test_incremental_keystroke_latency():
+    store = NodeStore()
+    store.extend_projects(projects("File", 0, 20_000))
+    index = NameIndex(store)
+    # 一大批：加入后立即搜索（后台还在建这一批的后缀数组，靠尾部扫描）
+    store.extend_projects(projects("New", 0, 5_000))
+    index.sync()
+    for text in QUERIES:
+        assert keystroke_ms(index, text) < KEYSTROKE_MS, text
+    # 持续少量加入：每批加入时 sync()（模型在 update_projects 里做），之后的每次按键都要够快
+    for batch in range(30):
+        store.extend_projects(projects("More", batch * 200, 200))
+        index.sync()
+        for text in QUERIES:
+            assert keystroke_ms(index, text) < KEYSTROKE_MS, (batch, text)
+        time.sleep(0.02)  # 按键间隔：后台线程趁空闲建索引
@@ -0,0 +1,70 @@
+"""NodeStore：变化日志的裁剪、compact() 之后树内容与名称搜索不变
+
+运行：python -m pytest test
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "1_Official_Tutorial", "8TreeModel"))
+
+from name_index import NameIndex  # noqa: E402
+from node_store import NO_NODE, ROOT, NodeStore  # noqa: E402
+
+
+def tree(store, node=ROOT):
+    """(名称, 类型, 子树) 的嵌套元组，与节点 id 无关"""
+    return tuple((store.name(child), store.type_name(child), tree(store, child))
+                 for child in store.children(node).tolist())
+
+
+def churned_store():
+    store = NodeStore.from_projects({f"Project {i}": [f"file_{i}_{j}.py" for j in range(6)]
+                                     for i in range(300)})
+    index = NameIndex(store, merge_threshold=500, tail_threshold=100)
+    for step in range(20):
+        store.remove_children(ROOT, step, step + 3)
+        project = int(store.children(ROOT)[step])
+        store.rename(int(store.children(project)[1]), f"renamed_{step}.md", "MD")
+        store.insert_children(project, 0, [f"inserted_{step}.txt"], ["TXT"])
+        store.add_node(ROOT, f"Added {step}")
+        index.search("file_1")  # 索引读过的日志随即丢弃
+    return store, index
+
+
+def test_logs_trimmed_after_every_reader_synced():
+    store, index = churned_store()
+    assert not store.removed_log and not store.renamed_log
+    second = store.open_log()
+    gone = store.remove_children(ROOT, 0, 1)
+    renamed_node = int(store.children(ROOT)[0])
+    store.rename(renamed_node, "Renamed project")
+    index.sync()
+    assert store.removed_log and store.renamed_log  # 还有读者没读
+    removed, renamed = store.read_log(second)
+    assert set(gone.tolist()) <= set(removed.tolist()) and len(removed) > len(gone)  # 含子树
+    assert renamed.tolist() == [renamed_node]
+    assert not store.removed_log and not store.renamed_log
+    del second, index
+    store.remove_children(ROOT, 0, 0)
+    assert not store.removed_log  # 没有读者时不记录
+
+
+def test_compact_keeps_tree_and_search():
+    store, index = churned_store()
+    before = tree(store)
+    old_project = int(store.children(ROOT)[5])
+    assert store.garbage() > 0
+    mapping = store.compact()
+    assert tree(store) == before
+    assert store.garbage() == 0 and len(store.names) == len(store)
+    assert store.name(int(mapping[old_project])) == "Project 29"
+    assert (mapping == NO_NODE).sum() > 0
+    for text in ("file_1", "renamed_", "Project 2", "inserted"):
+        expected = {node for node in range(1, len(store) + 1) if text.lower() in store.name(node).lower()}
+        assert set(index.search(text).nodes.tolist()) == expected
+
+
+def test_many_file_types_do_not_wrap():
+    store = NodeStore.from_projects({"Project": [f"file.t{i}" for i in range(40_000)]})
+    project = int(store.children(ROOT)[0])
+    assert store.type_name(store.child(project, 39_999)) == "T39999"
@@ -0,0 +1,38 @@
+"""StreamPlot：y 范围必须满足 low < high，相等 / 反向 / NaN 都抛出 ValueError 且不改变原来的范围
+
+运行：python -m pytest test
+"""
+import math
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "2_Widget_Example"))
+
+import pytest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from plot_widget import StreamPlot  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.parametrize("low, high", [(1.0, 1.0), (1.0, -1.0), (0.0, math.nan)])
+def test_invalid_y_range_is_rejected(app, low, high):
+    plot = StreamPlot(capacity=1000)
+    plot.resize(300, 120)
+    plot.show()
+    app.processEvents()
+    with pytest.raises(ValueError):
+        plot.set_y_range(low, high)
+    assert plot.y_range == (-1.0, 1.0)
+    plot.append([0.5] * 200)
+    plot._flush()  # 原来 low == high 时在这里 ZeroDivisionError
+
+
+def test_invalid_y_range_in_constructor(app):
+    with pytest.raises(ValueError):
+        StreamPlot(y_range=(0.0, 0.0))
@@ -0,0 +1,54 @@
+"""ThrottledProgress：暂存的最后一个值不调用 finish() 也会补发；补发不为每个值创建线程
+
+运行：python -m pytest test
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "2_Widget_Example"))
+
+from progress_throttle import ProgressFlusher, ThrottledProgress  # noqa: E402
+
+
+class Recorder:
+    def __init__(self):
+        self.values = []
+
+    def emit(self, value):
+        self.values.append(value)
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_held_back_value_is_flushed_without_finish():
+    signal = Recorder()
+    progress = ThrottledProgress(signal, max_rate=20)
+    for value in range(1, 1000):
+        progress.update(value)  # 第一个立即发出，其余都在间隔内：只暂存最新值
+    assert signal.values == [1]
+    assert wait_for(lambda: signal.values[-1] == 999)  # 循环“卡住”后由 flusher 补发
+    progress.finish()
+    assert signal.values == [1, 999]
+
+
+def test_no_thread_per_held_back_value(monkeypatch):
+    started = []
+    original = threading.Thread.start
+    monkeypatch.setattr(threading.Thread, "start", lambda self: (started.append(self.name), original(self)))
+    flusher = ProgressFlusher()
+    signals = [Recorder() for _ in range(20)]
+    throttles = [ThrottledProgress(signal, max_rate=200, flusher=flusher) for signal in signals]
+    for round_ in range(10):  # 每轮每个 throttle 都有一个被暂存、之后靠补发送出的值
+        for throttle in throttles:
+            throttle.update(round_ * 2)
+            throttle.update(round_ * 2 + 1)
+        time.sleep(0.01)
+    assert all(wait_for(lambda signal=signal: signal.values[-1] == 19) for signal in signals)
+    assert started == ["ProgressFlusher"]  # 200 次补发只用了一个线程
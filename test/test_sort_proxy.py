@@ -0,0 +1,82 @@
+"""PresortedProxyModel：降序时并列行保持源顺序；源模型删除行后持久索引仍指向原来的行
+
+运行：python -m pytest test
+"""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "1_Official_Tutorial", "7TableModel"))
+
+import pytest  # noqa: E402
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex, Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from color_model import HEX_COLUMN, NAME_COLUMN, ColorColumns, ColorTableModel  # noqa: E402
+from sort_proxy import PresortedProxyModel  # noqa: E402
+
+PAIRS = [(f"{name} {i}", code) for i, (name, code) in
+         enumerate([("red", "#FF0000"), ("Blue", "#0000FF"), ("red", "#FF0000"), ("green", "#00FF00"),
+                    ("blue", "#0000FF"), ("RED", "#FF0000"), ("green", "#00FF00")] * 3)]
+
+
+class RemovableColorModel(ColorTableModel):
+    def remove_rows(self, first, last):
+        pairs = [(self._columns.names[row], f"#{self._columns.rgb_at(row):06X}")
+                 for row in range(len(self._columns)) if not first <= row <= last]
+        self.beginRemoveRows(QModelIndex(), first, last)
+        self._columns = ColorColumns.from_pairs(pairs)
+        self.endRemoveRows()
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def proxy_names(proxy):
+    return [proxy.index(row, NAME_COLUMN).data() for row in range(proxy.rowCount())]
+
+
+def expected_order(pairs, column, order):
+    """Python 的稳定排序：reverse=True 时并列项同样保持原顺序"""
+    key = ((lambda pair: pair[0].casefold()) if column == NAME_COLUMN
+           else (lambda pair: int(pair[1][1:], 16)))
+    return [name for name, _ in sorted(pairs, key=key, reverse=order == Qt.DescendingOrder)]
+
+
+@pytest.mark.parametrize("column", [NAME_COLUMN, HEX_COLUMN])
+@pytest.mark.parametrize("order", [Qt.AscendingOrder, Qt.DescendingOrder])
+def test_ties_keep_source_order(app, column, order):
+    # 名称列只比较颜色名部分：去掉序号后大量并列
+    pairs = [(name.split()[0], code) for name, code in PAIRS]
+    model = ColorTableModel(ColorColumns.from_pairs(pairs[:10]))
+    proxy = PresortedProxyModel()
+    proxy.setSourceModel(model)
+    proxy.sort(column, order)
+    assert proxy_names(proxy) == expected_order(pairs[:10], column, order)
+    model.append_rows([name for name, _ in pairs[10:]],
+                      [int(code[1:], 16) for _, code in pairs[10:]])  # 增量并入
+    assert proxy_names(proxy) == expected_order(pairs, column, order)
+
+
+def test_rows_removed_remaps_persistent_indexes(app):
+    model = RemovableColorModel(ColorColumns.from_pairs(PAIRS))
+    proxy = PresortedProxyModel()
+    proxy.setSourceModel(model)
+    proxy.sort(NAME_COLUMN, Qt.DescendingOrder)
+    kept = [QPersistentModelIndex(proxy.index(row, NAME_COLUMN)) for row in range(proxy.rowCount())]
+    names = [index.data() for index in kept]
+    signals = []
+    proxy.layoutAboutToBeChanged.connect(lambda *args: signals.append("about"))
+    proxy.layoutChanged.connect(lambda *args: signals.append("changed"))
+    model.remove_rows(3, 8)
+    assert signals == ["about", "changed"]
+    removed = {name for name, _ in PAIRS[3:9]}
+    for index, name in zip(kept, names):
+        if name in removed:
+            assert not index.isValid()
+        else:
+            assert index.isValid() and index.data() == name
+            assert proxy.mapToSource(proxy.index(index.row(), NAME_COLUMN)).data() == name
+    assert proxy_names(proxy) == expected_order(PAIRS[:3] + PAIRS[9:], NAME_COLUMN, Qt.DescendingOrder)